@@ -0,0 +1,270 @@
+import argparse
+import csv
+import hashlib
+import json
+import sqlite3
+import time
+from incremental_sync import stable_profile_id
+from result_classifier import ROLE_CATEGORIES, classify_role
+
+INDEXED_FIELDS = ['profile_url', 'name', 'headline', 'location', 'grad_year', 'role', 'role_category', 'experiences']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    profile_id TEXT PRIMARY KEY,
+    profile_url TEXT,
+    name TEXT,
+    headline TEXT,
+    location TEXT,
+    grad_year INTEGER,
+    role TEXT,
+    role_category TEXT,
+    experiences TEXT,
+    content_hash TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS profiles_grad_year ON profiles (grad_year);
+CREATE INDEX IF NOT EXISTS profiles_role ON profiles (role_category, role COLLATE NOCASE);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS profiles_fts USING fts5(
+    name, headline, location, experiences,
+    content='profiles', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS profiles_ai AFTER INSERT ON profiles BEGIN
+    INSERT INTO profiles_fts (rowid, name, headline, location, experiences)
+    VALUES (new.rowid, new.name, new.headline, new.location, new.experiences);
+END;
+CREATE TRIGGER IF NOT EXISTS profiles_ad AFTER DELETE ON profiles BEGIN
+    INSERT INTO profiles_fts (profiles_fts, rowid, name, headline, location, experiences)
+    VALUES ('delete', old.rowid, old.name, old.headline, old.location, old.experiences);
+END;
+CREATE TRIGGER IF NOT EXISTS profiles_au AFTER UPDATE ON profiles BEGIN
+    INSERT INTO profiles_fts (profiles_fts, rowid, name, headline, location, experiences)
+    VALUES ('delete', old.rowid, old.name, old.headline, old.location, old.experiences);
+    INSERT INTO profiles_fts (rowid, name, headline, location, experiences)
+    VALUES (new.rowid, new.name, new.headline, new.location, new.experiences);
+END;
+"""
+
+# Blank incoming fields never overwrite what another source already filled in
+UPSERT = """
+INSERT INTO profiles (profile_id, profile_url, name, headline, location, grad_year, role, role_category,
+                      experiences, content_hash, updated_at)
+VALUES (:profile_id, :profile_url, :name, :headline, :location, :grad_year, :role, :role_category,
+        :experiences, :content_hash, :updated_at)
+ON CONFLICT (profile_id) DO UPDATE SET
+    profile_url = COALESCE(NULLIF(excluded.profile_url, ''), profile_url),
+    name = COALESCE(NULLIF(excluded.name, ''), name),
+    headline = COALESCE(NULLIF(excluded.headline, ''), headline),
+    location = COALESCE(NULLIF(excluded.location, ''), location),
+    grad_year = COALESCE(excluded.grad_year, grad_year),
+    role = COALESCE(excluded.role, role),
+    role_category = COALESCE(excluded.role_category, role_category),
+    experiences = COALESCE(NULLIF(excluded.experiences, ''), experiences),
+    content_hash = excluded.content_hash,
+    updated_at = excluded.updated_at
+WHERE excluded.content_hash != profiles.content_hash
+"""
+
+
+def fts_terms(text):
+    """Quote every word so user input can never be read as FTS5 query syntax"""
+    return ' '.join('"{}"'.format(word.replace('"', '""')) for word in text.split())
+
+
+def index_row(profile):
+    """Row for the profiles table from any of the extractor outputs
+
+    Accepts profiles from the extractors as well as rows read back from
+    their CSVs: experiences may be a list or a '; '-joined string and
+    grad_year an int or a string.
+    """
+    experiences = profile.get('experiences') or []
+    if isinstance(experiences, str):
+        experiences = [line for line in experiences.split('; ') if line]
+
+    grad_year = profile.get('grad_year')
+    try:
+        grad_year = int(grad_year) if grad_year not in (None, '') else None
+    except (TypeError, ValueError):
+        grad_year = None
+
+    headline = (profile.get('headline') or '').strip()
+    role_category, role = classify_role(headline)
+    if role is None:
+        role_category, role = classify_role(' '.join(experiences[:3]))
+
+    row = {
+        'profile_id': stable_profile_id(profile),
+        'profile_url': (profile.get('profile_url') or '').strip(),
+        'name': (profile.get('name') or '').strip(),
+        'headline': headline,
+        'location': (profile.get('location') or '').strip(),
+        'grad_year': grad_year,
+        'role': role,
+        'role_category': role_category,
+        'experiences': '\n'.join(experiences)
+    }
+    row['content_hash'] = hashlib.sha1(
+        json.dumps([row[field] for field in INDEXED_FIELDS], ensure_ascii=False).encode('utf-8')
+    ).hexdigest()
+    return row
+
+
+class AlumniIndex:
+    """Local SQLite index of extracted profiles with full-text search
+
+    Profiles are keyed by stable_profile_id, so the same person coming from
+    the search extractor and from the experience scraper ends up in one row.
+    Name, headline, location and experiences are kept in an FTS5 index that
+    triggers update together with the row, and grad_year and role have
+    ordinary indexes for the filters.
+    """
+
+    def __init__(self, path='alumni_index.db'):
+        self.path = path
+        # Writers may run in a worker thread (e.g. the pipeline sink), one at a time
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def upsert(self, profiles):
+        """Add or update profiles, returns how many rows actually changed"""
+        now = time.time()
+        changed = 0
+        with self.db:
+            for profile in profiles:
+                if not profile:
+                    continue
+                row = index_row(profile)
+                row['updated_at'] = now
+                changed += self.db.execute(UPSERT, row).rowcount
+        return changed
+
+    def search(self, text=None, grad_year=None, min_grad_year=None, max_grad_year=None,
+               location=None, role=None, limit=50):
+        """Profiles matching all the given filters
+
+        Full-text queries return the best matches first. Filter-only queries
+        return rows in the order they were indexed, which lets SQLite stop
+        after limit rows instead of sorting every match.
+
+        role is either a category from result_classifier.ROLE_CATEGORIES
+        ('professor', 'academic_staff', 'student', 'professional') or a role
+        keyword such as 'Engineer'.
+        """
+        match = []
+        if text:
+            match.append(fts_terms(text))
+        if location:
+            match.append(f"location : ({fts_terms(location)})")
+
+        clauses = []
+        params = []
+        if match:
+            sql = "SELECT p.* FROM profiles_fts f JOIN profiles p ON p.rowid = f.rowid"
+            clauses.append("profiles_fts MATCH ?")
+            params.append(' AND '.join(match))
+        else:
+            sql = "SELECT p.* FROM profiles p"
+        if grad_year is not None:
+            clauses.append("p.grad_year = ?")
+            params.append(int(grad_year))
+        if min_grad_year is not None:
+            clauses.append("p.grad_year >= ?")
+            params.append(int(min_grad_year))
+        if max_grad_year is not None:
+            clauses.append("p.grad_year <= ?")
+            params.append(int(max_grad_year))
+        if role:
+            if role.lower() in ROLE_CATEGORIES:
+                clauses.append("p.role_category = ?")
+                params.append(role.lower())
+            else:
+                # 'Engineers' finds 'Engineer', no role keyword itself ends in s
+                clauses.append("p.role = ? COLLATE NOCASE")
+                params.append(role[:-1] if role.lower().endswith('s') else role)
+
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if text:
+            sql += " ORDER BY f.rank"
+        sql += " LIMIT ?"
+        params.append(int(limit))
+
+        rows = self.db.execute(sql, params).fetchall()
+        return [self._profile(row) for row in rows]
+
+    @staticmethod
+    def _profile(row):
+        profile = {field: row[field] for field in INDEXED_FIELDS}
+        profile['experiences'] = row['experiences'].split('\n') if row['experiences'] else []
+        return profile
+
+    def count(self):
+        return self.db.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def report(self):
+        print(f"🔎 Alumni index {self.path}: {self.count()} profiles")
+
+
+def index_csv(index, path):
+    """Feed one of the extractor CSVs into the index, returns how many rows changed"""
+    with open(path, newline='', encoding='utf-8') as csvfile:
+        return index.upsert(csv.DictReader(csvfile))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the local CIT alumni index")
+    parser.add_argument('--db', default='alumni_index.db')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help="index extractor CSV outputs")
+    build.add_argument('csv_files', nargs='+')
+
+    search = commands.add_parser('search', help="query the index")
+    search.add_argument('text', nargs='?', help="full-text query over name, headline, location and experiences")
+    search.add_argument('--grad-year', type=int)
+    search.add_argument('--min-grad-year', type=int)
+    search.add_argument('--max-grad-year', type=int)
+    search.add_argument('--location')
+    search.add_argument('--role', help=f"role keyword or one of: {', '.join(ROLE_CATEGORIES)}")
+    search.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    index = AlumniIndex(args.db)
+    try:
+        if args.command == 'build':
+            for path in args.csv_files:
+                try:
+                    changed = index_csv(index, path)
+                    print(f"✅ {path}: {changed} profiles added or updated")
+                except Exception as e:
+                    print(f"❌ Could not index {path}: {e}")
+            index.report()
+            return
+
+        started = time.perf_counter()
+        results = index.search(
+            args.text, grad_year=args.grad_year, min_grad_year=args.min_grad_year,
+            max_grad_year=args.max_grad_year, location=args.location, role=args.role, limit=args.limit
+        )
+        elapsed = (time.perf_counter() - started) * 1000
+        for i, profile in enumerate(results, 1):
+            print(f"  {i}. {profile['name'] or 'N/A'} ({profile['grad_year'] or '?'}) - {profile['role'] or 'N/A'}")
+            print(f"     {profile['headline'] or ''} | {profile['location'] or ''}")
+            if profile['profile_url']:
+                print(f"     {profile['profile_url']}")
+        print(f"🔎 {len(results)} profiles in {elapsed:.1f} ms")
+    finally:
+        index.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Build time and query latency of the local alumni index
+
+Indexes synthetic profiles (in batches, the way a long run feeds it) and
+times a few typical alumni queries, including a re-delivery of unchanged
+profiles that should cost almost nothing.
+
+Run from the repository root:
+    python -m benchmarks.bench_alumni_index --profiles 100000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from alumni_index import AlumniIndex
+
+FIRST = ['Arjun', 'Madhu', 'Priya', 'Karthik', 'Sneha', 'Rahul', 'Divya', 'Vishnu', 'Meena', 'Sanjay']
+LAST = ['Kumar', 'Shree', 'Raj', 'S', 'M', 'Lakshmi', 'Ram', 'Bose', 'Anbu', 'T']
+HEADLINES = [
+    'Software Engineer at Zoho', 'Student at Chennai Institute of Technology', 'Data Analyst | CIT alumni',
+    'Assistant Professor, Chennai Institute of Technology', 'Product Manager at Freshworks', 'Developer'
+]
+LOCATIONS = ['Chennai, Tamil Nadu, India', 'Coimbatore, Tamil Nadu, India', 'Bengaluru, Karnataka, India', 'Hyderabad']
+EXPERIENCES = ['Intern at TCS', 'Engineer at Infosys', 'Analyst at Deloitte', 'Teaching Assistant at CIT', 'Developer at Google']
+
+QUERIES = [
+    ('role=Engineers location=Coimbatore', {'location': 'Coimbatore', 'role': 'Engineers'}),
+    ('grad_year=2022 role=student', {'grad_year': 2022, 'role': 'student'}),
+    ('text="zoho" min_grad_year=2020', {'text': 'zoho', 'min_grad_year': 2020}),
+    ('text="infosys intern"', {'text': 'infosys intern'}),
+    ('location=Chennai', {'location': 'Chennai'})
+]
+
+
+def make_profiles(count, seed):
+    rng = random.Random(seed)
+    return [{
+        'name': f"{rng.choice(FIRST)} {rng.choice(LAST)} {index}",
+        'profile_url': f"https://www.linkedin.com/in/alumnus-{index}/",
+        'headline': rng.choice(HEADLINES),
+        'location': rng.choice(LOCATIONS),
+        'grad_year': rng.randint(2012, 2026),
+        'experiences': rng.sample(EXPERIENCES, rng.randint(0, 3))
+    } for index in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--profiles', type=int, default=100000)
+    parser.add_argument('--batch', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    profiles = make_profiles(args.profiles, seed=11)
+    with tempfile.TemporaryDirectory() as directory:
+        index = AlumniIndex(os.path.join(directory, 'alumni_index.db'))
+
+        started = time.perf_counter()
+        for start in range(0, len(profiles), args.batch):
+            index.upsert(profiles[start:start + args.batch])
+        build = time.perf_counter() - started
+        print(f"📊 Indexed {index.count()} profiles in {build:.1f}s ({args.profiles / build:.0f}/s)")
+
+        started = time.perf_counter()
+        changed = index.upsert(profiles[:args.batch])
+        print(f"♻️ Re-delivered {args.batch} unchanged profiles: {changed} rewritten in "
+              f"{(time.perf_counter() - started) * 1000:.1f} ms")
+
+        print(f"{'query':<38}{'hits':>6}{'ms':>8}")
+        for label, query in QUERIES:
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                results = index.search(limit=50, **query)
+            elapsed = (time.perf_counter() - started) / args.repeat
+            print(f"{label:<38}{len(results):>6}{elapsed * 1000:>8.2f}")
+        index.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+"""Time to a logged-in browser: cold start with a login vs warm start from a saved session
+
+A local stub plays the LinkedIn login: /login serves the username/password
+form and answers the POST, after --login-delay seconds, with an li_at
+cookie; /feed/ only renders with that cookie. Each run opens --size
+sessions through BrowserSessionPool in a scratch directory: the first run
+has to log in, the second reuses the browser profiles, the third starts
+fresh profiles and only restores the saved cookies. Needs Chrome.
+
+Run from the repository root:
+    python -m benchmarks.bench_browser_sessions --size 2 --login-delay 2
+"""
+import argparse
+import secrets
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from browser_sessions import BrowserSessionPool
+
+LOGIN_PAGE = (
+    b"<html><body><form method='post' action='/login'>"
+    b"<input id='username' name='session_key'><input id='password' name='session_password' type='password'>"
+    b"<button type='submit'>Sign in</button></form></body></html>"
+)
+FEED_PAGE = b"<html><body><div class='feed-identity-module'>Feed</div></body></html>"
+
+
+class LoginStub:
+    """Login form that hands out an li_at session cookie, and a feed that requires it"""
+
+    def __init__(self, login_delay=2.0):
+        self.login_delay = login_delay
+        self.tokens = set()
+        self.logins = 0
+        self.lock = threading.Lock()
+        self.server = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stub._get(self)
+
+            def do_POST(self):
+                stub._post(self)
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+    def _send(self, handler, status, body=b'', headers=()):
+        handler.send_response(status)
+        for name, value in headers:
+            handler.send_header(name, value)
+        handler.send_header('Content-Type', 'text/html; charset=utf-8')
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _get(self, handler):
+        if handler.path.startswith('/feed'):
+            cookies = dict(
+                part.strip().split('=', 1) for part in (handler.headers.get('Cookie') or '').split(';') if '=' in part
+            )
+            if cookies.get('li_at') in self.tokens:
+                self._send(handler, 200, FEED_PAGE)
+            else:
+                self._send(handler, 302, headers=[('Location', '/login')])
+            return
+        self._send(handler, 200, LOGIN_PAGE)
+
+    def _post(self, handler):
+        handler.rfile.read(int(handler.headers.get('Content-Length') or 0))
+        time.sleep(self.login_delay)
+        token = secrets.token_hex(16)
+        with self.lock:
+            self.tokens.add(token)
+            self.logins += 1
+        self._send(handler, 302, headers=[
+            ('Set-Cookie', f"li_at={token}; Max-Age=86400; Path=/; HttpOnly"),
+            ('Location', '/feed/')
+        ])
+
+
+def make_driver(profile_dir):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    if profile_dir:
+        options.add_argument(f'--user-data-dir={profile_dir}')
+    return webdriver.Chrome(options=options)
+
+
+def stub_login(stub):
+    def login(driver):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        driver.get(f"{stub.url}/login")
+        driver.find_element(By.ID, 'username').send_keys('user@example.com')
+        driver.find_element(By.ID, 'password').send_keys('password')
+        driver.find_element(By.XPATH, "//button[@type='submit']").click()
+        WebDriverWait(driver, 30).until(lambda driver: '/feed' in driver.current_url)
+    return login
+
+
+def timed_run(stub, directory, size, persistent_profiles):
+    """Seconds until every session is logged in, the logins it took, and whether all reached the feed"""
+    logins = stub.logins
+    sessions = BrowserSessionPool(
+        make_driver, login=stub_login(stub), size=size, directory=directory,
+        cookie_domain='127.0.0.1', persistent_profiles=persistent_profiles
+    )
+    started = time.perf_counter()
+    sessions.start()
+    elapsed = time.perf_counter() - started
+    on_feed = 0
+    for _ in range(size):
+        with sessions.borrow() as driver:
+            driver.get(f"{stub.url}/feed/")
+            on_feed += '/feed' in driver.current_url
+    sessions.close()
+    return elapsed, stub.logins - logins, on_feed == size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=2)
+    parser.add_argument('--login-delay', type=float, default=2.0)
+    args = parser.parse_args()
+
+    try:
+        make_driver(None).quit()
+    except Exception as e:
+        print(f"⚠️ Chrome unavailable, skipping: {e}")
+        return
+
+    stub = LoginStub(args.login_delay).start()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            print(f"{'run':<28}{'seconds':>9}{'logins':>8}{'on feed':>9}")
+            runs = [('cold (login)', True), ('warm (browser profiles)', True), ('warm (saved cookies)', False)]
+            timings = []
+            for label, persistent_profiles in runs:
+                elapsed, logins, on_feed = timed_run(stub, directory, args.size, persistent_profiles)
+                timings.append(elapsed)
+                print(f"{label:<28}{elapsed:>9.2f}{logins:>8}{str(on_feed):>9}")
+            print(f"📊 Warm start {timings[0] / min(timings[1:]):.1f}x faster than a cold start with login")
+    finally:
+        stub.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""Per-row inserts vs SupabaseBulkWriter against a local PostgREST stub
+
+Run from the repository root:
+    python -m benchmarks.bench_bulk_writer --rows 2000 --latency 0.005
+"""
+import argparse
+import time
+import uuid
+
+from postgrest import SyncPostgrestClient
+
+from bulk_writer import SupabaseBulkWriter
+from benchmarks.postgrest_stub import PostgrestStub
+
+TABLE = 'alumni'
+
+
+def make_rows(count, reject_every=0):
+    rows = []
+    for i in range(count):
+        name = f"Alumni {i}"
+        if reject_every and i % reject_every == reject_every - 1:
+            name += PostgrestStub.REJECT_MARKER
+        row = {
+            'profile_id': str(uuid.uuid4()),
+            'name': name,
+            'profile_url': f"https://www.linkedin.com/in/alumni-{i}/",
+            'about': 'Student at Chennai Institute of Technology'
+        }
+        if i % 3:
+            row['location'] = 'Chennai, Tamil Nadu, India'
+        rows.append(row)
+    return rows
+
+
+def per_row_loop(client, rows):
+    """The original save loop: one insert round trip per profile"""
+    saved = 0
+    for row in rows:
+        try:
+            result = client.table(TABLE).insert(row).execute()
+            if result.data:
+                saved += 1
+        except Exception:
+            continue
+    return saved
+
+
+def run(label, stub, write):
+    stub.tables.clear()
+    stub.request_count = 0
+    started = time.perf_counter()
+    saved = write()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {saved:>7} rows {stub.request_count:>6} requests "
+          f"{elapsed:>8.2f}s {saved / elapsed:>10.0f} rows/sec")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--latency', type=float, default=0.005, help='simulated round trip per request (s)')
+    parser.add_argument('--reject-every', type=int, default=0, help='make every Nth row fail server-side')
+    args = parser.parse_args()
+
+    stub = PostgrestStub(latency=args.latency).start()
+    client = SyncPostgrestClient(stub.url)
+    rows = make_rows(args.rows, args.reject_every)
+
+    try:
+        print(f"📊 {args.rows} rows, {args.latency * 1000:.1f} ms simulated latency")
+        run('per-row insert', stub, lambda: per_row_loop(client, rows))
+        for batch_size in (50, 200, 500, 1000):
+            writer = SupabaseBulkWriter(client, TABLE, batch_size=batch_size, on_conflict='profile_id')
+            run(f"bulk upsert (batch {batch_size})", stub, lambda: writer.upsert_rows(rows))
+            if writer.failed_rows:
+                print(f"   ⚠️ {len(writer.failed_rows)} rows failed and were isolated by chunk splitting")
+    finally:
+        client.session.close()
+        stub.stop()
+
+
+if __name__ == '__main__':
+    main()
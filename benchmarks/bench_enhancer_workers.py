@@ -0,0 +1,53 @@
+"""Enrichment throughput of ProfileURLEnhancer with 1, 2, 4 and 8 worker processes
+
+Runs iter_targeted_search_urls over --rows synthetic rows for each worker
+count and checks that every run yields exactly the single-process output,
+in the same order. Speedup is bounded by the cores available; the count
+is printed with the results.
+
+Run from the repository root:
+    python -m benchmarks.bench_enhancer_workers --rows 400000 --chunk-size 2000
+"""
+import argparse
+import os
+import time
+
+from profile_url_enhancer import ProfileURLEnhancer
+from benchmarks.bench_profile_url_enhancer import HEADLINES, LOCATIONS
+
+
+def make_rows(count):
+    return [{
+        'title': f"{HEADLINES[i % len(HEADLINES)]} {i}",
+        'location': LOCATIONS[i % len(LOCATIONS)]
+    } for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=400000)
+    parser.add_argument('--chunk-size', type=int, default=2000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    enhancer = ProfileURLEnhancer()
+    enhancer.verbose = False
+    enhancer.chunk_size = args.chunk_size
+
+    print(f"🖥️ {os.cpu_count()} CPUs, {args.rows} rows, chunks of {args.chunk_size}")
+    print(f"{'workers':>8}{'seconds':>10}{'rows/s':>10}{'speedup':>9}  same output")
+    baseline_seconds, baseline_output = None, None
+    for workers in args.workers:
+        enhancer.workers = workers
+        started = time.perf_counter()
+        output = list(enhancer.iter_targeted_search_urls(rows))
+        elapsed = time.perf_counter() - started
+        if baseline_output is None:
+            baseline_seconds, baseline_output = elapsed, output
+        print(f"{workers:>8}{elapsed:>10.2f}{args.rows / elapsed:>10.0f}{baseline_seconds / elapsed:>8.1f}x"
+              f"  {output == baseline_output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+"""Wall time, CPU, memory and connections per page for each fetch backend on local fixture pages
+
+The fixture server serves the profile, search and Google fixtures with
+--latency seconds per response and keeps connections alive. Every backend
+fetches the same --pages URLs in turn: the pooled httpx client (keep-alive,
+HTTP/2 only over TLS so plain HTTP/1.1 here), urllib opening a new
+connection per page as a no-reuse baseline, and headless Chrome through
+BrowserSessionPool when Chrome can start. CPU and memory include the
+browser and driver processes. A routed Fetcher then goes over the same
+pages plus the JavaScript-rendered infinite scroll fixture, whose raw HTML
+lacks the result markers, to show the fallback.
+
+Run from the repository root:
+    python -m benchmarks.bench_fetch_layer --pages 200 --latency 0.01
+"""
+import argparse
+import os
+import resource
+import tempfile
+import time
+import urllib.request
+
+from fetch_layer import BrowserBackend, Fetcher, HttpBackend, Route, http_available
+from benchmarks.fixture_server import FixtureServer
+
+PROFILE_SLUGS = ['arjun-s-s-189840279', 'madhushree-t-211389200', 'priya-raman-a1b2c3', 'rio-m-6665672b6']
+SEARCH_MARKER = 'class="entity-result'
+
+
+class UrllibBackend:
+    """One new connection per page, like a client without a pool"""
+
+    name = 'urllib'
+
+    def fetch(self, url, wait_for=None):
+        with urllib.request.urlopen(url, timeout=15) as response:
+            return response.read().decode('utf-8')
+
+    def close(self):
+        pass
+
+
+def fixture_urls(server, count):
+    pages = [server.profile_url(slug) for slug in PROFILE_SLUGS]
+    pages += [f"{server.url}/search_results_page.html", f"{server.url}/google_results_page.html"]
+    return [pages[i % len(pages)] for i in range(count)]
+
+
+def descendants(pid):
+    """Stat fields of every process below pid (Linux /proc), e.g. Chrome and chromedriver"""
+    stats = {}
+    for entry in os.listdir('/proc'):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    stats[int(entry)] = f.read().rsplit(')', 1)[1].split()
+            except OSError:
+                pass
+    children, found = {pid}, []
+    while True:
+        new = [p for p, fields in stats.items() if int(fields[1]) in children and p not in children]
+        if not new:
+            return found
+        children.update(new)
+        found += [stats[p] for p in new]
+
+
+def process_tree_usage():
+    """CPU seconds and resident MB of this process and its descendants"""
+    if not os.path.isdir('/proc'):
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_utime + usage.ru_stime, 0.0
+    ticks, page_size = os.sysconf('SC_CLK_TCK'), os.sysconf('SC_PAGE_SIZE')
+    tree = [open(f"/proc/{os.getpid()}/stat").read().rsplit(')', 1)[1].split()] + descendants(os.getpid())
+    cpu = sum(int(fields[11]) + int(fields[12]) for fields in tree) / ticks
+    rss = sum(int(fields[21]) for fields in tree) * page_size / 1024 / 1024
+    return cpu, rss
+
+
+def browser_backend(directory):
+    from browser_sessions import BrowserSessionPool
+    from profile_worker_pool import make_headless_chrome
+
+    sessions = BrowserSessionPool(lambda profile_dir: make_headless_chrome(profile_dir=profile_dir),
+                                  login=None, size=1, directory=directory)
+    sessions.start()
+    if not sessions.drivers:
+        return None, sessions
+    return BrowserBackend(sessions), sessions
+
+
+def measure(name, backend, urls, server):
+    fetcher = Fetcher({name: backend}, default=name)
+    fetcher.fetch(urls[0])
+    connections, empty = server.connection_count, fetcher.stats[name].failures
+    cpu_before, _ = process_tree_usage()
+    started = time.perf_counter()
+    for url in urls:
+        fetcher.fetch(url)
+    elapsed = time.perf_counter() - started
+    cpu_after, rss = process_tree_usage()
+    return {
+        'backend': name,
+        'seconds': elapsed,
+        'ms_per_page': elapsed / len(urls) * 1000,
+        'cpu_ms_per_page': (cpu_after - cpu_before) / len(urls) * 1000,
+        'rss_mb': rss,
+        'connections': server.connection_count - connections,
+        'empty': fetcher.stats[name].failures - empty
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.01)
+    parser.add_argument('--backends', nargs='+', default=['http', 'urllib', 'browser'],
+                        choices=['http', 'urllib', 'browser'])
+    args = parser.parse_args()
+
+    server = FixtureServer(latency=args.latency).start()
+    directory = tempfile.mkdtemp()
+    backends, sessions = {}, None
+    try:
+        urls = fixture_urls(server, args.pages)
+        if 'http' in args.backends:
+            if http_available():
+                backends['http'] = HttpBackend()
+            else:
+                print("⚠️ httpx is not installed, skipping the http backend")
+        if 'urllib' in args.backends:
+            backends['urllib'] = UrllibBackend()
+        if 'browser' in args.backends:
+            try:
+                browser, sessions = browser_backend(directory)
+            except Exception as e:
+                browser = None
+                print(f"⚠️ Chrome could not start: {e}")
+            if browser is not None:
+                backends['browser'] = browser
+            else:
+                print("⚠️ Skipping the browser backend")
+
+        results = [measure(name, backend, urls, server) for name, backend in backends.items()]
+        print(f"{'backend':<9}{'seconds':>9}{'ms/page':>9}{'CPU ms/page':>13}{'RSS MB':>8}{'connections':>13}{'empty':>7}")
+        for result in results:
+            print(f"{result['backend']:<9}{result['seconds']:>9.2f}{result['ms_per_page']:>9.1f}"
+                  f"{result['cpu_ms_per_page']:>13.2f}{result['rss_mb']:>8.0f}{result['connections']:>13}{result['empty']:>7}")
+
+        if 'http' in backends:
+            fallback = 'browser' if 'browser' in backends else 'urllib'
+            if fallback not in backends:
+                backends['urllib'] = UrllibBackend()
+            print(f"\nRouted fetch, falling back to {fallback}:")
+            fetcher = Fetcher(backends, [
+                Route(r'google_results', 'http', markers=['linkedin.com/in/'], fallback=fallback),
+                Route(r'/in/', 'http', markers=['id="experience"'], fallback=fallback, wait_for='profile_h1'),
+                Route(r'search_results|infinite_scroll', 'http', markers=[SEARCH_MARKER], fallback=fallback,
+                      wait_for='search_results')
+            ], default='http')
+            routed = urls + [f"{server.url}/infinite_scroll.html"] * 5
+            for url in routed:
+                fetcher.fetch(url)
+            fetcher.report()
+            if fallback == 'urllib':
+                print("   (without Chrome the fallback gets the same raw HTML, so the markers still miss)")
+    finally:
+        for backend in backends.values():
+            backend.close()
+        if sessions is not None:
+            sessions.close()
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Full replace vs incremental sync write volume against a local PostgREST stub
+
+Run from the repository root:
+    python -m benchmarks.bench_incremental_sync --rows 5000 --churn 0.02
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from postgrest import SyncPostgrestClient
+
+from incremental_sync import IncrementalSync, stable_profile_id
+from benchmarks.postgrest_stub import PostgrestStub
+
+TABLE = 'alumni'
+
+
+def make_profiles(count, start=0):
+    return [{
+        'name': f"Alumni {i}",
+        'headline': 'Student at Chennai Institute of Technology',
+        'profile_url': f"https://www.linkedin.com/in/alumni-{i}/",
+        'location': 'Chennai, Tamil Nadu, India'
+    } for i in range(start, start + count)]
+
+
+def to_rows(profiles):
+    return [{
+        'profile_id': stable_profile_id(profile),
+        'name': profile['name'],
+        'profile_url': profile['profile_url'],
+        'location': profile['location'],
+        'about': profile['headline']
+    } for profile in profiles]
+
+
+def churn(profiles, fraction, rng):
+    """Change, drop and add roughly fraction of the profiles each"""
+    count = max(1, int(len(profiles) * fraction))
+    profiles = [dict(profile) for profile in profiles]
+    for profile in rng.sample(profiles, count):
+        profile['headline'] = 'Engineer | Chennai Institute of Technology alumni'
+    dropped = set(id(profile) for profile in rng.sample(profiles, count))
+    profiles = [profile for profile in profiles if id(profile) not in dropped]
+    return profiles + make_profiles(count, start=10 ** 6)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--churn', type=float, default=0.02)
+    parser.add_argument('--latency', type=float, default=0.005)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    stub = PostgrestStub(latency=args.latency).start()
+    client = SyncPostgrestClient(stub.url)
+    state_path = os.path.join(tempfile.mkdtemp(), 'sync_state.json')
+    first_run = make_profiles(args.rows)
+    second_run = churn(first_run, args.churn, rng)
+
+    try:
+        for mode in ('replace', 'incremental'):
+            stub.tables.clear()
+            if os.path.exists(state_path):
+                os.remove(state_path)
+            sync = IncrementalSync(client, TABLE, state_path=state_path)
+            sync.replace(to_rows(first_run))
+
+            stub.request_count = 0
+            started = time.perf_counter()
+            if mode == 'replace':
+                written = sync.replace(to_rows(second_run))
+            else:
+                written = sync.sync(to_rows(second_run))
+            elapsed = time.perf_counter() - started
+            print(f"📊 {mode:<12} rows written {written:>7}  requests {stub.request_count:>5}  "
+                  f"{elapsed:>6.2f}s  table size {len(stub.rows(TABLE))}")
+    finally:
+        client.session.close()
+        stub.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""CSV vs typed Parquet for the boisexperience export: file size and load time
+
+Writes the same synthetic alumni rows as CSV (the way new.py does) and as
+Parquet through ParquetSink, then loads both back into typed rows: the CSV
+needs grad_year converted and experiences split again, Parquet does not.
+
+Run from the repository root (needs pyarrow):
+    python -m benchmarks.bench_parquet_export --rows 200000
+"""
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+
+import pyarrow.parquet as pq
+
+from csv_sink import StreamingCSVWriter
+from parquet_export import EXPERIENCE_SCHEMA, ParquetSink
+
+ROLES = ['Software Engineer', 'Data Analyst', 'Intern', 'Assistant Professor', 'Product Manager', 'Developer']
+COMPANIES = ['Zoho', 'TCS', 'Freshworks', 'Infosys', 'Chennai Institute of Technology', 'Google']
+
+
+def make_rows(count, seed):
+    rng = random.Random(seed)
+    for index in range(count):
+        experiences = [
+            f"{rng.choice(ROLES)} at {rng.choice(COMPANIES)} · {rng.randint(1, 36)} mos"
+            for _ in range(rng.randint(0, 5))
+        ]
+        yield {'name': f"Alumnus {index}", 'grad_year': rng.randint(2015, 2024), 'experiences': experiences}
+
+
+def load_csv(path):
+    rows = []
+    with open(path, newline='', encoding='utf-8') as csvfile:
+        for row in csv.DictReader(csvfile):
+            row['grad_year'] = int(row['grad_year'])
+            row['experiences'] = row['experiences'].split('; ') if row['experiences'] else []
+            rows.append(row)
+    return rows
+
+
+def timed(function):
+    started = time.perf_counter()
+    output = function()
+    return time.perf_counter() - started, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--row-group-size', type=int, default=50000)
+    parser.add_argument('--seed', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'boisexperience.csv')
+        parquet_path = os.path.join(directory, 'boisexperience.parquet')
+
+        def write_csv():
+            with StreamingCSVWriter(csv_path, ['name', 'grad_year', 'experiences'], lineterminator=os.linesep) as sink:
+                for row in make_rows(args.rows, args.seed):
+                    sink.write(dict(row, experiences='; '.join(row['experiences'])))
+
+        def write_parquet():
+            with ParquetSink(parquet_path, EXPERIENCE_SCHEMA, row_group_size=args.row_group_size) as sink:
+                sink.write_many(make_rows(args.rows, args.seed))
+            return sink.row_groups
+
+        csv_write, _ = timed(write_csv)
+        parquet_write, row_groups = timed(write_parquet)
+        csv_load, csv_rows = timed(lambda: load_csv(csv_path))
+        table_load, table = timed(lambda: pq.read_table(parquet_path))
+        rows_load, parquet_rows = timed(lambda: pq.read_table(parquet_path).to_pylist())
+        column_load, _ = timed(lambda: pq.read_table(parquet_path, columns=['grad_year']))
+
+        print(f"📊 {args.rows} rows, Parquet in {row_groups} row groups")
+        print(f"{'format':<22}{'MB':>8}{'write s':>9}{'load s':>9}")
+        print(f"{'csv + parse':<22}{os.path.getsize(csv_path) / 1e6:>8.2f}{csv_write:>9.2f}{csv_load:>9.2f}")
+        print(f"{'parquet (arrow table)':<22}{os.path.getsize(parquet_path) / 1e6:>8.2f}{parquet_write:>9.2f}{table_load:>9.2f}")
+        print(f"{'parquet (row dicts)':<22}{'':>8}{'':>9}{rows_load:>9.2f}")
+        print(f"{'parquet (grad_year)':<22}{'':>8}{'':>9}{column_load:>9.2f}")
+        if csv_rows != parquet_rows:
+            print("⚠️ Loaded rows differ between CSV and Parquet")
+
+
+if __name__ == '__main__':
+    main()
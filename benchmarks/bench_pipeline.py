@@ -0,0 +1,142 @@
+"""Sequential search loop vs ExtractionPipeline, fully offline
+
+Search result pages come from the fixture server (with a simulated page
+load time) and profiles are upserted into the PostgREST stub (with a
+simulated round trip), so the run needs no browser, login or Supabase
+project. Every query gets --pages distinct result pages, built from the
+fixture card markup with page-specific profile slugs; the same pages are
+shared by all queries, so dedup has cross-query duplicates to remove.
+
+Run from the repository root:
+    python -m benchmarks.bench_pipeline --queries 5 --pages 4 --page-latency 0.3 --db-latency 0.05
+"""
+import argparse
+import re
+import time
+import urllib.parse
+import urllib.request
+
+from postgrest import SyncPostgrestClient
+
+from bulk_writer import SupabaseBulkWriter
+from extraction_pipeline import ExtractionPipeline, profile_key
+from incremental_sync import stable_profile_id
+from search_result_parser import page_card_keys, parse_search_results, search_profile
+from benchmarks.fixture_server import FixtureServer
+from benchmarks.postgrest_stub import PostgrestStub
+
+QUERIES = [
+    "Chennai Institute of Technology student",
+    "Chennai Institute of Technology professor",
+    "Chennai Institute of Technology alumni",
+    "CIT Chennai",
+    "Chennai Institute Technology faculty",
+    "CIT Chennai alumni engineer",
+    "Chennai Institute of Technology graduate",
+    "CIT Chennai developer"
+]
+
+SLUG_PATTERN = re.compile(r'/in/([A-Za-z0-9-]+)')
+
+EMPTY_PAGE = "<html><body><div class='search-results-container'></div></body></html>"
+
+
+def make_fetcher(server, pages):
+    """fetch_page(query, page) against the fixture server, like DirectProfileExtractor.fetch_search_page"""
+    def fetch_page(query, page):
+        url = f"{server.url}/search_results_page.html?keywords={urllib.parse.quote(query)}&page={page}"
+        with urllib.request.urlopen(url) as response:
+            page_source = response.read().decode('utf-8')
+        if page > pages:
+            return EMPTY_PAGE
+        return SLUG_PATTERN.sub(lambda match: f"/in/{match.group(1)}-p{page}", page_source)
+    return fetch_page
+
+
+def make_sink(client):
+    writer = SupabaseBulkWriter(client, 'profiles')
+
+    def sink(profiles):
+        writer.upsert_rows([{
+            'profile_id': stable_profile_id(profile),
+            'name': profile.get('name', profile.get('headline', 'Unknown'))[:100],
+            'profile_url': profile.get('profile_url', '')[:500],
+            'about': profile.get('headline', '')[:200]
+        } for profile in profiles])
+    return sink
+
+
+def run_sequential(fetch_page, sink, queries):
+    """The run_direct_extraction shape: one page at a time, writes after each page"""
+    seen = set()
+    saved = []
+    for query in queries:
+        page = 1
+        previous_cards = None
+        while True:
+            search_results = parse_search_results(fetch_page(query, page))
+            page_cards = page_card_keys(search_results)
+            if not search_results or page_cards == previous_cards:
+                break
+            previous_cards = page_cards
+            new = []
+            for result in search_results:
+                profile = search_profile(result)
+                if profile is None or profile_key(profile) in seen:
+                    continue
+                seen.add(profile_key(profile))
+                new.append(profile)
+            if new:
+                sink(new)
+                saved.extend(new)
+            page += 1
+    return saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--queries', type=int, default=5)
+    parser.add_argument('--pages', type=int, default=4, help='result pages per query before it runs out')
+    parser.add_argument('--page-latency', type=float, default=0.3)
+    parser.add_argument('--db-latency', type=float, default=0.05)
+    parser.add_argument('--fetch-concurrency', type=int, default=3)
+    parser.add_argument('--parse-concurrency', type=int, default=2)
+    parser.add_argument('--query-concurrency', type=int, default=3)
+    args = parser.parse_args()
+
+    queries = QUERIES[:args.queries]
+    server = FixtureServer(latency=args.page_latency).start()
+    try:
+        fetch_page = make_fetcher(server, args.pages)
+
+        stub = PostgrestStub(latency=args.db_latency).start()
+        started = time.monotonic()
+        sequential = run_sequential(fetch_page, make_sink(SyncPostgrestClient(stub.url)), queries)
+        sequential_time = time.monotonic() - started
+        print(f"🐢 Sequential: {len(sequential)} profiles, {len(stub.rows('profiles'))} rows, "
+              f"{stub.request_count} DB requests in {sequential_time:.2f}s")
+
+        stub = PostgrestStub(latency=args.db_latency).start()
+        pipeline = ExtractionPipeline(
+            fetch_page,
+            sink=make_sink(SyncPostgrestClient(stub.url)),
+            queries=queries,
+            query_concurrency=args.query_concurrency,
+            fetch_concurrency=args.fetch_concurrency,
+            parse_concurrency=args.parse_concurrency
+        )
+        started = time.monotonic()
+        pipelined = pipeline.run()
+        pipeline_time = time.monotonic() - started
+        print(f"⚡ Pipeline: {len(pipelined)} profiles, {len(stub.rows('profiles'))} rows, "
+              f"{stub.request_count} DB requests in {pipeline_time:.2f}s ({sequential_time / pipeline_time:.1f}x)")
+        pipeline.report()
+
+        if sorted(map(profile_key, sequential)) != sorted(map(profile_key, pipelined)):
+            print("⚠️ The two runs saved different profiles")
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""Fuzzy profile de-duplication on synthetic data: speed, precision and recall
+
+Generates distinct people, then re-emits some of them the way a second
+search query would: URL variants (no trailing slash, query string, locale
+subdomain, upper case), initials or extra spaces in the name, reworded
+headlines, or no URL at all. Reports the time of ProfileDeduplicator on
+the whole set and of a naive pairwise comparison on a sample, plus pair
+precision and recall against the known identities.
+
+Run from the repository root:
+    python -m benchmarks.bench_profile_dedup --profiles 100000
+"""
+import argparse
+import random
+import time
+
+from profile_dedup import ProfileDeduplicator
+
+FIRST = ['Arjun', 'Madhu', 'Priya', 'Karthik', 'Sneha', 'Rahul', 'Divya', 'Vishnu', 'Meena', 'Sanjay',
+         'Lakshmi', 'Naveen', 'Yamini', 'Dheeksha', 'Saravanan', 'Sachithra', 'Rio', 'Subash', 'Pooja', 'Ram']
+# Surnames built from syllables so the name space grows like a real one
+LAST = [prefix + suffix for prefix in ['Ram', 'Kri', 'Sun', 'Ven', 'Mur', 'Sel', 'Gop', 'Lak', 'Pan', 'Bal',
+                                       'Sar', 'Ana', 'Ses', 'Raj', 'Nat', 'Siv', 'Kan', 'Dha', 'Mad', 'Vij']
+        for suffix in ['esh', 'ishnan', 'daram', 'katesan', 'ugan', 'vam', 'al', 'shmanan', 'dian', 'aji',
+                       'avanan', 'nd', 'hadri', 'kumar', 'arajan', 'akumar', 'nan', 'yalan', 'han', 'ayan']]
+ROLES = ['Student', 'Software Engineer', 'Data Analyst', 'Assistant Professor', 'Developer', 'Product Manager']
+ORGS = ['Chennai Institute of Technology', 'Zoho', 'TCS', 'Freshworks', 'Infosys', 'CIT Chennai', 'Google']
+LOCATIONS = ['Chennai, Tamil Nadu, India', 'Coimbatore, Tamil Nadu, India', 'Bengaluru, Karnataka, India']
+
+
+def make_person(rng, index):
+    first, last = rng.choice(FIRST), rng.choice(LAST)
+    return {
+        'name': f"{first} {last}",
+        'profile_url': f"https://www.linkedin.com/in/{first.lower()}-{last.lower()}-{index}/",
+        'headline': f"{rng.choice(ROLES)} at {rng.choice(ORGS)} | {rng.choice(ROLES)} {rng.choice(['2021', '2022', '2023', 'Batch', 'Alumni'])}",
+        'location': rng.choice(LOCATIONS)
+    }
+
+
+def variant(rng, person):
+    profile = dict(person)
+    url = person['profile_url']
+    change = rng.randrange(6)
+    if change == 0:
+        profile['profile_url'] = url.rstrip('/')
+    elif change == 1:
+        profile['profile_url'] = url + '?miniProfileUrn=urn%3Ali%3Afs&trk=people-search'
+    elif change == 2:
+        profile['profile_url'] = url.replace('www.', 'in.')
+    elif change == 3:
+        profile['profile_url'] = url.upper().replace('HTTPS://', 'https://')
+    elif change == 4:
+        profile['profile_url'] = ''
+        first, last = person['name'].split()
+        profile['name'] = rng.choice([f"{first} {last[0]}", f"  {first}  {last} ", f"{last} {first}"])
+    else:
+        profile['profile_url'] = ''
+        profile['headline'] = person['headline'].replace(' at ', ' @ ').replace('|', '-') + ' · Open to work'
+    if rng.random() < 0.3:
+        profile['location'] = ''
+    return profile
+
+
+def make_profiles(count, duplicate_rate, seed):
+    rng = random.Random(seed)
+    people = int(count / (1 + duplicate_rate))
+    profiles, identities = [], []
+    for index in range(people):
+        profiles.append(make_person(rng, index))
+        identities.append(index)
+    while len(profiles) < count:
+        index = rng.randrange(people)
+        profiles.append(variant(rng, profiles[index]))
+        identities.append(index)
+    order = list(range(len(profiles)))
+    rng.shuffle(order)
+    return [profiles[i] for i in order], [identities[i] for i in order]
+
+
+def pair_scores(clusters, identities):
+    """Precision and recall over same-person pairs"""
+    predicted = set()
+    for members in clusters:
+        for i in range(len(members)):
+            for j in range(i + 1, len(members)):
+                predicted.add((members[i], members[j]))
+    by_identity = {}
+    for index, identity in enumerate(identities):
+        by_identity.setdefault(identity, []).append(index)
+    actual = set()
+    for members in by_identity.values():
+        for i in range(len(members)):
+            for j in range(i + 1, len(members)):
+                actual.add((members[i], members[j]))
+    true_positive = len(predicted & actual)
+    return true_positive / (len(predicted) or 1), true_positive / (len(actual) or 1)
+
+
+def naive_pairwise(profiles, engine):
+    features = [engine._features(profile) for profile in profiles]
+    matches = 0
+    for i in range(len(features)):
+        for j in range(i + 1, len(features)):
+            matches += engine._same_person(features[i], features[j])
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--profiles', type=int, default=100000)
+    parser.add_argument('--duplicate-rate', type=float, default=0.25)
+    parser.add_argument('--naive-sample', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=5)
+    args = parser.parse_args()
+
+    profiles, identities = make_profiles(args.profiles, args.duplicate_rate, args.seed)
+
+    engine = ProfileDeduplicator()
+    started = time.perf_counter()
+    clusters = engine.clusters(profiles)
+    cluster_time = time.perf_counter() - started
+    started = time.perf_counter()
+    merged = [engine.merge([profiles[index] for index in members]) for members in clusters]
+    merge_time = time.perf_counter() - started
+    precision, recall = pair_scores(clusters, identities)
+
+    print(f"📊 {len(profiles)} profiles, {len(set(identities))} people, {len(merged)} after dedup")
+    print(f"   clustering {cluster_time:.2f}s, merge {merge_time:.2f}s, {engine.candidate_pairs} candidate pairs verified")
+    print(f"   pair precision {precision:.3f}, recall {recall:.3f}")
+
+    sample = profiles[:args.naive_sample]
+    started = time.perf_counter()
+    naive_pairwise(sample, ProfileDeduplicator())
+    naive_time = time.perf_counter() - started
+    scale = (len(profiles) / len(sample)) ** 2
+    print(f"🐢 Naive pairwise on {len(sample)}: {naive_time:.2f}s, ~{naive_time * scale / 60:.0f} min projected for {len(profiles)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""Per-profile CPU time and driver bytes: page_source + BeautifulSoup vs one execute_script / lxml
+
+The fixture profiles are a few KB, real profile pages are far larger, so
+every page is padded with --pad-kb of unrelated cards (feed, "people also
+viewed") before it is measured. The offline half compares the old
+BeautifulSoup extraction with the lxml one on the snapshots and the bytes
+of page_source with the bytes of the JSON PROFILE_SCRIPT returns. The live
+half (needs Chrome) serves the pages locally and times both browser paths.
+
+Run from the repository root:
+    python -m benchmarks.bench_profile_page --repeat 50 --pad-kb 500
+"""
+import argparse
+import json
+import re
+import time
+
+from profile_page import (
+    CIT_SCHOOL, EXPERIENCE_SECTION_CLASS, extract_profile_from_html, profile_data_from_html, read_profile_data
+)
+from benchmarks.fixture_server import FIXTURES, FixtureServer
+
+FILLER_CARD = (
+    "<section class='artdeco-card pv-profile-card mt2'><div class='pvs-header__container'>"
+    "<h2><span aria-hidden='true'>People also viewed</span></h2></div><ul class='pvs-list'>"
+    "<li class='artdeco-list__item'><div class='display-flex'><span class='t-bold'>"
+    "<span aria-hidden='true'>Someone Else {index}</span></span><span class='t-14 t-normal'>"
+    "<span aria-hidden='true'>Engineer at Somewhere · 2nd</span></span>"
+    "<button class='artdeco-button' aria-label='Connect'><span>Connect</span></button></div></li></ul></section>"
+)
+
+
+def padded(page_source, pad_kb):
+    filler = []
+    size = 0
+    while size < pad_kb * 1024:
+        card = FILLER_CARD.format(index=len(filler))
+        filler.append(card)
+        size += len(card)
+    return page_source.replace('</main>', '</main>' + ''.join(filler))
+
+
+def soup_extract(page_source, profile_url, max_grad_year=2025):
+    """The BeautifulSoup extraction profile_page used before, with regex years over every CIT li"""
+    from bs4 import BeautifulSoup
+
+    profile = {'profile_url': profile_url, 'name': "N/A", 'grad_year': None, 'experiences': [], 'eligible': False}
+    soup = BeautifulSoup(page_source, "lxml")
+    name_elem = soup.find('h1')
+    if name_elem:
+        profile['name'] = name_elem.get_text(strip=True)
+    for li in soup.find_all('li'):
+        years = re.findall(r'\d{4}', li.get_text(' ', strip=True)) if CIT_SCHOOL in li.get_text() else []
+        if years:
+            profile['grad_year'] = int(years[-1])
+            if profile['grad_year'] < max_grad_year:
+                profile['eligible'] = True
+                break
+    if not profile['eligible']:
+        return profile
+    for section in soup.find_all('section', class_=EXPERIENCE_SECTION_CLASS):
+        if section.find('div', id='experience'):
+            lines = [line for line in section.get_text(separator='\n', strip=True).split('\n') if line.strip()]
+            profile['experiences'] = lines[1:] if lines and 'Experience' in lines[0] else lines
+    return profile
+
+
+def soup_live(browser, profile_url):
+    """The old live path: element lookups, then page_source into BeautifulSoup"""
+    from selenium.webdriver.common.by import By
+
+    browser.find_element(By.TAG_NAME, 'h1').text
+    [li.text for li in browser.find_elements(By.XPATH, f"//li[contains(., '{CIT_SCHOOL}')]")]
+    page_source = browser.page_source
+    return soup_extract(page_source, profile_url), len(page_source.encode('utf-8'))
+
+
+def script_live(browser, profile_url):
+    data = read_profile_data(browser)
+    return data, len(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+
+
+def cpu_per_call(function, repeat):
+    started = time.process_time()
+    for _ in range(repeat):
+        output = function()
+    return (time.process_time() - started) / repeat, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--pad-kb', type=int, default=500)
+    args = parser.parse_args()
+
+    pages = {
+        page.stem: padded(page.read_text(encoding='utf-8'), args.pad_kb)
+        for page in sorted((FIXTURES / 'profiles').glob('*.html'))
+    }
+
+    print(f"{'profile':<28}{'bs4 ms':>9}{'lxml ms':>9}{'page_source B':>15}{'JSON B':>8}")
+    totals = [0.0, 0.0, 0, 0]
+    for slug, page_source in pages.items():
+        lxml_cpu, lxml_profile = cpu_per_call(lambda: extract_profile_from_html(page_source, slug), args.repeat)
+        try:
+            soup_cpu, soup_profile = cpu_per_call(lambda: soup_extract(page_source, slug), args.repeat)
+        except ImportError:
+            soup_cpu, soup_profile = float('nan'), lxml_profile
+        if soup_profile != {key: lxml_profile[key] for key in soup_profile}:
+            print(f"⚠️ {slug}: the two extractions differ")
+        source_bytes = len(page_source.encode('utf-8'))
+        json_bytes = len(json.dumps(profile_data_from_html(page_source), ensure_ascii=False).encode('utf-8'))
+        totals = [totals[0] + soup_cpu, totals[1] + lxml_cpu, totals[2] + source_bytes, totals[3] + json_bytes]
+        print(f"{slug:<28}{soup_cpu * 1000:>9.2f}{lxml_cpu * 1000:>9.2f}{source_bytes:>15}{json_bytes:>8}")
+    print(f"📊 CPU {totals[0] / totals[1]:.1f}x less with lxml, {totals[2] / totals[3]:.0f}x fewer bytes from the driver")
+
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
+        options = Options()
+        options.add_argument('--headless=new')
+        options.add_argument('--no-sandbox')
+        browser = webdriver.Chrome(options=options)
+    except Exception as e:
+        print(f"⚠️ Chrome unavailable, skipping live comparison: {e}")
+        return
+
+    server = FixtureServer().start()
+    try:
+        print(f"{'live path':<22}{'ms/profile':>11}{'cpu ms':>8}{'bytes':>10}")
+        for label, function in (('page_source + bs4', soup_live), ('execute_script JSON', script_live)):
+            wall, cpu, transferred = 0.0, 0.0, 0
+            for slug in pages:
+                browser.get(server.profile_url(slug))
+                # Pad the live DOM the same way as the snapshots
+                browser.execute_script("document.querySelector('main').insertAdjacentHTML('afterend', arguments[0])",
+                                       pages[slug].split('</main>', 1)[1].rsplit('</body>', 1)[0])
+                started, started_cpu = time.perf_counter(), time.process_time()
+                for _ in range(args.repeat):
+                    _, size = function(browser, slug)
+                wall += (time.perf_counter() - started) / args.repeat
+                cpu += (time.process_time() - started_cpu) / args.repeat
+                transferred += size
+            count = len(pages)
+            print(f"{label:<22}{wall / count * 1000:>11.1f}{cpu / count * 1000:>8.2f}{transferred // count:>10}")
+    finally:
+        browser.quit()
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
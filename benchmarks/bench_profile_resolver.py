@@ -0,0 +1,103 @@
+"""Accuracy, page count and wall time of the automated profile resolver on local fixture search pages
+
+Enhanced profiles are made the way the enhancer makes them, from titles of
+people on fixtures/search_results_page.html (the answer is known) plus
+decoys who are not on it. The fixture server answers every LinkedIn search
+URL with that page and every Google search URL with
+fixtures/google_results_page.html, after --latency seconds. The resolver
+runs at each --concurrency, with a shared --rpm rate budget if given, and
+the matches are checked against the known URLs.
+
+Run from the repository root:
+    python -m benchmarks.bench_profile_resolver --latency 0.2 --concurrency 1 2 4
+"""
+import argparse
+import time
+import urllib.parse
+import urllib.request
+
+from incremental_sync import canonical_profile_url
+from profile_resolver import ProfileResolver
+from profile_url_enhancer import ProfileURLEnhancer, enhance_profile
+from benchmarks.fixture_server import FixtureServer
+
+# (title as in the manual CSV, location, profile URL on the fixture page or None)
+PEOPLE = [
+    ('Arjun S S - Student at Chennai Institute of Technology', 'Chennai, Tamil Nadu, India',
+     'https://www.linkedin.com/in/arjun-s-s-189840279/'),
+    ('Madhushree T | Assistant Professor at Chennai Institute of Technology', 'Coimbatore, Tamil Nadu, India',
+     'https://www.linkedin.com/in/madhushree-t-211389200/'),
+    ('Vishnu Ram M - Data Analyst | Chennai Institute of Technology alumni', '',
+     'https://www.linkedin.com/in/vishnu-ram-m-23395218b/'),
+    ('Yamini Anbu - Graduate of Chennai Institute Technology', 'Chennai, Tamil Nadu, India',
+     'https://www.linkedin.com/in/yamini-anbu-158562199/'),
+    ('Dheeksha Gopika - Associate Professor at Chennai Institute of Technology', '',
+     'https://www.linkedin.com/in/dheeksha-gopika/'),
+    ('Lakshmi Pooja E - Developer at Chennai Institute of Technology', 'Coimbatore, Tamil Nadu, India',
+     'https://www.linkedin.com/in/lakshmipooja-e-3055141bb/'),
+    ('Saravanan K - Faculty, Chennai Institute of Technology', '',
+     'https://www.linkedin.com/in/saravanan18302/'),
+    ('Rio M - Student at Chennai Institute of Technology', 'India',
+     'https://www.linkedin.com/in/rio-m-6665672b6/'),
+    ('Karthik Subramanian - Engineer', 'Chennai, Tamil Nadu, India',
+     'https://www.linkedin.com/in/karthik-subramanian-9988/'),
+    # Not on the fixture page
+    ('Meenakshi Sundaram - Professor at Chennai Institute of Technology', '', None),
+    ('Harish Kumar - Student at Chennai Institute of Technology', 'Chennai, Tamil Nadu, India', None),
+    ('Student at Chennai Institute of Technology', '', None)
+]
+
+
+def enhanced_profiles(repeat):
+    enhancer = ProfileURLEnhancer()
+    profiles = []
+    for _ in range(repeat):
+        for title, location, profile_url in PEOPLE:
+            profile = enhancer.enhanced_row(enhance_profile({'title': title, 'location': location}))
+            profiles.append((profile, profile_url))
+    return profiles
+
+
+def fixture_fetcher(server):
+    def fetch_page(url):
+        google = 'google.' in urllib.parse.urlsplit(url).netloc
+        page = 'google_results_page.html' if google else 'search_results_page.html'
+        with urllib.request.urlopen(f"{server.url}/{page}") as response:
+            return response.read().decode('utf-8')
+    return fetch_page
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--latency', type=float, default=0.2)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--rpm', type=float, default=None, help="shared requests-per-minute budget")
+    parser.add_argument('--repeat', type=int, default=2)
+    args = parser.parse_args()
+
+    server = FixtureServer(latency=args.latency).start()
+    try:
+        profiles = enhanced_profiles(args.repeat)
+        print(f"{'threads':>8}{'seconds':>9}{'pages':>7}{'right':>7}{'wrong':>7}{'review':>8}{'unresolved':>12}")
+        for concurrency in args.concurrency:
+            resolver = ProfileResolver(fixture_fetcher(server), concurrency=concurrency, requests_per_minute=args.rpm)
+            right = wrong = 0
+            started = time.perf_counter()
+            for outcome, (_, expected) in zip(resolver.resolve(profile for profile, _ in profiles), profiles):
+                if outcome['status'] == 'matched':
+                    if canonical_profile_url(outcome['match']['profile_url']) == canonical_profile_url(expected or ''):
+                        right += 1
+                    else:
+                        wrong += 1
+                        print(f"⚠️ {outcome['profile']['headline']}: matched {outcome['match']['profile_url']}")
+            elapsed = time.perf_counter() - started
+            print(f"{concurrency:>8}{elapsed:>9.2f}{resolver.pages_fetched:>7}{right:>7}{wrong:>7}"
+                  f"{resolver.counts['review']:>8}{resolver.counts['unresolved']:>12}")
+        known = sum(1 for _, expected in profiles if expected)
+        print(f"📊 {known} of {len(profiles)} profiles are on the fixture page")
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""Time and peak memory of ProfileURLEnhancer: load-everything-then-write vs streaming to every output
+
+A synthetic cit_alumni_manual.csv of --rows rows is generated, then each
+implementation runs in its own process so its peak RSS can be compared:
+the old one reads the whole CSV into a list, builds the enhanced list,
+writes the CSV, concatenates the HTML guide into one string and syncs a
+list of rows; the new run_enhancement streams each row to the CSV, HTML
+and database sinks. With --database both also sync to a local PostgREST
+stub. Peak RSS is read with resource (Linux/macOS only).
+
+Run from the repository root:
+    python -m benchmarks.bench_profile_url_enhancer --rows 1000000
+"""
+import argparse
+import csv
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+HEADLINES = [
+    'John Smith - Software Engineer at Chennai Institute of Technology',
+    'Priya R | Assistant Professor, CIT Chennai',
+    'Student at Chennai Institute of Technology',
+    'Karthik S - Data Analyst - Chennai Institute of Technology alumni'
+]
+LOCATIONS = ['Chennai, Tamil Nadu, India', 'Bengaluru, Karnataka, India', '']
+
+
+def write_input(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=['title', 'location'])
+        writer.writeheader()
+        for i in range(rows):
+            writer.writerow({
+                'title': f"{HEADLINES[i % len(HEADLINES)]} {i}",
+                'location': LOCATIONS[i % len(LOCATIONS)]
+            })
+
+
+def legacy_run(enhancer):
+    """The pre-streaming run_enhancement: every stage finishes on the whole list before the next"""
+    from profile_url_enhancer import (
+        ENHANCED_CSV, ENHANCED_FIELDNAMES, GUIDE_FOOTER, GUIDE_HEADER, GUIDE_LINK, GUIDE_PROFILE,
+        GUIDE_PROFILE_END, INPUT_CSV, SEARCH_GUIDE
+    )
+    from incremental_sync import IncrementalSync
+
+    with open(INPUT_CSV, 'r', encoding='utf-8') as csvfile:
+        existing_data = list(csv.DictReader(csvfile))
+    enhanced_profiles = enhancer.generate_targeted_search_urls(existing_data)
+
+    with open(ENHANCED_CSV, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=ENHANCED_FIELDNAMES)
+        writer.writeheader()
+        for profile in enhanced_profiles:
+            writer.writerow(enhancer.enhanced_row(profile))
+
+    html_content = GUIDE_HEADER
+    for i, profile in enumerate(enhanced_profiles):
+        name = profile.get('name', 'Unknown')
+        headline = profile.get('headline', 'No headline')
+        html_content += GUIDE_PROFILE.format(
+            number=i + 1, title=name if name else headline,
+            headline=headline, location=profile.get('location', 'No location')
+        )
+        for search in profile.get('search_urls', []):
+            html_content += GUIDE_LINK.format(url=search['url'], description=search['description'])
+        html_content += GUIDE_PROFILE_END
+    html_content += GUIDE_FOOTER
+    with open(SEARCH_GUIDE, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+
+    if enhancer.supabase:
+        rows = [enhancer.placeholder_row(profile) for profile in enhanced_profiles]
+        IncrementalSync(enhancer.supabase, 'alumni', state_path='legacy_state.json').sync(rows)
+    return len(enhanced_profiles)
+
+
+def child(mode, database_url):
+    import contextlib
+    import parameters
+    from profile_url_enhancer import ProfileURLEnhancer
+
+    parameters.SUPABASE_TABLE = 'alumni'
+    parameters.EXPORT_PARQUET = False
+    enhancer = ProfileURLEnhancer()
+    enhancer.verbose = False
+    enhancer.setup_supabase = lambda: True
+    if database_url:
+        from postgrest import SyncPostgrestClient
+        enhancer.supabase = SyncPostgrestClient(database_url)
+
+    started = time.perf_counter()
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        count = legacy_run(enhancer) if mode == 'legacy' else enhancer.run_enhancement()
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak //= 1024
+    print(json.dumps({'count': count, 'seconds': elapsed, 'peak_mb': peak / 1024}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--database', action='store_true', help="also sync to a local PostgREST stub")
+    parser.add_argument('--child', choices=['legacy', 'streaming'], help=argparse.SUPPRESS)
+    parser.add_argument('--database-url', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.database_url)
+        return
+
+    repository = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [repository, os.environ.get('PYTHONPATH')])))
+    stub = None
+    if args.database:
+        from benchmarks.postgrest_stub import PostgrestStub
+        stub = PostgrestStub().start()
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            write_input(os.path.join(directory, 'cit_alumni_manual.csv'), args.rows)
+            print(f"{'implementation':<16}{'profiles':>10}{'seconds':>10}{'peak MB':>10}{'guide MB':>10}")
+            results = {}
+            for mode in ('legacy', 'streaming'):
+                command = [sys.executable, '-m', 'benchmarks.bench_profile_url_enhancer', '--child', mode]
+                if stub:
+                    stub.tables.clear()
+                    command += ['--database-url', stub.url]
+                output = subprocess.run(command, cwd=directory, env=environment, capture_output=True, text=True)
+                if output.returncode:
+                    # A negative code is a signal, e.g. -9 when the kernel killed it for running out of memory
+                    print(f"{mode:<16}failed with exit code {output.returncode} {output.stderr.strip()[-300:]}")
+                    continue
+                results[mode] = json.loads(output.stdout.strip().splitlines()[-1])
+                guide_mb = os.path.getsize(os.path.join(directory, 'manual_linkedin_search_guide.html')) / 2 ** 20
+                result = results[mode]
+                print(f"{mode:<16}{result['count']:>10}{result['seconds']:>10.1f}{result['peak_mb']:>10.0f}{guide_mb:>10.0f}")
+            if len(results) < 2:
+                return
+            legacy, streaming = results['legacy'], results['streaming']
+            print(f"📊 Streaming: {legacy['peak_mb'] / streaming['peak_mb']:.1f}x less peak memory, "
+                  f"{legacy['seconds'] / streaming['seconds']:.1f}x the speed")
+    finally:
+        if stub:
+            stub.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Pages/minute of ProfileWorkerPool as the number of browser sessions grows
+
+Serves the fixture profile pages from a local HTTP server and runs the
+pool with 1, 2, 4... headless Chrome workers. Needs Chrome.
+
+Run from the repository root:
+    python -m benchmarks.bench_profile_worker_pool --pages 40 --workers 1 2 4
+"""
+import argparse
+
+from page_waits import default_waiter
+from profile_worker_pool import ProfileWorkerPool
+from benchmarks.fixture_server import FIXTURES, FixtureServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=40)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--latency', type=float, default=0.5, help='simulated server time per page (s)')
+    parser.add_argument('--requests-per-minute', type=float, default=None)
+    args = parser.parse_args()
+
+    server = FixtureServer(latency=args.latency).start()
+    slugs = sorted(page.stem for page in (FIXTURES / 'profiles').glob('*.html'))
+    urls = [f"{server.profile_url(slugs[i % len(slugs)])}?run={i}" for i in range(args.pages)]
+
+    try:
+        baseline = None
+        print(f"{'workers':>8}{'pages':>8}{'seconds':>10}{'pages/min':>12}{'speedup':>9}")
+        for workers in args.workers:
+            pool = ProfileWorkerPool(
+                workers=workers,
+                requests_per_minute=args.requests_per_minute
+            )
+            results = pool.run(urls)
+            extracted = [result for result in results if result]
+            if [result['profile_url'] for result in extracted] != [url for url in urls if url][:len(extracted)]:
+                print("⚠️ results are not in input order")
+            baseline = baseline or pool.pages_per_minute or 1
+            print(f"{workers:>8}{pool.pages_fetched:>8}{pool.elapsed:>10.1f}"
+                  f"{pool.pages_per_minute:>12.1f}{pool.pages_per_minute / baseline:>8.2f}x")
+        default_waiter.report()
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""Per-line keyword scans vs the precompiled result classifier
+
+Classifies a synthetic batch of search result snippets and profile titles
+with the original code and with result_classifier, checks both give the
+same fields and prints the time per item.
+
+Run from the repository root:
+    python -m benchmarks.bench_result_classifier --results 20000
+"""
+import argparse
+import random
+import re
+import time
+
+from result_classifier import (
+    CIT_KEYWORDS, HEADLINE_KEYWORDS, NAME_SKIP_KEYWORDS, LOCATION_KEYWORDS,
+    default_classifier, extract_name_from_title, extract_role_keywords
+)
+
+NAMES = ['Arjun Kumar', 'Madhu Shree', 'Priya R', 'LinkedIn Member', 'Rio Thomas', 'Karthik S']
+HEADLINES = [
+    'Student at Chennai Institute of Technology',
+    'Assistant Professor - CIT Chennai',
+    'Software Engineer | Chennai Institute Technology alumni',
+    'Data Analyst at Zoho',
+    'Attended Chennai Institute of Technology'
+]
+OTHER_LINES = [
+    'Chennai, Tamil Nadu, India', 'Coimbatore, Tamil Nadu', 'Bengaluru, Karnataka',
+    '500+ connections', '12 mutual connections', 'Message', 'Connect', 'View profile',
+    'Current: Developer at Freshworks', 'Past: Intern at TCS'
+]
+TITLES = [
+    'Dr. Ravi Kumar - Professor - Chennai Institute of Technology',
+    'Meena Lakshmi | Student at CIT Chennai',
+    'Dean of Academics - Chennai Institute of Technology',
+    'Sanjay R - Software Engineer & Alumni of CIT',
+    'Graduated from Chennai Institute of Technology in 2022',
+    'Priya Dharshini Senthil Kumar Principal'
+]
+
+
+def legacy_classify(lines):
+    """The original any()-per-line scans from search_result_parser"""
+    text = '\n'.join(lines).lower()
+    profile = {'cit_related': any(keyword in text for keyword in CIT_KEYWORDS)}
+    for line in lines:
+        if any(keyword in line.lower() for keyword in HEADLINE_KEYWORDS):
+            profile['headline'] = line
+            break
+    for line in lines:
+        if (line != "LinkedIn Member" and
+            line != profile.get('headline', '') and
+            not any(keyword in line.lower() for keyword in NAME_SKIP_KEYWORDS)):
+            profile['name'] = line
+            break
+    for line in lines:
+        if any(loc in line.lower() for loc in LOCATION_KEYWORDS):
+            if line != profile.get('headline', '') and line != profile.get('name', ''):
+                profile['location'] = line
+                break
+    return profile
+
+
+def legacy_name(title):
+    """The original four re.sub passes from ProfileURLEnhancer"""
+    cleaned = re.sub(r'\b(at|of|the|in|and|&)\b', ' ', title, flags=re.IGNORECASE)
+    cleaned = re.sub(r'\b(Chennai Institute of Technology|CIT|Chennai|Technology|Institute)\b', ' ', cleaned, flags=re.IGNORECASE)
+    cleaned = re.sub(r'\b(Professor|Assistant|Associate|Student|Principal|Faculty|Director|Dean)\b', ' ', cleaned, flags=re.IGNORECASE)
+    cleaned = re.sub(r'\b(Attended|Studying|Graduated|Alumni)\b', ' ', cleaned, flags=re.IGNORECASE)
+    name_words = [
+        word for word in cleaned.split()
+        if len(word) > 1 and word.isalpha() and word[0].isupper() and word.lower() not in ['the', 'and', 'or', 'at', 'in', 'of']
+    ]
+    if 2 <= len(name_words) <= 4:
+        return ' '.join(name_words)
+    return None
+
+
+def legacy_role(title):
+    role_patterns = [
+        r'\b(Assistant Professor|Associate Professor|Professor)\b',
+        r'\b(Principal|Director|Dean|Faculty|Lecturer)\b',
+        r'\b(Student|Graduate|Alumni|Scholar)\b',
+        r'\b(Engineer|Developer|Analyst|Manager)\b'
+    ]
+    for pattern in role_patterns:
+        match = re.search(pattern, title, re.IGNORECASE)
+        if match:
+            return match.group(1)
+    return None
+
+
+def make_batch(count, seed):
+    rng = random.Random(seed)
+    batch = []
+    for _ in range(count):
+        lines = [rng.choice(NAMES), rng.choice(HEADLINES)] + rng.sample(OTHER_LINES, rng.randint(1, 5))
+        rng.shuffle(lines)
+        batch.append(lines)
+    titles = [rng.choice(TITLES) + rng.choice(['', ' | LinkedIn', ' - India']) for _ in range(count)]
+    return batch, titles
+
+
+def timed(function):
+    started = time.perf_counter()
+    output = function()
+    return time.perf_counter() - started, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--results', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    batch, titles = make_batch(args.results, args.seed)
+    rows = [
+        ('result fields', lambda: [legacy_classify(lines) for lines in batch], lambda: default_classifier.classify_batch(batch)),
+        ('title names', lambda: [legacy_name(title) for title in titles], lambda: [extract_name_from_title(title) for title in titles]),
+        ('title roles', lambda: [legacy_role(title) for title in titles], lambda: [extract_role_keywords(title) for title in titles])
+    ]
+
+    print(f"{'task':<16}{'legacy us':>11}{'compiled us':>13}{'speedup':>9}")
+    for label, legacy, compiled in rows:
+        legacy_time, legacy_output = timed(legacy)
+        compiled_time, compiled_output = timed(compiled)
+        per_item = 1e6 / args.results
+        print(f"{label:<16}{legacy_time * per_item:>11.2f}{compiled_time * per_item:>13.2f}"
+              f"{legacy_time / (compiled_time or 1e-9):>8.1f}x")
+        if legacy_output != compiled_output:
+            print(f"⚠️ {label}: outputs differ between the two paths")
+
+
+if __name__ == '__main__':
+    main()
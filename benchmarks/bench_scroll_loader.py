@@ -0,0 +1,62 @@
+"""InfiniteScrollLoader vs the fixed three-scroll loop on a local fixture page
+
+The fixture appends a batch of results a short delay after each scroll
+to the bottom. Needs Chrome.
+
+Run from the repository root:
+    python -m benchmarks.bench_scroll_loader --total 23 --batch 5 --delay 300
+"""
+import argparse
+import random
+import time
+
+from page_waits import default_waiter
+from scroll_loader import InfiniteScrollLoader
+from search_result_parser import RESULT_CONTAINER_SELECTOR
+from benchmarks.fixture_server import FixtureServer
+
+
+def fixed_scrolls(driver):
+    """The original loop: always 3 scrolls with 2-4 s sleeps"""
+    for i in range(3):
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        time.sleep(random.uniform(2, 4))
+    return driver.execute_script("return document.querySelectorAll(arguments[0]).length", RESULT_CONTAINER_SELECTOR)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--total', type=int, default=23)
+    parser.add_argument('--batch', type=int, default=5)
+    parser.add_argument('--delay', type=int, default=300, help='ms before each batch appears')
+    parser.add_argument('--target', type=int, default=None)
+    args = parser.parse_args()
+
+    from profile_worker_pool import make_headless_chrome
+
+    server = FixtureServer().start()
+    url = f"{server.url}/infinite_scroll.html?total={args.total}&batch={args.batch}&delay={args.delay}"
+    driver = make_headless_chrome()
+
+    try:
+        driver.get(url)
+        started = time.perf_counter()
+        count = fixed_scrolls(driver)
+        print(f"📊 fixed 3 scrolls:  {count:>4} items in {time.perf_counter() - started:.1f}s")
+
+        driver.get(url)
+        loader = InfiniteScrollLoader(RESULT_CONTAINER_SELECTOR, target_count=args.target)
+        started = time.perf_counter()
+        added = loader.load(driver)
+        print(f"📊 scroll loader:    {loader.item_count:>4} items in {time.perf_counter() - started:.1f}s "
+              f"({loader.stop_reason}), added per step: {added}")
+        if loader.stop_reason == 'exhausted' and loader.item_count < args.total:
+            print("⚠️ loader stopped before the fixture ran out of results")
+        default_waiter.report()
+    finally:
+        driver.quit()
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Live WebElement extraction vs one page_source snapshot parsed with lxml
+
+Run from the repository root (the live half needs Chrome):
+    python -m benchmarks.bench_search_result_parser --repeat 20
+"""
+import argparse
+import pathlib
+import re
+import time
+
+from search_result_parser import RESULT_CONTAINER_SELECTOR, parse_search_results
+
+FIXTURE = pathlib.Path(__file__).resolve().parent.parent / 'fixtures' / 'search_results_page.html'
+
+
+def live_element_path(driver):
+    """The original per-element loop, counting WebDriver round trips"""
+    from selenium.webdriver.common.by import By
+
+    calls = 1
+    found = []
+    for result in driver.find_elements(By.CSS_SELECTOR, RESULT_CONTAINER_SELECTOR):
+        result.text.strip()
+        links = result.find_elements(By.CSS_SELECTOR, 'a[href*="/in/"]')
+        calls += 2
+        for link in links:
+            href = link.get_attribute('href')
+            calls += 1
+            match = re.search(r'linkedin\.com/in/([^/?]+)', href or '')
+            if match:
+                found.append(f"https://www.linkedin.com/in/{match.group(1)}/")
+                break
+    return found, calls
+
+
+def snapshot_path(driver):
+    """One page_source round trip, everything else in-process"""
+    results = parse_search_results(driver.page_source)
+    return [result['profile_url'] for result in results if result['profile_url']], 1
+
+
+def timed(function, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        output = function()
+    return (time.perf_counter() - started) / repeat, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    page_source = FIXTURE.read_text(encoding='utf-8')
+    elapsed, results = timed(lambda: parse_search_results(page_source), args.repeat * 10)
+    print(f"📊 lxml parse of fixture: {len(results)} cards in {elapsed * 1000:.2f} ms")
+
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
+        options = Options()
+        options.add_argument('--headless=new')
+        options.add_argument('--no-sandbox')
+        driver = webdriver.Chrome(options=options)
+    except Exception as e:
+        print(f"⚠️ Chrome unavailable, skipping live comparison: {e}")
+        return
+
+    try:
+        driver.get(FIXTURE.as_uri())
+        live_time, (live_urls, live_calls) = timed(lambda: live_element_path(driver), args.repeat)
+        snapshot_time, (snapshot_urls, snapshot_calls) = timed(lambda: snapshot_path(driver), args.repeat)
+
+        print(f"{'path':<18}{'ms/page':>10}{'round trips':>14}{'urls':>6}")
+        print(f"{'live elements':<18}{live_time * 1000:>10.1f}{live_calls:>14}{len(live_urls):>6}")
+        print(f"{'page_source+lxml':<18}{snapshot_time * 1000:>10.1f}{snapshot_calls:>14}{len(snapshot_urls):>6}")
+        if live_urls != snapshot_urls:
+            print("⚠️ URL lists differ between the two paths")
+    finally:
+        driver.quit()
+
+
+if __name__ == '__main__':
+    main()
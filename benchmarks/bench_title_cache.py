@@ -0,0 +1,105 @@
+"""Hit rate and time saved by the memoized title parsers on a repetitive, real-shaped headline set
+
+Headlines are drawn like the search exports: most from a few dozen shared
+headlines with Zipf-like weights ("Student at Chennai Institute of
+Technology" dominates), the rest unique "<Name> - <Role> at <Company>"
+titles. The uncached parsers, a cold cache and a cache warmed from the file
+of the previous run each go over the same list, and the outputs are
+checked to be identical.
+
+Run from the repository root:
+    python -m benchmarks.bench_title_cache --titles 500000 --unique 0.2
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from result_classifier import (
+    TITLE_CACHES, extract_name_from_title, extract_role_keywords, load_title_caches, parse_name_from_title,
+    parse_role, save_title_caches
+)
+
+SHARED = [
+    'Student at Chennai Institute of Technology',
+    'Student at Chennai Institute of Technology, Chennai',
+    'Attended Chennai Institute of Technology',
+    'Studying Computer Science at Chennai Institute of Technology',
+    'Assistant Professor at Chennai Institute of Technology',
+    'Software Engineer | Chennai Institute of Technology alumni',
+    'Graduate from Chennai Institute of Technology',
+    'Final year student | CIT Chennai',
+    'Aspiring Data Analyst | Student at CIT',
+    'Associate Professor - Department of ECE - Chennai Institute of Technology',
+    'Developer at TCS | CIT 2023',
+    'Alumni of Chennai Institute of Technology',
+    'Research Scholar at Chennai Institute of Technology',
+    'Engineer at Zoho | Chennai Institute of Technology',
+    'Faculty, Chennai Institute of Technology'
+]
+FIRST = ['Arjun', 'Priya', 'Karthik', 'Madhu', 'Rio', 'Sanjay', 'Meena', 'Divya', 'Harish', 'Nithya']
+LAST = ['Kumar', 'Raman', 'Shree', 'Thomas', 'Senthil', 'Lakshmi', 'Prakash', 'Devi']
+ROLES = ['Software Engineer', 'Data Analyst', 'Product Manager', 'Developer', 'Student']
+COMPANIES = ['Zoho', 'Freshworks', 'TCS', 'Infosys', 'Chennai Institute of Technology']
+
+
+def make_titles(count, unique, seed):
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(len(SHARED))]
+    titles = []
+    for i in range(count):
+        if rng.random() < unique:
+            titles.append(f"{rng.choice(FIRST)} {rng.choice(LAST)} {i} - {rng.choice(ROLES)} at {rng.choice(COMPANIES)}")
+        else:
+            titles.append(rng.choices(SHARED, weights)[0])
+    return titles
+
+
+def run(titles, name, role):
+    started = time.perf_counter()
+    output = [(name(title), role(title)) for title in titles]
+    return time.perf_counter() - started, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--titles', type=int, default=500000)
+    parser.add_argument('--unique', type=float, default=0.2, help="share of titles seen only once")
+    parser.add_argument('--seed', type=int, default=11)
+    args = parser.parse_args()
+
+    titles = make_titles(args.titles, args.unique, args.seed)
+    cache_path = os.path.join(tempfile.mkdtemp(), 'title_cache.json')
+
+    uncached_time, expected = run(titles, parse_name_from_title, lambda title: parse_role(title)[1])
+
+    for cache in TITLE_CACHES.values():
+        cache.clear()
+    cold_time, cold = run(titles, extract_name_from_title, extract_role_keywords)
+    print("Cold cache:")
+    for cache in TITLE_CACHES.values():
+        cache.report()
+    save_title_caches(cache_path)
+
+    for cache in TITLE_CACHES.values():
+        cache.clear()
+    started = time.perf_counter()
+    loaded = load_title_caches(cache_path)
+    load_time = time.perf_counter() - started
+    warm_time, warm = run(titles, extract_name_from_title, extract_role_keywords)
+    print(f"Warm cache ({loaded} entries, {os.path.getsize(cache_path) // 1024} KB, loaded in {load_time * 1000:.0f}ms):")
+    for cache in TITLE_CACHES.values():
+        cache.report()
+
+    print(f"{'run':<12}{'seconds':>9}{'us/title':>10}")
+    for label, elapsed in (('uncached', uncached_time), ('cold cache', cold_time), ('warm cache', warm_time)):
+        print(f"{label:<12}{elapsed:>9.2f}{elapsed / args.titles * 1e6:>10.2f}")
+    if cold != expected or warm != expected:
+        print("⚠️ Cached and uncached outputs differ")
+    print(f"📊 {len(set(titles))} distinct of {args.titles} titles, "
+          f"cold cache {uncached_time / cold_time:.1f}x the uncached speed")
+
+
+if __name__ == '__main__':
+    main()
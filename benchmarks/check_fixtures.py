@@ -0,0 +1,146 @@
+"""Typed profile records and parsed search cards checked against the fixtures, exits 1 on any mismatch
+
+Each profile under fixtures/profiles is extracted from its page_source
+snapshot and its name, graduation year, eligibility, education and
+experience records are compared field by field with what the page shows.
+The search result fixture is parsed the same way and every card's URL,
+CIT flag, name, headline and location is compared with the card.
+
+Run from the repository root:
+    python -m benchmarks.check_fixtures
+"""
+import argparse
+import pathlib
+import sys
+
+from profile_page import extract_profile_from_html
+from profile_records import EducationRecord, ExperienceRecord
+from search_result_parser import parse_search_results, search_profile
+from benchmarks.checks import Checks
+
+FIXTURES = pathlib.Path(__file__).resolve().parent.parent / 'fixtures'
+
+PROFILES = {
+    'arjun-s-s-189840279': {
+        'name': 'Arjun S S',
+        'grad_year': 2023,
+        'eligible': True,
+        'education': [
+            EducationRecord('Chennai Institute of Technology', 'Bachelor of Engineering - BE',
+                            'Computer Science and Engineering', 2019, 2023)
+        ],
+        'positions': [
+            ExperienceRecord('Software Engineer', 'Zoho', 'Full-time', start_year=2023, start_month=7,
+                             current=True, duration_months=16, location='Chennai, Tamil Nadu, India'),
+            ExperienceRecord('Software Engineering Intern', 'Freshworks', 'Internship', start_year=2023, start_month=1,
+                             end_year=2023, end_month=6, duration_months=6, location='Chennai, Tamil Nadu, India')
+        ]
+    },
+    'madhushree-t-211389200': {
+        'name': 'Madhushree T',
+        'grad_year': 2022,
+        'eligible': True,
+        'education': [
+            EducationRecord('Chennai Institute of Technology', 'Bachelor of Technology - BTech',
+                            'Information Technology', 2018, 2022)
+        ],
+        'positions': [
+            ExperienceRecord('Data Analyst', 'Tiger Analytics', 'Full-time', start_year=2022, start_month=8,
+                             current=True, duration_months=27, location='Chennai, Tamil Nadu, India',
+                             workplace='Hybrid')
+        ]
+    },
+    # Not a CIT graduate: education is parsed, experience is not read
+    'priya-raman-a1b2c3': {
+        'name': 'Priya Raman',
+        'grad_year': None,
+        'eligible': False,
+        'education': [
+            EducationRecord('PSG College of Technology', 'Bachelor of Engineering - BE',
+                            'Mechanical Engineering', 2015, 2019)
+        ],
+        'positions': []
+    },
+    # Graduates in 2026, after MAX_GRAD_YEAR
+    'rio-m-6665672b6': {
+        'name': 'Rio M',
+        'grad_year': 2026,
+        'eligible': False,
+        'education': [
+            EducationRecord('Chennai Institute of Technology', 'Bachelor of Engineering - BE',
+                            'Electronics and Communication Engineering', 2022, 2026)
+        ],
+        'positions': []
+    }
+}
+
+# (slug or None, CIT related, name, headline, location) of every card, in page order
+SEARCH_CARDS = [
+    ('arjun-s-s-189840279', True, 'Arjun S S · 2nd', 'Student at Chennai Institute of Technology',
+     'Chennai, Tamil Nadu, India'),
+    ('madhushree-t-211389200', True, 'Madhushree T · 2nd', 'Assistant Professor | Chennai Institute of Technology',
+     'Coimbatore, Tamil Nadu, India'),
+    ('priya-raman-a1b2c3', False, 'Priya Raman · 2nd', None, 'Bengaluru, Karnataka, India'),
+    # 'LinkedIn Member' is no name, so only the headline is checked for this card
+    (None, True, ..., 'Attended Chennai Institute of Technology', ...),
+    ('vishnu-ram-m-23395218b', True, 'Vishnu Ram M · 2nd', 'Data Analyst | Chennai Institute of Technology alumni',
+     'Tamil Nadu, India'),
+    ('karthik-subramanian-9988', False, 'Karthik Subramanian · 2nd', None, 'Chennai, Tamil Nadu, India'),
+    ('yamini-anbu-158562199', True, 'Yamini Anbu · 2nd', 'Graduate of Chennai Institute Technology',
+     'Chennai, Tamil Nadu, India'),
+    ('dheeksha-gopika', True, 'Dheeksha Gopika · 2nd', 'Associate Professor at Chennai Institute of Technology',
+     'Chennai, Tamil Nadu, India'),
+    ('rahul-verma-77', False, 'Rahul Verma · 2nd', None, 'Chennai, Tamil Nadu, India'),
+    ('lakshmipooja-e-3055141bb', True, 'Lakshmi Pooja E · 2nd', 'Developer | Chennai Institute of Technology',
+     'Coimbatore, Tamil Nadu, India'),
+    ('saravanan18302', True, 'Saravanan K · 2nd', 'Faculty, Chennai Institute of Technology',
+     'Chennai, Tamil Nadu, India'),
+    ('rio-m-6665672b6', True, 'Rio M · 2nd', 'Student at Chennai Institute of Technology', 'India')
+]
+
+
+def check_profiles(checks):
+    for slug, expected in PROFILES.items():
+        page_source = (FIXTURES / 'profiles' / f"{slug}.html").read_text(encoding='utf-8')
+        profile = extract_profile_from_html(page_source, f"https://www.linkedin.com/in/{slug}/")
+        for field, value in expected.items():
+            checks.equal(f"{slug}: {field}", profile[field], value)
+        # The flat experience lines are what the CSV export writes; they must cover every position
+        for position in profile['positions']:
+            checks.equal(f"{slug}: '{position.title}' in the experience lines", position.title in profile['experiences'],
+                         True)
+
+
+def check_search_cards(checks):
+    results = parse_search_results((FIXTURES / 'search_results_page.html').read_text(encoding='utf-8'))
+    checks.equal("search page: cards", len(results), len(SEARCH_CARDS))
+    for result, (slug, cit_related, name, headline, location) in zip(results, SEARCH_CARDS):
+        label = f"search card {slug or 'without a URL'}"
+        profile_url = f"https://www.linkedin.com/in/{slug}/" if slug else None
+        card = result['profile']
+        checks.equal(f"{label}: URL, CIT flag and headline",
+                     (result['profile_url'], result['cit_related'], card.get('headline')),
+                     (profile_url, cit_related, headline))
+        if name is not ...:
+            checks.equal(f"{label}: name and location", (card.get('name'), card.get('location')), (name, location))
+        # Only CIT cards with a headline become profiles
+        checks.equal(f"{label}: kept as a profile", search_profile(result) is not None,
+                     cit_related and headline is not None)
+    checks.equal("empty page: no cards", parse_search_results("<html><body></body></html>"), [])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args()
+
+    checks = Checks()
+    check_profiles(checks)
+    check_search_cards(checks)
+    if checks.failures:
+        print(f"❌ {checks.failures} checks failed")
+        sys.exit(1)
+    print("✅ Records and search cards match the fixtures")
+
+
+if __name__ == '__main__':
+    main()
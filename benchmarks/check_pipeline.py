@@ -0,0 +1,132 @@
+"""Offline end-to-end check of ExtractionPipeline against the search fixtures, exits 1 on any mismatch
+
+Every query gets --pages result pages built from
+fixtures/search_results_page.html with page-specific profile slugs, as in
+bench_pipeline. The run must collect exactly the CIT cards of those pages
+(the card without a URL only once, since it is the same person on every
+page), leave every query and page done in the frontier, and write the
+same profiles to the PostgREST stub. A second run over the same frontier
+must fetch and write nothing. A last run serves the final page again
+instead of an empty one, which must end each query as well.
+
+Run from the repository root:
+    python -m benchmarks.check_pipeline --queries 3 --pages 3
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+from postgrest import SyncPostgrestClient
+
+from crawl_frontier import CrawlFrontier
+from extraction_pipeline import ExtractionPipeline, profile_key
+from benchmarks.bench_pipeline import QUERIES, make_fetcher, make_sink
+from benchmarks.checks import Checks
+from benchmarks.fixture_server import FixtureServer
+from benchmarks.postgrest_stub import PostgrestStub
+
+# CIT cards of the fixture page that have a profile link, with the name the card shows
+CIT_CARDS = [
+    ('arjun-s-s-189840279', 'Arjun S S · 2nd'),
+    ('madhushree-t-211389200', 'Madhushree T · 2nd'),
+    ('vishnu-ram-m-23395218b', 'Vishnu Ram M · 2nd'),
+    ('yamini-anbu-158562199', 'Yamini Anbu · 2nd'),
+    ('dheeksha-gopika', 'Dheeksha Gopika · 2nd'),
+    ('lakshmipooja-e-3055141bb', 'Lakshmi Pooja E · 2nd'),
+    ('saravanan18302', 'Saravanan K · 2nd'),
+    ('rio-m-6665672b6', 'Rio M · 2nd')
+]
+# The CIT card without a profile link
+NO_URL_HEADLINE = 'Attended Chennai Institute of Technology'
+
+
+def expected_urls(pages):
+    return {f"https://www.linkedin.com/in/{slug}-p{page}/": name
+            for page in range(1, pages + 1) for slug, name in CIT_CARDS}
+
+
+def counting(fetch_page):
+    """fetch_page that also counts its calls"""
+    def fetch(query, page):
+        fetch.calls += 1
+        return fetch_page(query, page)
+    fetch.calls = 0
+    return fetch
+
+
+def run(fetch_page, queries, frontier):
+    stub = PostgrestStub().start()
+    try:
+        pipeline = ExtractionPipeline(fetch_page, sink=make_sink(SyncPostgrestClient(stub.url)), queries=queries,
+                                      fetch_concurrency=3, frontier=frontier)
+        return pipeline, pipeline.run(), stub.rows('profiles')
+    finally:
+        stub.stop()
+
+
+def check_profiles(checks, label, profiles, rows, pages):
+    urls = expected_urls(pages)
+    with_url = {profile['profile_url']: profile['name'] for profile in profiles if profile['profile_url']}
+    without_url = [profile['headline'] for profile in profiles if not profile['profile_url']]
+    checks.equal(f"{label}: profiles with a URL", with_url, urls)
+    checks.equal(f"{label}: profiles without a URL", without_url, [NO_URL_HEADLINE])
+    checks.equal(f"{label}: no profile collected twice", len({profile_key(p) for p in profiles}), len(profiles))
+    checks.equal(f"{label}: sink rows",
+                 sorted((row['profile_url'], row['name']) for row in rows if row['profile_url']), sorted(urls.items()))
+    checks.equal(f"{label}: sink rows without a URL", [row['about'] for row in rows if not row['profile_url']],
+                 [NO_URL_HEADLINE])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--queries', type=int, default=3)
+    parser.add_argument('--pages', type=int, default=3, help='result pages per query before it runs out')
+    args = parser.parse_args()
+
+    queries = QUERIES[:args.queries]
+    checks = Checks()
+    directory = tempfile.mkdtemp()
+    server = FixtureServer().start()
+    try:
+        # Fresh run: every CIT card of every page, once
+        frontier = CrawlFrontier(os.path.join(directory, 'frontier.db'))
+        fetch_page = counting(make_fetcher(server, args.pages))
+        pipeline, profiles, rows = run(fetch_page, queries, frontier)
+        check_profiles(checks, "fresh run", profiles, rows, args.pages)
+        checks.equal("fresh run: failed queries", pipeline.failed_queries, {})
+        checks.equal("fresh run: pages fetched (the empty one ends each query)", fetch_page.calls,
+                     len(queries) * (args.pages + 1))
+
+        counts = frontier.counts()
+        checks.equal("frontier: queries done", counts.get('query'), {'done': len(queries)})
+        checks.equal("frontier: pages done", counts.get('page'), {'done': len(queries) * args.pages})
+        checks.equal("frontier: profiles done", counts.get('profile'), {'done': len(profiles)})
+        checks.equal("frontier: stored profiles", sorted(map(profile_key, frontier.results('profile'))),
+                     sorted(map(profile_key, profiles)))
+
+        # Same frontier again: everything is already done
+        fetch_page = counting(make_fetcher(server, args.pages))
+        _, profiles, rows = run(fetch_page, queries, frontier)
+        checks.equal("resumed run: pages fetched", fetch_page.calls, 0)
+        checks.equal("resumed run: profiles", profiles, [])
+        checks.equal("resumed run: sink rows", rows, [])
+        frontier.close()
+
+        # LinkedIn serving the last page again past the end must end the query too
+        repeat = make_fetcher(server, args.pages)
+        fetch_page = counting(lambda query, page: repeat(query, min(page, args.pages)))
+        pipeline, profiles, rows = run(fetch_page, queries, None)
+        check_profiles(checks, "repeated last page", profiles, rows, args.pages)
+        checks.equal("repeated last page: pages fetched", fetch_page.calls, len(queries) * (args.pages + 1))
+    finally:
+        server.stop()
+
+    if checks.failures:
+        print(f"❌ {checks.failures} checks failed")
+        sys.exit(1)
+    print("✅ Pipeline output matches the fixtures")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,12 @@
+class Checks:
+    """Collects failed expectations instead of stopping at the first one"""
+
+    def __init__(self):
+        self.failures = 0
+
+    def equal(self, label, actual, expected):
+        if actual == expected:
+            print(f"✅ {label}")
+            return
+        self.failures += 1
+        print(f"❌ {label}\n   expected: {expected!r}\n   actual:   {actual!r}")
@@ -0,0 +1,91 @@
+import pathlib
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES = pathlib.Path(__file__).resolve().parent.parent / 'fixtures'
+
+
+class FixtureServer:
+    """Local HTTP server that serves fixture pages under LinkedIn-shaped paths
+
+    /in/<slug>/ returns fixtures/profiles/<slug>.html, any other path is
+    looked up relative to the fixtures directory. latency is added to every
+    response to mimic a real page load. Connections are kept alive for
+    clients that reuse them; connection_count counts the ones opened.
+    """
+
+    def __init__(self, latency=0.0, root=FIXTURES):
+        self.latency = latency
+        self.root = pathlib.Path(root)
+        self.request_count = 0
+        self.connection_count = 0
+        self.lock = threading.Lock()
+        self.server = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def profile_url(self, slug):
+        return f"{self.url}/in/{slug}/"
+
+    def start(self):
+        fixture_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are separate writes; without this a reused connection waits on delayed ACKs
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with fixture_server.lock:
+                    fixture_server.connection_count += 1
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                fixture_server._handle(self)
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+    def resolve(self, path):
+        path = path.split('?', 1)[0].split('#', 1)[0]
+        match = re.match(r'^/in/([^/]+)/?$', path)
+        if match:
+            return self.root / 'profiles' / f"{match.group(1)}.html"
+        candidate = (self.root / path.lstrip('/')).resolve()
+        if self.root.resolve() in candidate.parents:
+            return candidate
+        return None
+
+    def _handle(self, handler):
+        if self.latency:
+            time.sleep(self.latency)
+        with self.lock:
+            self.request_count += 1
+
+        page = self.resolve(handler.path)
+        if not page or not page.is_file():
+            handler.send_response(404)
+            handler.send_header('Content-Length', '0')
+            handler.end_headers()
+            return
+
+        data = page.read_bytes()
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'text/html; charset=utf-8')
+        handler.send_header('Content-Length', str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
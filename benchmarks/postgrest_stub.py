@@ -0,0 +1,152 @@
+import json
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class PostgrestStub:
+    """In-memory PostgREST-compatible server for offline benchmarks
+
+    Supports the subset of the REST API the scrapers use: insert/upsert
+    (single object or JSON array), select, delete and patch with eq/neq/in
+    filters. Rows whose name contains REJECT_MARKER make the whole request
+    fail, which is how PostgREST behaves when one row of a bulk payload
+    violates a constraint.
+    """
+
+    REJECT_MARKER = '__reject__'
+
+    def __init__(self, latency=0.0, key_column='profile_id'):
+        self.latency = latency
+        self.key_column = key_column
+        self.tables = {}
+        self.request_count = 0
+        self.lock = threading.Lock()
+        self.server = None
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/rest/v1"
+
+    def start(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stub._handle(self, 'GET')
+
+            def do_POST(self):
+                stub._handle(self, 'POST')
+
+            def do_PATCH(self):
+                stub._handle(self, 'PATCH')
+
+            def do_DELETE(self):
+                stub._handle(self, 'DELETE')
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+    def rows(self, table):
+        return list(self.tables.get(table, {}).values())
+
+    def _handle(self, handler, method):
+        if self.latency:
+            time.sleep(self.latency)
+
+        parsed = urllib.parse.urlparse(handler.path)
+        table = parsed.path.rstrip('/').split('/')[-1]
+        params = urllib.parse.parse_qs(parsed.query)
+        length = int(handler.headers.get('Content-Length') or 0)
+        body = json.loads(handler.rfile.read(length)) if length else None
+        prefer = handler.headers.get('Prefer', '')
+
+        with self.lock:
+            self.request_count += 1
+            store = self.tables.setdefault(table, {})
+
+            if method == 'POST':
+                rows = body if isinstance(body, list) else [body]
+                if any(self.REJECT_MARKER in str(row.get('name', '')) for row in rows):
+                    return self._send(handler, 400, {'code': '23514', 'message': 'row rejected by stub constraint'})
+
+                upsert = 'merge-duplicates' in prefer
+                for row in rows:
+                    key = row.get(self.key_column)
+                    if key in store and not upsert:
+                        return self._send(handler, 409, {'code': '23505', 'message': 'duplicate key value'})
+                for row in rows:
+                    key = row.get(self.key_column)
+                    store[key] = {**store.get(key, {}), **row}
+                return self._send(handler, 201, rows if 'return=representation' in prefer else [])
+
+            matched = [key for key, row in store.items() if self._matches(row, params)]
+
+            if method == 'GET':
+                columns = params.get('select', ['*'])[0]
+                result = [store[key] for key in matched]
+                offset, limit = self._window(handler, params)
+                result = result[offset:offset + limit] if limit is not None else result[offset:]
+                if columns != '*':
+                    names = columns.split(',')
+                    result = [{name: row.get(name) for name in names} for row in result]
+                return self._send(handler, 200, result)
+
+            if method == 'DELETE':
+                removed = [store.pop(key) for key in matched]
+                return self._send(handler, 200, removed if 'return=representation' in prefer else [])
+
+            if method == 'PATCH':
+                for key in matched:
+                    store[key].update(body or {})
+                return self._send(handler, 200, [store[key] for key in matched])
+
+    @staticmethod
+    def _matches(row, params):
+        for column, values in params.items():
+            if column in ('select', 'on_conflict', 'columns', 'offset', 'limit', 'order'):
+                continue
+            operator, _, operand = values[0].partition('.')
+            value = '' if row.get(column) is None else str(row.get(column))
+            if operator == 'eq' and value != operand:
+                return False
+            if operator == 'neq' and value == operand:
+                return False
+            if operator == 'in':
+                options = [option.strip('"') for option in operand.strip('()').split(',')]
+                if value not in options:
+                    return False
+        return True
+
+    @staticmethod
+    def _window(handler, params):
+        """Read pagination from offset/limit params or a Range header"""
+        if 'offset' in params or 'limit' in params:
+            limit = params.get('limit', [None])[0]
+            return int(params.get('offset', ['0'])[0]), int(limit) if limit is not None else None
+        if handler.headers.get('Range'):
+            start, _, end = handler.headers['Range'].partition('-')
+            return int(start), int(end) - int(start) + 1
+        return 0, None
+
+    @staticmethod
+    def _send(handler, status, payload):
+        data = json.dumps(payload).encode('utf-8')
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
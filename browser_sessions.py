@@ -0,0 +1,278 @@
+import contextlib
+import json
+import os
+import queue
+import threading
+import time
+
+SESSION_COOKIE = 'li_at'
+COOKIE_DOMAIN = 'linkedin.com'
+
+
+def chrome_service(directory='browser_sessions'):
+    """chromedriver Service, resolving the driver path once instead of on every run
+
+    ChromeDriverManager().install() checks for a new driver version online
+    each time it is called; the resolved path is kept in driver.json and
+    reused while the file exists.
+    """
+    from selenium.webdriver.chrome.service import Service
+
+    record = os.path.join(directory, 'driver.json')
+    try:
+        with open(record) as f:
+            driver_path = json.load(f)['path']
+        if os.path.exists(driver_path):
+            return Service(driver_path)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    driver_path = ChromeDriverManager().install()
+    os.makedirs(directory, exist_ok=True)
+    write_json(record, {'path': driver_path})
+    return Service(driver_path)
+
+
+def write_json(path, data):
+    temp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(temp_path, path)
+
+
+def read_cookies(driver):
+    """Every cookie of the browser, not just the current page's (Chrome DevTools)"""
+    return driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', [])
+
+
+def cookie_alive(cookie, now):
+    """Session cookies (no expiry) and cookies expiring in the future"""
+    expires = cookie.get('expires', cookie.get('expiry', -1))
+    return expires is None or expires <= 0 or expires > now
+
+
+def write_cookies(driver, cookies):
+    if cookies:
+        driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookies})
+
+
+class BrowserSessionPool:
+    """Warm, logged-in browser sessions that survive from one run to the next
+
+    Every slot is a browser with its own persistent profile directory, so
+    Chrome keeps its cookies and disk cache between runs, and the cookies
+    are also saved to cookies.json and restored into fresh profiles. A
+    session is validated without loading a page: it is good while the
+    session_cookie for cookie_domain exists and has not expired. Only
+    otherwise is login(driver) called, after which the cookies are saved
+    again. start() warms all slots in parallel; extractors borrow() a ready
+    driver and give it back, and close() saves the cookies and quits.
+
+    driver_factory(profile_dir) starts one browser; profile_dir is None when
+    persistent_profiles is False. A slot whose browser fails to start is
+    given back, and once size starts in a row failed with no browser alive,
+    acquire() raises instead of waiting.
+    """
+
+    def __init__(self, driver_factory, login=None, size=1, directory='browser_sessions',
+                 session_cookie=SESSION_COOKIE, cookie_domain=COOKIE_DOMAIN, persistent_profiles=True):
+        self.driver_factory = driver_factory
+        self.login = login
+        self.size = max(1, int(size))
+        self.directory = directory
+        self.session_cookie = session_cookie
+        self.cookie_domain = cookie_domain
+        self.persistent_profiles = persistent_profiles
+        self.ready = queue.Queue()
+        self.drivers = []
+        self.slots_opened = 0
+        self.failed_starts = 0
+        self.lock = threading.Lock()
+        self.cookie_path = os.path.join(directory, 'cookies.json')
+        self.timings = []
+        os.makedirs(directory, exist_ok=True)
+
+    def profile_dir(self, slot):
+        if not self.persistent_profiles:
+            return None
+        return os.path.abspath(os.path.join(self.directory, f"profile-{slot}"))
+
+    def saved_cookies(self):
+        try:
+            with open(self.cookie_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def save_cookies(self, driver):
+        cookies = read_cookies(driver)
+        if self.session_valid(cookies):
+            with self.lock:
+                write_json(self.cookie_path, cookies)
+
+    def session_valid(self, cookies):
+        """Whether the session cookie is present and unexpired, no page load needed"""
+        now = time.time()
+        return any(
+            cookie.get('name') == self.session_cookie and self.cookie_domain in cookie.get('domain', '')
+            and cookie_alive(cookie, now)
+            for cookie in cookies
+        )
+
+    def is_logged_in(self, driver):
+        try:
+            return self.session_valid(read_cookies(driver))
+        except Exception:
+            return False
+
+    def _reserve_slot(self):
+        with self.lock:
+            if self.slots_opened >= self.size:
+                return None
+            self.slots_opened += 1
+            return self.slots_opened - 1
+
+    def _open(self, slot):
+        """Start one browser and bring it to a logged-in state, reusing what earlier runs left"""
+        timing = {'slot': slot, 'state': 'cold'}
+        started = time.monotonic()
+        try:
+            driver = self.driver_factory(self.profile_dir(slot))
+        except Exception:
+            with self.lock:
+                self.slots_opened -= 1
+                self.failed_starts += 1
+            raise
+        timing['startup'] = time.monotonic() - started
+
+        try:
+            step = time.monotonic()
+            if self.session_valid(read_cookies(driver)):
+                timing['state'] = 'warm (profile)'
+            else:
+                now = time.time()
+                write_cookies(driver, [cookie for cookie in self.saved_cookies() if cookie_alive(cookie, now)])
+                if self.session_valid(read_cookies(driver)):
+                    timing['state'] = 'warm (cookies)'
+                elif self.login:
+                    self.login(driver)
+                    timing['login'] = time.monotonic() - step
+                    self.save_cookies(driver)
+        except Exception as e:
+            # A browser that could not log in (e.g. stopped at a security checkpoint) is not handed out
+            print(f"⚠️ Session {slot}: could not restore or log in: {e}")
+            timing['state'] = 'failed'
+            timing['total'] = time.monotonic() - started
+            timing['logged_in'] = False
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            with self.lock:
+                self.timings.append(timing)
+                self.slots_opened -= 1
+                self.failed_starts += 1
+            raise
+
+        timing['total'] = time.monotonic() - started
+        timing['logged_in'] = self.is_logged_in(driver)
+        with self.lock:
+            self.timings.append(timing)
+            self.drivers.append(driver)
+            self.failed_starts = 0
+        print(f"🌐 Session {slot}: {timing['state']}, ready in {timing['total']:.1f}s")
+        return driver
+
+    def start(self):
+        """Open every slot in parallel and keep the drivers ready to borrow"""
+        def open_slot(slot):
+            try:
+                self.ready.put(self._open(slot))
+            except Exception as e:
+                print(f"❌ Session {slot}: browser setup failed: {e}")
+
+        slots = []
+        while True:
+            slot = self._reserve_slot()
+            if slot is None:
+                break
+            slots.append(slot)
+        threads = [threading.Thread(target=open_slot, args=(slot,), daemon=True) for slot in slots]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self
+
+    def dead(self):
+        """Whether no browser is alive and the last size starts all failed"""
+        with self.lock:
+            return not self.drivers and self.failed_starts >= self.size
+
+    def acquire(self, timeout=None):
+        """A ready driver, opening a new slot if the pool is not full yet
+
+        Raises RuntimeError when no browser can be started and TimeoutError
+        when none came free within timeout seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self.ready.get_nowait()
+            except queue.Empty:
+                pass
+            if self.dead():
+                raise RuntimeError("no browser session could be started")
+            slot = self._reserve_slot()
+            if slot is not None:
+                return self._open(slot)
+            # Poll, so a slot given back by a failed start is noticed
+            wait = 1.0 if deadline is None else min(1.0, deadline - time.monotonic())
+            if wait <= 0:
+                raise TimeoutError(f"no browser session came free within {timeout}s")
+            try:
+                return self.ready.get(timeout=wait)
+            except queue.Empty:
+                pass
+
+    def release(self, driver):
+        """Hand a driver back for the next borrower, saving its cookies first"""
+        try:
+            self.save_cookies(driver)
+        except Exception:
+            pass
+        self.ready.put(driver)
+
+    @contextlib.contextmanager
+    def borrow(self, timeout=None):
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self):
+        """Save the cookies of every session and quit the browsers"""
+        with self.lock:
+            drivers, self.drivers = self.drivers, []
+            self.slots_opened = 0
+            self.failed_starts = 0
+        for driver in drivers:
+            try:
+                self.save_cookies(driver)
+            except Exception:
+                pass
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self.ready = queue.Queue()
+
+    def report(self):
+        print(f"🌐 Sessions: {len(self.timings)} opened")
+        for timing in sorted(self.timings, key=lambda timing: timing['slot']):
+            login = f", login {timing['login']:.1f}s" if 'login' in timing else ""
+            print(f"   slot {timing['slot']}: {timing['state']}, startup {timing['startup']:.1f}s{login}, "
+                  f"total {timing['total']:.1f}s, logged in: {timing['logged_in']}")
@@ -0,0 +1,65 @@
+class SupabaseBulkWriter:
+    """Write rows to a Supabase/PostgREST table as multi-row upserts"""
+
+    def __init__(self, client, table, batch_size=500, on_conflict=None):
+        self.client = client
+        self.table = table
+        self.batch_size = max(1, int(batch_size))
+        self.on_conflict = on_conflict
+        self.saved_count = 0
+        self.failed_rows = []
+        self.requests_sent = 0
+
+    def upsert_rows(self, rows):
+        """Upsert rows in chunks of batch_size, returns the number of rows saved"""
+        rows = self.normalize_rows(rows)
+        saved = 0
+
+        for start in range(0, len(rows), self.batch_size):
+            chunk = rows[start:start + self.batch_size]
+            saved += self._write_chunk(chunk)
+
+        self.saved_count += saved
+        return saved
+
+    def _write_chunk(self, chunk):
+        """Send one chunk, splitting it in half on failure until bad rows are isolated"""
+        try:
+            self.requests_sent += 1
+            query = self.client.table(self.table)
+            if self.on_conflict:
+                query = query.upsert(chunk, on_conflict=self.on_conflict)
+            else:
+                query = query.upsert(chunk)
+            result = query.execute()
+            return len(result.data) if result.data else 0
+
+        except Exception as e:
+            if len(chunk) == 1:
+                self.failed_rows.append({'row': chunk[0], 'error': str(e)})
+                print(f"⚠️ Error saving profile to database: {e}")
+                return 0
+
+            middle = len(chunk) // 2
+            return self._write_chunk(chunk[:middle]) + self._write_chunk(chunk[middle:])
+
+    @staticmethod
+    def normalize_rows(rows):
+        """Give every row the same keys, PostgREST rejects bulk payloads with mismatched keys"""
+        rows = list(rows)
+        columns = []
+        for row in rows:
+            for key in row:
+                if key not in columns:
+                    columns.append(key)
+
+        return [{column: row.get(column) for column in columns} for row in rows]
+
+    def report(self):
+        """Print a summary of the writes made so far"""
+        print(f"🗄️ Saved {self.saved_count} rows in {self.requests_sent} requests")
+        if self.failed_rows:
+            print(f"⚠️ {len(self.failed_rows)} rows failed:")
+            for failure in self.failed_rows:
+                row = failure['row']
+                print(f"   ❌ {row.get('name', row.get('profile_id', '?'))}: {failure['error']}")
@@ -0,0 +1,186 @@
+import dataclasses
+import json
+import sqlite3
+import threading
+import time
+
+PENDING = 'pending'
+IN_FLIGHT = 'in_flight'
+DONE = 'done'
+FAILED = 'failed'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS frontier (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    position INTEGER NOT NULL,
+    payload TEXT,
+    result TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (kind, key)
+);
+CREATE INDEX IF NOT EXISTS frontier_state ON frontier (kind, state, position);
+"""
+
+
+def to_json(value):
+    """json.dumps default: typed records (education, positions) are stored as plain objects"""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class CrawlFrontier:
+    """Durable record of queries, result pages and profiles with a state for each
+
+    Items move pending -> in_flight -> done or failed. Every transition is
+    committed immediately to a SQLite file in WAL mode, so a crashed run can
+    be resumed without refetching anything that already finished.
+    """
+
+    def __init__(self, path='crawl_frontier.db', max_attempts=3):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def _execute(self, sql, params=()):
+        with self.lock:
+            return self.db.execute(sql, params)
+
+    def _query(self, sql, params=()):
+        with self.lock:
+            return self.db.execute(sql, params).fetchall()
+
+    def add(self, kind, key, payload=None):
+        """Register an item as pending unless it is already known"""
+        self.add_many(kind, [(key, payload)])
+
+    def add_many(self, kind, items):
+        """Register (key, payload) pairs in order, keeping existing items untouched"""
+        now = time.time()
+        with self.lock:
+            position = self.db.execute(
+                "SELECT COALESCE(MAX(position), -1) + 1 FROM frontier WHERE kind = ?", (kind,)
+            ).fetchone()[0]
+            self.db.execute("BEGIN")
+            try:
+                for key, payload in items:
+                    cursor = self.db.execute(
+                        "INSERT OR IGNORE INTO frontier (kind, key, position, payload, updated_at) VALUES (?, ?, ?, ?, ?)",
+                        (kind, key, position, json.dumps(payload), now)
+                    )
+                    position += cursor.rowcount
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
+            self.db.execute("COMMIT")
+
+    def state(self, kind, key):
+        rows = self._query("SELECT state FROM frontier WHERE kind = ? AND key = ?", (kind, key))
+        return rows[0][0] if rows else None
+
+    def is_done(self, kind, key):
+        return self.state(kind, key) == DONE
+
+    def claim(self, kind, key):
+        """Mark an item in flight, returns False if it is already done"""
+        cursor = self._execute(
+            "UPDATE frontier SET state = ?, attempts = attempts + 1, updated_at = ? "
+            "WHERE kind = ? AND key = ? AND state != ?",
+            (IN_FLIGHT, time.time(), kind, key, DONE)
+        )
+        return cursor.rowcount > 0
+
+    def complete(self, kind, key, result=None):
+        """Store an item's result and mark it done, adding the item if it was not registered"""
+        now = time.time()
+        with self.lock:
+            position = self.db.execute(
+                "SELECT COALESCE(MAX(position), -1) + 1 FROM frontier WHERE kind = ?", (kind,)
+            ).fetchone()[0]
+            self.db.execute(
+                "INSERT INTO frontier (kind, key, state, position, result, updated_at) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (kind, key) DO UPDATE SET state = excluded.state, result = excluded.result, "
+                "error = NULL, updated_at = excluded.updated_at",
+                (kind, key, DONE, position, json.dumps(result, default=to_json), now)
+            )
+
+    def fail(self, kind, key, error):
+        self._execute(
+            "UPDATE frontier SET state = ?, error = ?, updated_at = ? WHERE kind = ? AND key = ?",
+            (FAILED, str(error), time.time(), kind, key)
+        )
+
+    def recover(self):
+        """Return interrupted and retryable failed items to pending, returns how many were reset"""
+        cursor = self._execute(
+            "UPDATE frontier SET state = ? WHERE state = ? OR (state = ? AND attempts < ?)",
+            (PENDING, IN_FLIGHT, FAILED, self.max_attempts)
+        )
+        return cursor.rowcount
+
+    def pending(self, kind):
+        """Keys still to do, in the order they were added"""
+        rows = self._query(
+            "SELECT key FROM frontier WHERE kind = ? AND state = ? ORDER BY position", (kind, PENDING)
+        )
+        return [row[0] for row in rows]
+
+    def unfinished(self, kind):
+        """How many items a later run still has to do: pending, in flight or failed with retries left"""
+        rows = self._query(
+            "SELECT COUNT(*) FROM frontier WHERE kind = ? AND (state IN (?, ?) OR (state = ? AND attempts < ?))",
+            (kind, PENDING, IN_FLIGHT, FAILED, self.max_attempts)
+        )
+        return rows[0][0]
+
+    def results(self, kind):
+        """Results of finished items, in the order they were added"""
+        rows = self._query(
+            "SELECT result FROM frontier WHERE kind = ? AND state = ? ORDER BY position", (kind, DONE)
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def iter_results(self, kind, batch_size=500, keys=False):
+        """Same as results(), read in batches so a large frontier is never loaded at once
+
+        With keys, (key, result) pairs are yielded instead of bare results.
+        """
+        position = -1
+        while True:
+            rows = self._query(
+                "SELECT position, key, result FROM frontier WHERE kind = ? AND state = ? AND position > ? "
+                "ORDER BY position LIMIT ?", (kind, DONE, position, batch_size)
+            )
+            if not rows:
+                return
+            for position, key, result in rows:
+                yield (key, json.loads(result)) if keys else json.loads(result)
+
+    def counts(self):
+        """{kind: {state: count}} for progress reports"""
+        counts = {}
+        for kind, state, count in self._query(
+            "SELECT kind, state, COUNT(*) FROM frontier GROUP BY kind, state"
+        ):
+            counts.setdefault(kind, {})[state] = count
+        return counts
+
+    def report(self):
+        for kind, states in sorted(self.counts().items()):
+            summary = ', '.join(f"{count} {state}" for state, count in sorted(states.items()))
+            print(f"📌 Frontier {kind}: {summary}")
+
+    def reset(self):
+        """Forget everything once a run has been fully saved"""
+        self._execute("DELETE FROM frontier")
@@ -0,0 +1,121 @@
+import csv
+import os
+
+
+class ReorderBuffer:
+    """Hand items to emit(item) in index order although they arrive in any order
+
+    put(index, item) holds an item until every lower index has arrived or
+    been skipped, then emits the longest run that is ready. skip(index)
+    marks an index that will never arrive. drain() emits whatever is still
+    held, in index order, for a run that stopped before every index came.
+    """
+
+    def __init__(self, emit, start=0):
+        self.emit = emit
+        self.next_index = start
+        self.held = {}
+
+    def put(self, index, item):
+        self.held[index] = (True, item)
+        self._flush()
+
+    def skip(self, index):
+        self.held[index] = (False, None)
+        self._flush()
+
+    def _flush(self):
+        while self.next_index in self.held:
+            ready, item = self.held.pop(self.next_index)
+            if ready:
+                self.emit(item)
+            self.next_index += 1
+
+    def drain(self):
+        for index in sorted(self.held):
+            ready, item = self.held.pop(index)
+            if ready:
+                self.emit(item)
+            self.next_index = index + 1
+class StreamingCSVWriter:
+    """Write CSV rows as they are produced instead of at the end of a run
+
+    Rows go to <path>.part and are flushed one by one, so the partial file
+    can be read while the run is still going. close() fsyncs it and renames
+    it over <path> in one step, so readers only ever see the previous
+    complete file or the new one. An interrupted run leaves the previous
+    file untouched and the .part file behind.
+
+    row(item) maps each written item to a CSV row (default: the item as is).
+    key(item) enables de-duplication: items whose key was already written,
+    or whose key is None, are skipped.
+    """
+
+    def __init__(self, path, fieldnames, row=None, key=None, lineterminator='\r\n', encoding='utf-8'):
+        self.path = path
+        self.part_path = f"{path}.part"
+        self.fieldnames = fieldnames
+        self.row = row
+        self.key = key
+        self.seen = set()
+        self.rows_written = 0
+        self.file = open(self.part_path, 'w', newline='', encoding=encoding)
+        self.writer = csv.DictWriter(self.file, fieldnames=fieldnames, lineterminator=lineterminator)
+        self.writer.writeheader()
+        self.file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.file.close()
+        return False
+
+    @property
+    def closed(self):
+        return self.file.closed
+
+    def write(self, item):
+        """Append one item, returns False if it was skipped as a duplicate"""
+        if self.key:
+            key = self.key(item)
+            if key is None or key in self.seen:
+                return False
+            self.seen.add(key)
+
+        self.writer.writerow(self.row(item) if self.row else item)
+        self.file.flush()
+        self.rows_written += 1
+        return True
+
+    def write_many(self, items):
+        return sum(1 for item in items if self.write(item))
+
+    def close(self):
+        """Finalize: make the .part file durable and move it into place"""
+        if self.file.closed:
+            return
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        os.replace(self.part_path, self.path)
+
+    def close_partial(self):
+        """Make the .part file durable but leave the previous file at path, for a run that stopped early"""
+        if self.file.closed:
+            return
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+
+    def abort(self):
+        """Drop the partial file and keep whatever was at path before"""
+        if not self.file.closed:
+            self.file.close()
+        try:
+            os.remove(self.part_path)
+        except OSError:
+            pass
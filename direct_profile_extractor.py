@@ -1,46 +1,99 @@
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import time
-import csv
 import parameters
 from supabase import create_client, Client
-import uuid
 import re
 import random
+from incremental_sync import IncrementalSync, canonical_profile_url, stable_profile_id
+from search_result_parser import RESULT_CONTAINER_SELECTOR, page_card_keys, parse_search_results
+from page_waits import PageWaiter, logged_in, login_challenged
+from rate_limiter import RateLimiter
+from scroll_loader import InfiniteScrollLoader
+from crawl_frontier import CrawlFrontier
+from page_cache import PageCache
+from csv_sink import StreamingCSVWriter
+from parquet_export import SEARCH_RESULT_SCHEMA, ParquetSink, parquet_available
+from alumni_index import AlumniIndex
+from profile_dedup import ProfileDeduplicator
+from extraction_pipeline import ExtractionPipeline
+from fetch_scheduler import FetchScheduler, PageBudgetExhausted, default_scorers
+from browser_sessions import BrowserSessionPool, chrome_service
+
+RESULTS_CSV = "cit_alumni_with_real_profile_urls.csv"
+RESULTS_CSV_FIELDNAMES = ['name', 'headline', 'profile_url', 'location']
+RESULTS_PARQUET = "cit_alumni_with_real_profile_urls.parquet"
 
 class DirectProfileExtractor:
     def __init__(self):
         self.driver = None
+        self.sessions = None
+        self.login_ok = True
         self.supabase = None
         self.extracted_profiles = []
+        self.waiter = PageWaiter(getattr(parameters, 'WAIT_TIMEOUTS', None))
+        # Deliberate pacing between navigations, separate from readiness waits
+        self.rate_limiter = RateLimiter(getattr(parameters, 'REQUESTS_PER_MINUTE', 8))
+        self.page_cache = PageCache(
+            getattr(parameters, 'PAGE_CACHE_DIR', 'page_cache'),
+            ttl=getattr(parameters, 'PAGE_CACHE_TTL', 24 * 3600),
+            max_bytes=getattr(parameters, 'PAGE_CACHE_MAX_BYTES', 512 * 1024 * 1024),
+            offline=getattr(parameters, 'PARSE_ONLY', False)
+        )
+        
+        # Orders the cards of each result page and holds the run's page budget
+        self.scheduler = FetchScheduler(
+            default_scorers(self.page_cache),
+            budget=getattr(parameters, 'PAGE_BUDGET', None),
+            seed=getattr(parameters, 'SCHEDULER_SEED', 0),
+            jitter=getattr(parameters, 'SCHEDULER_JITTER', 0.0)
+        )
+        self.search_page_is_live = False
+        
+    def make_stealth_driver(self, profile_dir=None):
+        """Start Chrome with the stealth options, in a persistent profile directory if given"""
+        options = Options()
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-blink-features=AutomationControlled')
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        if profile_dir:
+            options.add_argument(f'--user-data-dir={profile_dir}')
         
+        service = chrome_service(getattr(parameters, 'SESSION_DIR', 'browser_sessions'))
+        driver = webdriver.Chrome(service=service, options=options)
+        
+        # Execute script to avoid detection
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        
+        # Explicit per-condition waits replace the global implicit wait
+        driver.implicitly_wait(0)
+        driver.set_page_load_timeout(30)
+        return driver
+    
+    def login_driver(self, driver):
+        """Session pool login hook, only called when no saved session is valid"""
+        self.driver = driver
+        self.login_ok = self.linkedin_login()
+    
     def setup_browser(self):
-        """Setup browser with enhanced stealth"""
+        """Setup browser with enhanced stealth, reusing the saved LinkedIn session when it is still valid"""
         try:
             print("🚀 Setting up stealth browser...")
             
-            options = Options()
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
-            
-            # Execute script to avoid detection
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            self.driver.implicitly_wait(10)
-            self.driver.set_page_load_timeout(30)
+            self.sessions = BrowserSessionPool(
+                self.make_stealth_driver,
+                login=self.login_driver,
+                directory=getattr(parameters, 'SESSION_DIR', 'browser_sessions'),
+                persistent_profiles=getattr(parameters, 'PERSISTENT_BROWSER_PROFILE', True)
+            )
+            self.driver = self.sessions.acquire()
             
             print("✅ Stealth browser setup complete")
             return True
@@ -64,10 +117,9 @@ class DirectProfileExtractor:
         """Login to LinkedIn with delay"""
         try:
             print("🔐 Logging into LinkedIn...")
+            self.rate_limiter.acquire()
             self.driver.get("https://www.linkedin.com/login")
-            
-            # Random delay to appear human-like
-            time.sleep(random.uniform(3, 6))
+            self.waiter.wait_for(self.driver, 'login_form')
             
             # Enter credentials slowly
             username_field = self.driver.find_element(By.ID, "username")
@@ -88,10 +140,11 @@ class DirectProfileExtractor:
             login_button.click()
             
             print("⏳ Waiting for login to complete...")
-            time.sleep(random.uniform(8, 12))
-            
-            current_url = self.driver.current_url
-            if "feed" in current_url or "mynetwork" in current_url or "/in/" in current_url:
+            self.waiter.wait_for(self.driver, 'login_done')
+            if login_challenged(self.driver):
+                print("❌ LinkedIn stopped the login at a security checkpoint, solve it in a normal browser first")
+                return False
+            elif logged_in(self.driver):
                 print("✅ LinkedIn login successful")
                 return True
             else:
@@ -105,82 +158,116 @@ class DirectProfileExtractor:
     def search_and_collect_profile_links(self, search_term):
         """Search and collect actual profile links"""
         try:
-            profiles = []
-            
-            # Navigate to people search
-            search_url = f"https://www.linkedin.com/search/results/people/?keywords={search_term.replace(' ', '%20')}"
-            print(f"🔍 Searching: {search_term}")
+            return list(self.iter_people_search(search_term, max_pages=1))
+        except Exception as e:
+            print(f"❌ Search error: {e}")
+            return []
+    
+    def fetch_search_page(self, search_term, page=1):
+        """page_source of one people-search result page, from the page cache or the browser"""
+        search_url = f"https://www.linkedin.com/search/results/people/?keywords={search_term.replace(' ', '%20')}"
+        if page > 1:
+            search_url += f"&page={page}"
+        
+        print(f"🔍 Searching: {search_term} (page {page})")
+        page_source = self.page_cache.get(search_url)
+        self.search_page_is_live = page_source is None
+        
+        if page_source is not None:
+            print("🗃️ Loaded from page cache")
+        elif self.page_cache.offline:
+            print("🗃️ Not in page cache, skipping (parse-only mode)")
+            return None
+        else:
+            if not self.scheduler.charge():
+                raise PageBudgetExhausted(f"page budget of {self.scheduler.budget} spent before '{search_term}' page {page}")
+            self.rate_limiter.acquire()
             self.driver.get(search_url)
-            
-            time.sleep(random.uniform(5, 8))
-            
-            # Scroll to load more results
-            for i in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(random.uniform(2, 4))
-            
-            # Find all profile containers
-            search_results = self.driver.find_elements(
-                By.CSS_SELECTOR, 
-                '.entity-result, .search-result, [data-view-name="search-entity-result-universal-template"]'
+            self.waiter.wait_for(self.driver, 'search_results')
+            
+            # Scroll until the page's results are loaded or the page stops growing
+            loader = InfiniteScrollLoader(
+                RESULT_CONTAINER_SELECTOR,
+                max_steps=getattr(parameters, 'MAX_SCROLL_STEPS', 10),
+                target_count=10,
+                waiter=self.waiter
             )
+            added = loader.load(self.driver)
+            print(f"📜 Scrolled {len(added)} times, results added per step: {added} ({loader.stop_reason})")
             
-            print(f"🔍 Found {len(search_results)} search results")
+            # Snapshot the page once, cache it and parse it in-process
+            page_source = self.driver.page_source
+            self.page_cache.put(search_url, page_source)
+        
+        return page_source
+    
+    def load_search_page(self, search_term, page=1):
+        """Open one people-search result page and return its parsed result cards"""
+        page_source = self.fetch_search_page(search_term, page)
+        if page_source is None:
+            return []
+        
+        search_results = parse_search_results(page_source)
+        print(f"🔍 Found {len(search_results)} search results")
+        return search_results
+    
+    def iter_people_search(self, search_term, max_results=None, max_pages=None, start_page=1, on_page_done=None):
+        """Yield CIT profiles page by page, loading the next page only when the consumer asks for more
+        
+        on_page_done(page) is called once every profile of a page has been consumed.
+        """
+        yielded = 0
+        page = start_page
+        previous_cards = None
+        
+        while max_pages is None or page <= max_pages:
+            search_results = self.load_search_page(search_term, page)
+            
+            if not search_results:
+                return
+            
+            # LinkedIn serves the last page again when asked for one past the end
+            page_cards = page_card_keys(search_results)
+            if page_cards == previous_cards:
+                return
+            previous_cards = page_cards
+            
+            # Most valuable cards first: those still missing a URL, likely alumni, recent graduates
+            order = self.scheduler.order(
+                (i, {**result['profile'], 'profile_url': result['profile_url'] or ''})
+                for i, result in enumerate(search_results) if result['cit_related']
+            )
+            order += [i for i, result in enumerate(search_results) if not result['cit_related']]
             
-            for i, result in enumerate(search_results[:10]):  # Process first 10 results
+            live_results = None
+            for i in order:
+                result = search_results[i]
                 try:
                     print(f"\n👤 Processing result {i+1}:")
                     
-                    # Get the result text
-                    result_text = result.text.strip()
-                    
                     # Check if this is CIT-related
-                    if not any(keyword in result_text.lower() for keyword in [
-                        'chennai institute of technology',
-                        'chennai institute technology',
-                        'cit chennai'
-                    ]):
+                    if not result['cit_related']:
                         print(f"   ❌ Not CIT-related, skipping")
                         continue
                     
                     # Extract profile information
-                    lines = [line.strip() for line in result_text.split('\n') if line.strip()]
-                    
-                    profile = {}
-                    
-                    # Find headline
-                    for line in lines:
-                        if any(keyword in line.lower() for keyword in [
-                            'chennai institute of technology',
-                            'chennai institute technology'
-                        ]):
-                            profile['headline'] = line
-                            print(f"   📝 Headline: {line}")
-                            break
-                    
-                    # Find name (usually the first non-"LinkedIn Member" line)
-                    for line in lines:
-                        if (line != "LinkedIn Member" and 
-                            line != profile.get('headline', '') and
-                            not any(keyword in line.lower() for keyword in [
-                                'connections', 'mutual', 'message', 'connect', 'view'
-                            ])):
-                            profile['name'] = line
-                            print(f"   👤 Name: {line}")
-                            break
-                    
-                    # Find location
-                    for line in lines:
-                        if any(loc in line.lower() for loc in [
-                            'coimbatore', 'chennai', 'tamil nadu', 'india'
-                        ]):
-                            if line != profile.get('headline', '') and line != profile.get('name', ''):
-                                profile['location'] = line
-                                print(f"   📍 Location: {line}")
-                                break
+                    profile = dict(result['profile'])
+                    if 'headline' in profile:
+                        print(f"   📝 Headline: {profile['headline']}")
+                    if 'name' in profile:
+                        print(f"   👤 Name: {profile['name']}")
+                    if 'location' in profile:
+                        print(f"   📍 Location: {profile['location']}")
                     
                     # Now try to extract the actual profile URL
-                    profile_url = self.extract_profile_url_from_result(result)
+                    profile_url = result['profile_url']
+                    if not profile_url and self.search_page_is_live:
+                        # No /in/ link in the markup, fall back to the live element (click-through)
+                        if live_results is None:
+                            live_results = self.driver.find_elements(By.CSS_SELECTOR, RESULT_CONTAINER_SELECTOR)
+                        if i < len(live_results):
+                            profile_url = self.extract_profile_url_from_result(live_results[i])
+                    
                     if profile_url:
                         profile['profile_url'] = profile_url
                         print(f"   🔗 Real URL: {profile_url}")
@@ -188,22 +275,22 @@ class DirectProfileExtractor:
                         profile['profile_url'] = ""
                         print(f"   ⚠️ No real URL found")
                     
-                    if 'headline' in profile:
-                        profiles.append(profile)
-                        print(f"   ✅ Profile added")
-                    
-                    # Random delay between results
-                    time.sleep(random.uniform(1, 3))
+                    if 'headline' not in profile:
+                        continue
                     
                 except Exception as e:
                     print(f"   ❌ Error processing result {i+1}: {e}")
                     continue
-            
-            return profiles
-            
-        except Exception as e:
-            print(f"❌ Search error: {e}")
-            return []
+                
+                print(f"   ✅ Profile added")
+                yield profile
+                yielded += 1
+                if max_results and yielded >= max_results:
+                    return
+            
+            if on_page_done:
+                on_page_done(page)
+            page += 1
     
     def extract_profile_url_from_result(self, result_element):
         """Extract actual profile URL from a search result"""
@@ -246,8 +333,12 @@ class DirectProfileExtractor:
                     current_url = self.driver.current_url
                     
                     # Click the link
+                    if not self.scheduler.charge():
+                        print(f"   🛑 Page budget spent, no click-through")
+                        return None
+                    self.rate_limiter.acquire()
                     self.driver.execute_script("arguments[0].click();", main_link)
-                    time.sleep(random.uniform(3, 5))
+                    self.waiter.wait_for(self.driver, 'profile_page')
                     
                     # Check if we're on a profile page
                     new_url = self.driver.current_url
@@ -260,19 +351,19 @@ class DirectProfileExtractor:
                             
                             # Go back to search results
                             self.driver.back()
-                            time.sleep(random.uniform(2, 4))
+                            self.waiter.wait_for(self.driver, 'search_results')
                             
                             return clean_url
                     
                     # Go back if we didn't find a profile
                     self.driver.back()
-                    time.sleep(random.uniform(2, 4))
+                    self.waiter.wait_for(self.driver, 'search_results')
                     
             except Exception as nav_error:
                 print(f"   ⚠️ Navigation method failed: {nav_error}")
                 try:
                     self.driver.back()
-                    time.sleep(2)
+                    self.waiter.wait_for(self.driver, 'search_results')
                 except:
                     pass
             
@@ -282,73 +373,110 @@ class DirectProfileExtractor:
             print(f"   ⚠️ URL extraction error: {e}")
             return None
     
-    def save_enhanced_results(self, all_profiles):
-        """Save results with real LinkedIn URLs"""
+    @staticmethod
+    def dedupe_key(profile):
+        """Duplicate check for saved results: the profile URL, or the name when there is no URL"""
+        profile_url = profile.get('profile_url', '').strip()
+        if profile_url:
+            return ('url', profile_url)
+        name = profile.get('name', '').strip()
+        return ('name', name) if name else None
+    
+    @staticmethod
+    def csv_row(profile):
+        return {
+            'name': profile.get('name', profile.get('headline', 'Unknown')),
+            'headline': profile.get('headline', ''),
+            'profile_url': profile.get('profile_url', ''),
+            'location': profile.get('location', '')
+        }
+    
+    @staticmethod
+    def supabase_row(profile):
+        supabase_data = {
+            'profile_id': stable_profile_id(profile),
+            'name': profile.get('name', profile.get('headline', 'Unknown'))[:100],
+            'profile_url': profile.get('profile_url', '')[:500]
+        }
+        
+        if profile.get('location'):
+            supabase_data['location'] = profile['location'][:100]
+        
+        if profile.get('headline'):
+            supabase_data['about'] = profile['headline'][:200]
+        
+        return supabase_data
+    
+    def open_results_csv(self):
+        """Streaming sink for the results CSV, skipping duplicate profiles"""
+        return StreamingCSVWriter(RESULTS_CSV, RESULTS_CSV_FIELDNAMES, row=self.csv_row, key=self.dedupe_key)
+    
+    def unique_profiles(self, profiles):
+        seen = set()
+        unique = []
+        for profile in profiles:
+            key = self.dedupe_key(profile)
+            if key is not None and key not in seen:
+                seen.add(key)
+                unique.append(profile)
+        return unique
+    
+    def save_enhanced_results(self, all_profiles, csv_sink=None):
+        """Save results with real LinkedIn URLs
+        
+        With a csv_sink that already received the profiles while they were
+        extracted, the CSV is only finalized here instead of being rewritten.
+        Fuzzy de-duplication (parameters.FUZZY_DEDUP) is opt-in; when it
+        merges near-duplicates the streamed CSV is replaced by the merged
+        rows, and the log says so.
+        """
         try:
-            # Remove duplicates
-            unique_profiles = []
-            seen_urls = set()
-            seen_names = set()
-            
-            for profile in all_profiles:
-                profile_url = profile.get('profile_url', '').strip()
-                name = profile.get('name', '').strip()
-                
-                if profile_url and profile_url not in seen_urls:
-                    seen_urls.add(profile_url)
-                    unique_profiles.append(profile)
-                elif not profile_url and name and name not in seen_names:
-                    seen_names.add(name)
-                    unique_profiles.append(profile)
+            unique_profiles = self.unique_profiles(all_profiles)
+            if getattr(parameters, 'FUZZY_DEDUP', False):
+                deduplicator = ProfileDeduplicator()
+                merged_profiles = deduplicator.dedupe(unique_profiles)
+                deduplicator.report()
+                if deduplicator.merged_count:
+                    unique_profiles = merged_profiles
+                    if csv_sink is not None:
+                        csv_sink.abort()
+                        print(f"🔀 Rewriting {RESULTS_CSV} with the merged profiles instead of the streamed rows")
+                    csv_sink = StreamingCSVWriter(RESULTS_CSV, RESULTS_CSV_FIELDNAMES, row=self.csv_row)
+                    csv_sink.write_many(unique_profiles)
             
             # Save to CSV
-            filename = "cit_alumni_with_real_profile_urls.csv"
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['name', 'headline', 'profile_url', 'location']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for profile in unique_profiles:
-                    writer.writerow({
-                        'name': profile.get('name', profile.get('headline', 'Unknown')),
-                        'headline': profile.get('headline', ''),
-                        'profile_url': profile.get('profile_url', ''),
-                        'location': profile.get('location', '')
-                    })
+            if csv_sink is None:
+                csv_sink = self.open_results_csv()
+                csv_sink.write_many(unique_profiles)
+            csv_sink.close()
             
-            print(f"💾 Saved {len(unique_profiles)} unique profiles to {filename}")
+            print(f"💾 Saved {len(unique_profiles)} unique profiles to {RESULTS_CSV}")
             
-            # Save to Supabase
-            if self.supabase:
-                print("🗄️ Clearing existing data...")
-                try:
-                    self.supabase.table(parameters.SUPABASE_TABLE).delete().neq('id', '00000000-0000-0000-0000-000000000000').execute()
-                except:
-                    pass
-                
-                saved_count = 0
-                for profile in unique_profiles:
+            if getattr(parameters, 'EXPORT_PARQUET', False):
+                if parquet_available():
                     try:
-                        supabase_data = {
-                            'profile_id': str(uuid.uuid4()),
-                            'name': profile.get('name', profile.get('headline', 'Unknown'))[:100],
-                            'profile_url': profile.get('profile_url', '')[:500]
-                        }
-                        
-                        if profile.get('location'):
-                            supabase_data['location'] = profile['location'][:100]
-                        
-                        if profile.get('headline'):
-                            supabase_data['about'] = profile['headline'][:200]
-                        
-                        result = self.supabase.table(parameters.SUPABASE_TABLE).insert(supabase_data).execute()
-                        if result.data:
-                            saved_count += 1
-                            
+                        with ParquetSink(RESULTS_PARQUET, SEARCH_RESULT_SCHEMA, row=self.csv_row) as parquet_sink:
+                            parquet_sink.write_many(unique_profiles)
+                        print(f"💾 Saved {parquet_sink.rows_written} profiles to {RESULTS_PARQUET}")
                     except Exception as e:
-                        print(f"⚠️ Error saving profile to database: {e}")
-                        continue
+                        print(f"❌ Parquet export error: {e}")
+                else:
+                    print("⚠️ EXPORT_PARQUET is set but pyarrow is not installed, skipping the Parquet export")
+            
+            # Save to Supabase
+            if self.supabase:
+                rows = [self.supabase_row(profile) for profile in unique_profiles]
                 
+                sync = IncrementalSync(
+                    self.supabase,
+                    parameters.SUPABASE_TABLE,
+                    batch_size=getattr(parameters, 'SUPABASE_BATCH_SIZE', 500)
+                )
+                if getattr(parameters, 'SUPABASE_SYNC_MODE', 'incremental') == 'replace':
+                    saved_count = sync.replace(rows)
+                else:
+                    saved_count = sync.sync(rows)
+
                 print(f"🗄️ Saved {saved_count} profiles to Supabase")
             
             return unique_profiles
@@ -357,24 +485,53 @@ class DirectProfileExtractor:
             print(f"❌ Save error: {e}")
             return []
     
+    @staticmethod
+    def profile_key(profile):
+        """Frontier key for a profile: its canonical URL, or its name when there is no URL"""
+        return canonical_profile_url(profile.get('profile_url', '')) or f"name:{profile.get('name', '')}"
+    
+    def run_search_pipeline(self, search_queries, frontier, csv_sink, alumni_index=None):
+        """Run the searches through ExtractionPipeline, committing profiles to the frontier and sinks"""
+        def sink(profiles):
+            csv_sink.write_many(profiles)
+            if alumni_index:
+                alumni_index.upsert(profiles)
+        
+        pipeline = ExtractionPipeline(
+            self.fetch_search_page,
+            sink=sink,
+            queries=search_queries,
+            max_pages=getattr(parameters, 'SEARCH_MAX_PAGES', None),
+            max_results=getattr(parameters, 'SEARCH_MAX_RESULTS', None),
+            query_concurrency=getattr(parameters, 'PIPELINE_QUERY_CONCURRENCY', 3),
+            fetch_concurrency=1,  # One logged-in browser
+            parse_concurrency=getattr(parameters, 'PIPELINE_PARSE_CONCURRENCY', 2),
+            frontier=frontier
+        )
+        profiles = pipeline.run()
+        print(f"✅ Pipeline collected {len(profiles)} new profiles")
+        pipeline.report()
+        return profiles
+    
     def run_direct_extraction(self):
         """Run direct profile extraction with real URLs"""
         try:
             print("🎯 CIT Alumni Direct Profile URL Extractor")
             print("=" * 55)
             
-            if not self.setup_browser():
-                return []
+            if self.page_cache.offline:
+                print("🗃️ Parse-only mode: extracting from the page cache, no browser")
+            else:
+                if not self.setup_browser():
+                    return []
             
             self.setup_supabase()
             
-            if not self.linkedin_login():
+            # Logging in happened in setup_browser, and only if the saved session had expired
+            if not self.page_cache.offline and not self.login_ok:
                 print("⚠️ Login failed, stopping...")
                 return []
             
-            # Wait after login
-            time.sleep(random.uniform(3, 6))
-            
             # Search queries for comprehensive results
             search_queries = [
                 "Chennai Institute of Technology student",
@@ -384,27 +541,84 @@ class DirectProfileExtractor:
                 "Chennai Institute Technology faculty"
             ]
             
-            all_profiles = []
+            # Resume from the frontier of an interrupted run, if there is one
+            frontier = CrawlFrontier(getattr(parameters, 'FRONTIER_PATH', 'crawl_frontier.db'))
+            if frontier.counts():
+                frontier.recover()
+                print("♻️ Resuming previous run")
+                frontier.report()
+            frontier.add_many('query', [(query, None) for query in search_queries])
+            
+            # Rows are appended to the .part CSV as profiles come in, starting
+            # with the ones an interrupted run already committed
+            csv_sink = self.open_results_csv()
+            csv_sink.write_many(frontier.iter_results('profile'))
+            
+            # Optional local query index, kept current profile by profile
+            index_path = getattr(parameters, 'ALUMNI_INDEX_PATH', None)
+            alumni_index = AlumniIndex(index_path) if index_path else None
+            
+            # Pipelined run: pages of different queries overlap with parsing and
+            # writing; queries it could not finish are retried one by one below
+            if getattr(parameters, 'PIPELINE', False):
+                self.run_search_pipeline(search_queries, frontier, csv_sink, alumni_index)
             
             for query in search_queries:
+                if frontier.is_done('query', query):
+                    print(f"⏭️ Already finished: {query}")
+                    continue
+                
                 try:
-                    profiles = self.search_and_collect_profile_links(query)
-                    if profiles:
-                        all_profiles.extend(profiles)
-                        print(f"✅ Found {len(profiles)} profiles for: {query}")
+                    frontier.claim('query', query)
+                    start_page = 1
+                    while frontier.is_done('page', f"{query}|{start_page}"):
+                        start_page += 1
+                    
+                    found = 0
+                    for profile in self.iter_people_search(
+                        query,
+                        max_results=getattr(parameters, 'SEARCH_MAX_RESULTS', None),
+                        max_pages=getattr(parameters, 'SEARCH_MAX_PAGES', None),
+                        start_page=start_page,
+                        on_page_done=lambda page: frontier.complete('page', f"{query}|{page}")
+                    ):
+                        # Commit every profile as soon as it is produced
+                        key = self.profile_key(profile)
+                        if frontier.is_done('profile', key):
+                            continue
+                        frontier.complete('profile', key, profile)
+                        csv_sink.write(profile)
+                        if alumni_index:
+                            alumni_index.upsert([profile])
+                        found += 1
+                    frontier.complete('query', query)
+                    
+                    if found:
+                        print(f"✅ Found {found} profiles for: {query}")
                     else:
                         print(f"❌ No profiles found for: {query}")
                     
-                    # Delay between searches
-                    time.sleep(random.uniform(5, 10))
-                    
+                except PageBudgetExhausted as e:
+                    # The query stays in flight and is resumed by the next run
+                    print(f"🛑 {e}")
+                    break
                 except Exception as e:
+                    frontier.fail('query', query, e)
                     print(f"❌ Error with query '{query}': {e}")
                     continue
             
+            all_profiles = frontier.results('profile')
+            if alumni_index:
+                alumni_index.report()
+                alumni_index.close()
+            
             # Process and save results
             if all_profiles:
-                unique_profiles = self.save_enhanced_results(all_profiles)
+                unique_profiles = self.save_enhanced_results(all_profiles, csv_sink)
+                
+                # Everything is saved, the next run starts from scratch
+                if unique_profiles and frontier.counts().get('query', {}).get('done') == len(search_queries):
+                    frontier.reset()
                 
                 print(f"\n📊 FINAL RESULTS:")
                 print(f"✅ Collected {len(unique_profiles)} unique CIT alumni")
@@ -432,6 +646,7 @@ class DirectProfileExtractor:
                 return unique_profiles
                 
             else:
+                csv_sink.abort()
                 print("\n😞 No profiles collected")
                 return []
                 
@@ -439,10 +654,14 @@ class DirectProfileExtractor:
             print(f"❌ Extraction error: {e}")
             return []
         finally:
-            if self.driver:
+            self.waiter.report()
+            self.page_cache.report()
+            self.scheduler.report()
+            if self.sessions:
+                self.sessions.report()
                 try:
-                    self.driver.quit()
-                    print("🧹 Browser closed")
+                    self.sessions.close()
+                    print("🧹 Browser closed, session saved")
                 except:
                     pass
 
@@ -0,0 +1,295 @@
+import asyncio
+import time
+from incremental_sync import canonical_profile_url
+from search_result_parser import page_card_keys, parse_search_results, search_profile
+
+DONE = object()
+
+
+def profile_key(profile):
+    """Dedup key for a profile: its canonical URL, or its name when there is no URL"""
+    return canonical_profile_url(profile.get('profile_url', '')) or f"name:{profile.get('name', '')}"
+
+
+class StageMetrics:
+    """Items in and out, busy time and queue depth of one pipeline stage"""
+
+    def __init__(self, name, concurrency):
+        self.name = name
+        self.concurrency = concurrency
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.busy = 0.0
+        self.started = None
+        self.finished = None
+        self.depth_samples = 0
+        self.depth_total = 0
+        self.depth_max = 0
+
+    def sample_depth(self, depth):
+        self.depth_samples += 1
+        self.depth_total += depth
+        self.depth_max = max(self.depth_max, depth)
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def throughput(self):
+        return self.items_out / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def utilization(self):
+        return self.busy / (self.elapsed * self.concurrency) if self.elapsed else 0.0
+
+    @property
+    def average_depth(self):
+        return self.depth_total / self.depth_samples if self.depth_samples else 0.0
+
+
+class ExtractionPipeline:
+    """search -> fetch -> parse -> dedup -> sink as asyncio stages joined by bounded queues
+
+    Every query runs as its own task that asks for one result page at a time
+    and waits until that page is parsed before asking for the next, so a
+    query stops as soon as its results run out and its pages stay in order.
+    Pages of different queries overlap: while one page loads, others are
+    parsed and earlier profiles are written out. Blocking work (browser,
+    lxml, database) runs in worker threads, each stage has its own
+    concurrency limit, and a full queue makes the stage before it wait.
+
+    fetch_page(query, page) returns the page_source of one result page (or
+    None), sink(profiles) persists a batch of new profiles. With a frontier,
+    finished queries and pages are skipped and every committed profile is
+    recorded, as in the sequential run.
+    """
+
+    def __init__(self, fetch_page, sink=None, queries=(), max_pages=None, max_results=None,
+                 query_concurrency=3, fetch_concurrency=1, parse_concurrency=2, sink_batch_size=50,
+                 queue_size=8, frontier=None, sample_interval=0.05):
+        self.fetch_page = fetch_page
+        self.sink = sink
+        self.queries = list(queries)
+        self.max_pages = max_pages
+        self.max_results = max_results
+        self.query_concurrency = max(1, int(query_concurrency))
+        self.fetch_concurrency = max(1, int(fetch_concurrency))
+        self.parse_concurrency = max(1, int(parse_concurrency))
+        self.sink_batch_size = max(1, int(sink_batch_size))
+        self.queue_size = queue_size
+        self.frontier = frontier
+        self.sample_interval = sample_interval
+        self.metrics = {
+            'query': StageMetrics('query', self.query_concurrency),
+            'fetch': StageMetrics('fetch', self.fetch_concurrency),
+            'parse': StageMetrics('parse', self.parse_concurrency),
+            'dedup': StageMetrics('dedup', 1),
+            'sink': StageMetrics('sink', 1)
+        }
+        self.profiles = []
+        self.failed_queries = {}
+
+    def run(self):
+        """Run the whole pipeline and return the new unique profiles in the order they were saved"""
+        return asyncio.run(self.run_async())
+
+    async def run_async(self):
+        self.fetch_queue = asyncio.Queue(self.queue_size)
+        self.parse_queue = asyncio.Queue(self.queue_size)
+        self.dedup_queue = asyncio.Queue(self.queue_size * 10)
+        self.sink_queue = asyncio.Queue(self.sink_batch_size * 4)
+        self.page_parsed = {}
+        self.seen = set()
+
+        started = time.monotonic()
+        for metrics in self.metrics.values():
+            metrics.started = started
+        sampler = asyncio.create_task(self._sample_queues())
+
+        query_slots = asyncio.Semaphore(self.query_concurrency)
+        queries = asyncio.gather(*(self._query(query, query_slots) for query in self.queries))
+        fetchers = asyncio.gather(*(self._fetch() for _ in range(self.fetch_concurrency)))
+        parsers = asyncio.gather(*(self._parse() for _ in range(self.parse_concurrency)))
+        dedup = asyncio.create_task(self._dedup())
+        sink = asyncio.create_task(self._sink())
+
+        # Shut the stages down in order, each once the one before it has drained
+        await self._finish(queries, self.fetch_queue, self.fetch_concurrency, 'query')
+        await self._finish(fetchers, self.parse_queue, self.parse_concurrency, 'fetch')
+        await self._finish(parsers, self.dedup_queue, 1, 'parse')
+        await self._finish(dedup, self.sink_queue, 1, 'dedup')
+        await sink
+        self.metrics['sink'].finished = time.monotonic()
+
+        sampler.cancel()
+        return self.profiles
+
+    async def _finish(self, stage, next_queue, consumers, name):
+        await stage
+        self.metrics[name].finished = time.monotonic()
+        for _ in range(consumers):
+            await next_queue.put(DONE)
+
+    async def _sample_queues(self):
+        queues = {'fetch': self.fetch_queue, 'parse': self.parse_queue, 'dedup': self.dedup_queue, 'sink': self.sink_queue}
+        while True:
+            for name, queue in queues.items():
+                self.metrics[name].sample_depth(queue.qsize())
+            await asyncio.sleep(self.sample_interval)
+
+    async def _call(self, name, function, *args):
+        """Run blocking work in a thread and count its time against the stage"""
+        started = time.monotonic()
+        try:
+            return await asyncio.to_thread(function, *args)
+        finally:
+            self.metrics[name].busy += time.monotonic() - started
+
+    async def _query(self, query, slots):
+        """Ask for the pages of one query one at a time until it is exhausted"""
+        if self.frontier and self.frontier.is_done('query', query):
+            print(f"⏭️ Already finished: {query}")
+            return
+
+        async with slots:
+            metrics = self.metrics['query']
+            metrics.items_in += 1
+            if self.frontier:
+                self.frontier.claim('query', query)
+
+            page = 1
+            while self.frontier and self.frontier.is_done('page', f"{query}|{page}"):
+                page += 1
+
+            state = {'found': 0, 'previous_cards': None}
+            while self.max_pages is None or page <= self.max_pages:
+                parsed = asyncio.get_running_loop().create_future()
+                self.page_parsed[(query, page)] = parsed
+                await self.fetch_queue.put((query, page, state))
+                metrics.items_out += 1
+                if not await parsed:
+                    break
+                page += 1
+
+            if query not in self.failed_queries:
+                # Marks the query done once its last profiles have passed dedup
+                await self.dedup_queue.put(('query_done', query))
+
+    async def _fetch(self):
+        metrics = self.metrics['fetch']
+        while True:
+            item = await self.fetch_queue.get()
+            if item is DONE:
+                return
+            query, page, state = item
+            metrics.items_in += 1
+            try:
+                page_source = await self._call('fetch', self.fetch_page, query, page)
+            except Exception as e:
+                metrics.errors += 1
+                self._fail_query(query, e)
+                self.page_parsed.pop((query, page)).set_result(False)
+                continue
+            metrics.items_out += 1
+            await self.parse_queue.put((query, page, state, page_source))
+
+    async def _parse(self):
+        metrics = self.metrics['parse']
+        while True:
+            item = await self.parse_queue.get()
+            if item is DONE:
+                return
+            query, page, state, page_source = item
+            metrics.items_in += 1
+            more = False
+            try:
+                search_results = await self._call('parse', parse_search_results, page_source)
+                page_cards = page_card_keys(search_results)
+
+                # An empty page or the last page served again ends the query
+                if search_results and page_cards != state['previous_cards']:
+                    state['previous_cards'] = page_cards
+                    more = True
+                    for result in search_results:
+                        profile = search_profile(result)
+                        if profile is None:
+                            continue
+                        await self.dedup_queue.put(('profile', query, profile))
+                        metrics.items_out += 1
+                        state['found'] += 1
+                        if self.max_results and state['found'] >= self.max_results:
+                            more = False
+                            break
+                    await self.dedup_queue.put(('page_done', query, page))
+            except Exception as e:
+                metrics.errors += 1
+                self._fail_query(query, e)
+                more = False
+            self.page_parsed.pop((query, page)).set_result(more)
+
+    def _fail_query(self, query, error):
+        self.failed_queries[query] = str(error)
+        print(f"❌ Error with query '{query}': {error}")
+        if self.frontier:
+            self.frontier.fail('query', query, error)
+
+    async def _dedup(self):
+        """Drop profiles already seen in this run or committed by an earlier one"""
+        metrics = self.metrics['dedup']
+        while True:
+            item = await self.dedup_queue.get()
+            if item is DONE:
+                return
+            kind = item[0]
+            if kind == 'page_done':
+                if self.frontier:
+                    self.frontier.complete('page', f"{item[1]}|{item[2]}")
+                continue
+            if kind == 'query_done':
+                if self.frontier:
+                    self.frontier.complete('query', item[1])
+                continue
+
+            metrics.items_in += 1
+            profile = item[2]
+            key = profile_key(profile)
+            if key in self.seen or (self.frontier and self.frontier.is_done('profile', key)):
+                continue
+            self.seen.add(key)
+            if self.frontier:
+                self.frontier.complete('profile', key, profile)
+            metrics.items_out += 1
+            await self.sink_queue.put(profile)
+
+    async def _sink(self):
+        """Persist profiles in batches; the next batch fills up while one is written"""
+        metrics = self.metrics['sink']
+        batch = []
+        while True:
+            item = await self.sink_queue.get()
+            if item is not DONE:
+                metrics.items_in += 1
+                batch.append(item)
+            if batch and (item is DONE or len(batch) >= self.sink_batch_size or self.sink_queue.empty()):
+                try:
+                    if self.sink:
+                        await self._call('sink', self.sink, batch)
+                    self.profiles.extend(batch)
+                    metrics.items_out += len(batch)
+                except Exception as e:
+                    metrics.errors += 1
+                    print(f"❌ Sink error: {e}")
+                batch = []
+            if item is DONE:
+                return
+
+    def report(self):
+        print(f"{'stage':<8}{'workers':>8}{'in':>7}{'out':>7}{'errors':>8}{'items/s':>9}{'busy':>7}{'queue avg':>11}{'max':>5}")
+        for name, metrics in self.metrics.items():
+            queue = f"{metrics.average_depth:>11.1f}{metrics.depth_max:>5}" if name != 'query' else f"{'':>11}{'':>5}"
+            print(f"{name:<8}{metrics.concurrency:>8}{metrics.items_in:>7}{metrics.items_out:>7}{metrics.errors:>8}"
+                  f"{metrics.throughput:>9.1f}{metrics.utilization:>7.0%}{queue}")
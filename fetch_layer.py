@@ -0,0 +1,277 @@
+import os
+import re
+import threading
+import time
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401, only needed so httpx can negotiate HTTP/2
+except ImportError:
+    h2 = None
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9'
+}
+
+
+def http_available():
+    return httpx is not None
+
+
+def process_tree_cpu(pid):
+    """CPU seconds used so far by pid and every process below it (Linux /proc, 0.0 elsewhere)"""
+    if not pid or not os.path.isdir('/proc'):
+        return 0.0
+    stats = {}
+    for entry in os.listdir('/proc'):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    # Fields after the command name: state, ppid, ..., utime (12th), stime (13th)
+                    stats[int(entry)] = f.read().rsplit(')', 1)[1].split()
+            except OSError:
+                pass
+    tree, found = {pid}, [pid] if pid in stats else []
+    while True:
+        children = [child for child, fields in stats.items() if int(fields[1]) in tree and child not in tree]
+        if not children:
+            break
+        tree.update(children)
+        found += children
+    return sum(int(stats[p][11]) + int(stats[p][12]) for p in found) / os.sysconf('SC_CLK_TCK')
+
+
+def driver_pid(driver):
+    """chromedriver's pid, whose process tree holds the browser; None when the driver does not say"""
+    try:
+        return driver.service.process.pid
+    except AttributeError:
+        return None
+
+
+class BackendStats:
+    """Requests, failures, wall and CPU time and bytes of one backend"""
+
+    def __init__(self, name):
+        self.name = name
+        self.requests = 0
+        self.failures = 0
+        self.seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.bytes = 0
+
+    def record(self, seconds, cpu_seconds, page_source):
+        self.requests += 1
+        self.seconds += seconds
+        self.cpu_seconds += cpu_seconds
+        if page_source is None:
+            self.failures += 1
+        else:
+            self.bytes += len(page_source.encode('utf-8'))
+
+
+class HttpBackend:
+    """Plain GETs over a pooled keep-alive client, HTTP/2 when the server and the h2 package allow it
+
+    cookies is a list of cookie dicts as browsers report them (name, value,
+    domain, path), e.g. BrowserSessionPool.saved_cookies(), so requests go
+    out with the browser's session. A response that is not 200 counts as
+    missing (None).
+    """
+
+    name = 'http'
+
+    def __init__(self, timeout=15, http2=None, max_connections=10, headers=None, cookies=None):
+        if not http_available():
+            raise RuntimeError("httpx is not installed")
+        self.http2 = (h2 is not None) if http2 is None else http2
+        self.client = httpx.Client(
+            http2=self.http2,
+            timeout=timeout,
+            headers=dict(DEFAULT_HEADERS, **(headers or {})),
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            follow_redirects=True
+        )
+        for cookie in cookies or []:
+            self.client.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''),
+                                    path=cookie.get('path', '/'))
+
+    def fetch(self, url, wait_for=None):
+        response = self.client.get(url)
+        if response.status_code != 200:
+            return None
+        return response.text
+
+    def close(self):
+        self.client.close()
+
+
+class BrowserBackend:
+    """Full Chrome navigation, borrowing a driver from a BrowserSessionPool for each page
+
+    wait_for names a page_waits condition to wait for after the load
+    (document_ready when not given). A page that gets no browser within
+    session_timeout seconds fails instead of waiting forever. The CPU the
+    borrowed browser's processes spent on the page is kept per thread for
+    last_process_cpu(), since it is not part of this process's CPU time.
+    """
+
+    name = 'browser'
+
+    def __init__(self, session_pool, waiter=None, session_timeout=120):
+        from page_waits import default_waiter
+
+        self.session_pool = session_pool
+        self.session_timeout = session_timeout
+        self.waiter = waiter or default_waiter
+        self.local = threading.local()
+
+    def fetch(self, url, wait_for=None):
+        self.local.process_cpu = 0.0
+        with self.session_pool.borrow(self.session_timeout) as driver:
+            pid = driver_pid(driver)
+            started_cpu = process_tree_cpu(pid)
+            try:
+                driver.get(url)
+                self.waiter.wait_for(driver, wait_for or 'document_ready')
+                return driver.page_source
+            finally:
+                self.local.process_cpu = process_tree_cpu(pid) - started_cpu
+
+    def last_process_cpu(self):
+        return getattr(self.local, 'process_cpu', 0.0)
+
+    def close(self):
+        pass
+
+
+class Route:
+    """Which backend serves URLs matching pattern
+
+    markers are substrings a lightweight response must all contain to be
+    used; without them the page is fetched again through the fallback
+    backend (the page is probably rendered by JavaScript, or a login or
+    consent wall came back instead). wait_for is the page_waits condition
+    for the browser.
+    """
+
+    def __init__(self, pattern, backend='http', markers=(), fallback='browser', wait_for=None):
+        self.pattern = re.compile(pattern)
+        self.backend = backend
+        self.markers = list(markers)
+        self.fallback = fallback
+        self.wait_for = wait_for
+        self.fallbacks = 0
+
+    def matches(self, url):
+        return self.pattern.search(url) is not None
+
+    def accepts(self, page_source):
+        return page_source is not None and all(marker in page_source for marker in self.markers)
+
+
+class Fetcher:
+    """One fetch_page(url) for every extractor, routed per URL pattern between backends
+
+    The first route whose pattern matches the URL picks the backend; URLs
+    no route matches go to default. A route's response that is missing its
+    markers is fetched again through the route's fallback, and when the
+    chosen backend is not configured (no HTTP client) the fallback is used
+    directly. Per-backend requests, time, CPU and bytes are kept for
+    report(); CPU includes the browser's own processes for backends that
+    report them (last_process_cpu). Thread-safe as long as the backends are.
+
+    Only extractors that need a page's HTML use it (the profile resolver).
+    The profile workers and the search extractor keep driving their
+    browser directly: they read the live page with execute_script, scroll
+    it and click through results, which a page_source fetch cannot do.
+    """
+
+    def __init__(self, backends, routes=(), default='browser'):
+        self.backends = dict(backends)
+        self.routes = list(routes)
+        self.default = default
+        self.stats = {name: BackendStats(name) for name in self.backends}
+        self.lock = threading.Lock()
+
+    def route(self, url):
+        for route in self.routes:
+            if route.matches(url):
+                return route
+        return None
+
+    def _fetch(self, backend, url, wait_for=None):
+        started, started_cpu = time.perf_counter(), time.thread_time()
+        try:
+            page_source = self.backends[backend].fetch(url, wait_for)
+        except Exception as e:
+            print(f"⚠️ {backend} fetch failed for {url}: {e}")
+            page_source = None
+        cpu_seconds = time.thread_time() - started_cpu
+        if hasattr(self.backends[backend], 'last_process_cpu'):
+            cpu_seconds += self.backends[backend].last_process_cpu()
+        with self.lock:
+            self.stats[backend].record(time.perf_counter() - started, cpu_seconds, page_source)
+        return page_source
+
+    def fetch(self, url):
+        """page_source of url, or None when every backend tried came back empty"""
+        route = self.route(url)
+        if route is None:
+            return self._fetch(self.default, url)
+
+        backend = route.backend if route.backend in self.backends else route.fallback
+        page_source = self._fetch(backend, url, route.wait_for)
+        if backend != route.fallback and not route.accepts(page_source) and route.fallback in self.backends:
+            with self.lock:
+                route.fallbacks += 1
+            page_source = self._fetch(route.fallback, url, route.wait_for)
+        return page_source
+
+    __call__ = fetch
+
+    def close(self):
+        for backend in self.backends.values():
+            backend.close()
+
+    def report(self):
+        print(f"🚚 Fetch layer: {sum(stats.requests for stats in self.stats.values())} requests")
+        for stats in self.stats.values():
+            if not stats.requests:
+                continue
+            print(f"   {stats.name}: {stats.requests} requests, {stats.failures} empty, "
+                  f"{stats.seconds / stats.requests * 1000:.0f}ms and {stats.cpu_seconds / stats.requests * 1000:.1f}ms CPU each, "
+                  f"{stats.bytes // max(1, stats.requests - stats.failures)} bytes per page")
+        for route in self.routes:
+            if route.fallbacks:
+                print(f"   ↩️ {route.pattern.pattern}: {route.fallbacks} responses without markers went to {route.fallback}")
+
+
+def default_routes():
+    """Google result pages are static HTML and go over HTTP; LinkedIn renders its pages client-side,
+    so they go straight to the browser, one request per page against the rate budget
+    """
+    return [
+        Route(r'^https?://(www\.)?google\.[a-z.]+/search', 'http', markers=['linkedin.com/in/']),
+        Route(r'linkedin\.com/search/results/', 'browser', wait_for='search_results'),
+        Route(r'linkedin\.com/in/', 'browser', wait_for='profile_h1')
+    ]
+
+
+def default_fetcher(session_pool, http=True, waiter=None):
+    """Fetcher with the default routes over a BrowserSessionPool
+
+    With http (and httpx installed) Google pages go over HTTP, without the
+    LinkedIn session cookies; otherwise every page goes through the pool's
+    browsers.
+    """
+    backends = {'browser': BrowserBackend(session_pool, waiter)}
+    if http and http_available():
+        backends['http'] = HttpBackend()
+    return Fetcher(backends, default_routes())
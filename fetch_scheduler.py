@@ -0,0 +1,177 @@
+import heapq
+import itertools
+import random
+import threading
+from incremental_sync import canonical_profile_url
+from profile_prefilter import ALUMNI_PATTERN, likely_grad_year, role_category, stated_grad_year
+from result_classifier import default_classifier
+
+
+class PageBudgetExhausted(Exception):
+    """Raised when a run has used up its page budget"""
+
+
+# Scorers take a candidate dict (profile URL plus whatever card data is known)
+# and return (points, reason) or None. The factories below bind run settings.
+
+def missing_url_scorer(candidate):
+    if not canonical_profile_url(candidate.get('profile_url', '')):
+        return 4, "no profile URL yet"
+    return None
+
+
+def stale_cache_scorer(page_cache):
+    def scorer(candidate):
+        profile_url = candidate.get('profile_url')
+        if not profile_url or page_cache is None:
+            return None
+        state = page_cache.state(profile_url)
+        if state == 'stale':
+            return 2, "stale cache entry"
+        if state == 'fresh':
+            # Costs no page, its place in the queue hardly matters
+            return -1, "fresh in cache"
+        return None
+    return scorer
+
+
+def likely_alumni_scorer(candidate):
+    headline = candidate.get('headline') or ''
+    if not headline:
+        return None
+    if ALUMNI_PATTERN.search(headline):
+        return 2, "alumni headline"
+    if default_classifier.is_cit_related(headline) and role_category(headline) == 'professional':
+        return 1, "CIT professional headline"
+    return None
+
+
+def recent_graduate_scorer(max_grad_year=2025, window=3):
+    def scorer(candidate):
+        headline = candidate.get('headline') or ''
+        year = candidate.get('grad_year') or stated_grad_year(headline) or likely_grad_year(headline)
+        if year and max_grad_year - window <= int(year) < max_grad_year:
+            return 2, f"recent graduate {year}"
+        return None
+    return scorer
+
+
+def deferred_scorer(candidate):
+    """Candidates the pre-filter deferred in 'deprioritize' mode stay behind everything else"""
+    if candidate.get('deferred'):
+        return -100, "deferred by pre-filter"
+    return None
+
+
+def default_scorers(page_cache=None, max_grad_year=2025):
+    return [
+        missing_url_scorer,
+        stale_cache_scorer(page_cache),
+        likely_alumni_scorer,
+        recent_graduate_scorer(max_grad_year),
+        deferred_scorer
+    ]
+
+
+class FetchScheduler:
+    """Priority queue of pages to visit, highest score first, with an optional page budget
+
+    Each pushed candidate is scored once by the scorers; equal scores keep
+    push order. jitter adds a random amount in [0, jitter) to every score so
+    close candidates can trade places between runs, drawn from a generator
+    seeded with seed, so the same seed and input give the same order. Every
+    pop is logged in decisions (key, score, reasons) for comparing runs.
+    charge() counts page loads against budget; once it is spent charge()
+    returns False and callers stop loading pages. Thread-safe.
+    """
+
+    def __init__(self, scorers=None, budget=None, seed=0, jitter=0.0):
+        self.scorers = list(scorers or [])
+        self.budget = budget
+        self.seed = seed
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.heap = []
+        self.counter = itertools.count()
+        self.lock = threading.Lock()
+        self.pages_charged = 0
+        self.refused = 0
+        self.decisions = []
+
+    def score(self, candidate):
+        """(score, reasons) of one candidate"""
+        total, reasons = 0, []
+        for scorer in self.scorers:
+            verdict = scorer(candidate)
+            if verdict:
+                points, reason = verdict
+                total += points
+                reasons.append(reason)
+        return total, reasons
+
+    def push(self, key, candidate=None):
+        score, reasons = self.score(candidate or {})
+        with self.lock:
+            if self.jitter:
+                score += self.random.random() * self.jitter
+            heapq.heappush(self.heap, (-score, next(self.counter), key, candidate, reasons))
+
+    def push_many(self, entries):
+        for key, candidate in entries:
+            self.push(key, candidate)
+
+    def pop(self):
+        """(key, candidate) with the highest score, or None when the queue is empty"""
+        with self.lock:
+            if not self.heap:
+                return None
+            score, _, key, candidate, reasons = heapq.heappop(self.heap)
+            self.decisions.append((key, -score, reasons))
+            return key, candidate
+
+    def order(self, entries):
+        """Keys of (key, candidate) entries in priority order"""
+        self.push_many(entries)
+        keys = []
+        while True:
+            entry = self.pop()
+            if entry is None:
+                return keys
+            keys.append(entry[0])
+
+    def __len__(self):
+        with self.lock:
+            return len(self.heap)
+
+    def charge(self, pages=1):
+        """Count page loads against the budget, False (and nothing counted) once it is spent"""
+        with self.lock:
+            if self.budget is not None and self.pages_charged + pages > self.budget:
+                self.refused += 1
+                return False
+            self.pages_charged += pages
+            return True
+
+    def refund(self, pages=1):
+        """Give back pages charged for loads that did not happen"""
+        with self.lock:
+            self.pages_charged = max(0, self.pages_charged - pages)
+
+    @property
+    def exhausted(self):
+        """Whether the budget has refused a page, i.e. the run stopped short"""
+        return self.refused > 0
+
+    @property
+    def budget_left(self):
+        if self.budget is None:
+            return None
+        return max(0, self.budget - self.pages_charged)
+
+    def report(self, top=5):
+        budget = f"/{self.budget}" if self.budget is not None else ""
+        print(f"🗂️ Scheduler (seed {self.seed}): {len(self.decisions)} scheduled, "
+              f"{self.pages_charged}{budget} pages charged, {self.refused} refused over budget")
+        for key, score, reasons in self.decisions[:top]:
+            label = key[1] if isinstance(key, tuple) else key
+            print(f"   {score:>5.1f}  {label}  {', '.join(reasons)}")
@@ -0,0 +1,253 @@
+import hashlib
+import json
+import os
+import re
+import urllib.parse
+import uuid
+from bulk_writer import SupabaseBulkWriter
+
+PROFILE_SLUG_PATTERN = re.compile(r'linkedin\.com/in/([^/?#]+)', re.IGNORECASE)
+
+
+def canonical_profile_url(url):
+    """Reduce any LinkedIn profile URL form to https://www.linkedin.com/in/<slug>/"""
+    match = PROFILE_SLUG_PATTERN.search(url or '')
+    if not match:
+        return ''
+    slug = urllib.parse.unquote(match.group(1)).strip().lower()
+    return f"https://www.linkedin.com/in/{slug}/" if slug else ''
+
+
+def stable_profile_id(profile):
+    """Derive a profile_id that stays the same across runs for the same person"""
+    canonical_url = canonical_profile_url(profile.get('profile_url', ''))
+    if canonical_url:
+        key = canonical_url
+    else:
+        # No real URL yet (e.g. placeholders), fall back to the visible text
+        name = ' '.join(str(profile.get('name') or '').lower().split())
+        headline = ' '.join(str(profile.get('headline') or '').lower().split())
+        key = f"name:{name}|headline:{headline}"
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, key))
+
+
+def row_content_hash(row):
+    """Hash of everything in a row except its key, used to detect changed rows"""
+    content = {key: value for key, value in row.items() if key != 'profile_id'}
+    encoded = json.dumps(content, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()
+
+
+class IncrementalSync:
+    """Sync a batch of rows to a table by sending only inserted, changed and deleted rows"""
+
+    SELECT_PAGE_SIZE = 1000
+    DELETE_CHUNK_SIZE = 100
+
+    def __init__(self, client, table, state_path=None, batch_size=500):
+        self.client = client
+        self.table = table
+        self.state_path = state_path or f".sync_state_{table}.json"
+        self.batch_size = batch_size
+
+    def load_state(self):
+        """Load {profile_id: content hash} from the last sync, seeding it from the table on first use"""
+        if os.path.exists(self.state_path):
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        print("📥 No local sync state, reading stored profile ids...")
+        state = {}
+        start = 0
+        while True:
+            result = (self.client.table(self.table)
+                      .select('profile_id')
+                      .range(start, start + self.SELECT_PAGE_SIZE - 1)
+                      .execute())
+            rows = result.data or []
+            new_ids = [row['profile_id'] for row in rows if row.get('profile_id') and row['profile_id'] not in state]
+            for profile_id in new_ids:
+                # Unknown hash, so the row will be rewritten once if it is still present
+                state[profile_id] = None
+            if len(rows) < self.SELECT_PAGE_SIZE or not new_ids:
+                break
+            start += self.SELECT_PAGE_SIZE
+        return state
+
+    def save_state(self, state):
+        """Write the state file atomically so an interrupted run never leaves it half written"""
+        temp_path = self.state_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.state_path)
+
+    def diff(self, rows, state):
+        """Split rows into inserted and changed, and find stored ids missing from the batch"""
+        inserted = []
+        changed = []
+        hashes = {}
+
+        for row in rows:
+            profile_id = row['profile_id']
+            if profile_id in hashes:
+                continue
+            hashes[profile_id] = row_content_hash(row)
+
+            if profile_id not in state:
+                inserted.append(row)
+            elif state[profile_id] != hashes[profile_id]:
+                changed.append(row)
+
+        deleted_ids = [profile_id for profile_id in state if profile_id not in hashes]
+        return inserted, changed, deleted_ids, hashes
+
+    def sync(self, rows):
+        """Apply only the differences between rows and the stored table, returns rows written"""
+        state = self.load_state()
+        inserted, changed, deleted_ids, hashes = self.diff(rows, state)
+        unchanged = len(hashes) - len(inserted) - len(changed)
+        print(f"🔄 Sync plan: {len(inserted)} new, {len(changed)} changed, "
+              f"{len(deleted_ids)} removed, {unchanged} unchanged")
+
+        writer = SupabaseBulkWriter(self.client, self.table, batch_size=self.batch_size, on_conflict='profile_id')
+        written = writer.upsert_rows(inserted + changed)
+        if inserted or changed:
+            writer.report()
+
+        failed_ids = {failure['row'].get('profile_id') for failure in writer.failed_rows}
+        for row in inserted + changed:
+            if row['profile_id'] not in failed_ids:
+                state[row['profile_id']] = hashes[row['profile_id']]
+
+        self.delete_ids(deleted_ids, state)
+        self.save_state(state)
+        return written
+
+    def delete_ids(self, deleted_ids, state):
+        """Delete rows by profile_id in chunks, dropping them from state once deleted"""
+        for start in range(0, len(deleted_ids), self.DELETE_CHUNK_SIZE):
+            chunk = deleted_ids[start:start + self.DELETE_CHUNK_SIZE]
+            try:
+                self.client.table(self.table).delete().in_('profile_id', chunk).execute()
+                for profile_id in chunk:
+                    state.pop(profile_id, None)
+            except Exception as e:
+                print(f"⚠️ Error deleting removed profiles: {e}")
+
+    def clear(self):
+        print("🗄️ Clearing existing data...")
+        try:
+            self.client.table(self.table).delete().neq('id', '00000000-0000-0000-0000-000000000000').execute()
+        except:
+            pass
+
+    def stream(self, replace=False, columns=None):
+        """A SyncStream that takes the rows one at a time instead of as one batch"""
+        return SyncStream(self, replace=replace, columns=columns)
+
+    def replace(self, rows):
+        """Clear the whole table and rewrite every row (the pre-incremental behaviour)"""
+        self.clear()
+
+        writer = SupabaseBulkWriter(self.client, self.table, batch_size=self.batch_size, on_conflict='profile_id')
+        written = writer.upsert_rows(rows)
+        writer.report()
+
+        failed_ids = {failure['row'].get('profile_id') for failure in writer.failed_rows}
+        self.save_state({
+            row['profile_id']: row_content_hash(row)
+            for row in rows if row['profile_id'] not in failed_ids
+        })
+        return written
+
+
+class SyncStream:
+    """Incremental sync for rows that arrive one at a time
+
+    Same result as IncrementalSync.sync() on the whole batch, but rows are
+    hashed as they come and only new or changed ones are held, until
+    batch_size of them are ready to upsert. Only the ids seen and the sync
+    state stay in memory, never the rows. close() deletes the stored rows
+    that were not written this run and saves the state. With replace=True
+    every row is written, and the table is cleared just before the first
+    batch goes out, so a stream that never gets a row leaves it untouched.
+
+    columns, if given, is the full column list: every batch is sent with
+    all of them, like a single-batch sync of rows with mixed keys would.
+    """
+
+    def __init__(self, sync, replace=False, columns=None):
+        self.sync = sync
+        self.replace = replace
+        self.columns = columns
+        self.cleared = not replace
+        self.state = {} if replace else sync.load_state()
+        self.seen = set()
+        self.pending = []
+        self.inserted = 0
+        self.changed = 0
+        self.writer = SupabaseBulkWriter(sync.client, sync.table, batch_size=sync.batch_size, on_conflict='profile_id')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        return False
+
+    def write(self, row):
+        """Queue one row, returns False if it is a repeat or unchanged since the last sync"""
+        profile_id = row['profile_id']
+        if profile_id in self.seen:
+            return False
+        self.seen.add(profile_id)
+
+        content_hash = row_content_hash(row)
+        if profile_id not in self.state:
+            self.inserted += 1
+        elif self.state[profile_id] != content_hash:
+            self.changed += 1
+        else:
+            return False
+
+        if self.columns:
+            row = {column: row.get(column) for column in self.columns}
+        self.pending.append((row, content_hash))
+        if len(self.pending) >= self.sync.batch_size:
+            self.flush()
+        return True
+
+    def write_many(self, rows):
+        return sum(1 for row in rows if self.write(row))
+
+    def flush(self):
+        if not self.pending:
+            return
+        if not self.cleared:
+            self.sync.clear()
+            self.cleared = True
+        failures = len(self.writer.failed_rows)
+        self.writer.upsert_rows([row for row, _ in self.pending])
+        failed_ids = {failure['row'].get('profile_id') for failure in self.writer.failed_rows[failures:]}
+        for row, content_hash in self.pending:
+            if row['profile_id'] not in failed_ids:
+                self.state[row['profile_id']] = content_hash
+        self.pending = []
+
+    def close(self):
+        """Write what is left, delete rows missing from this run and save the state, returns rows written"""
+        self.flush()
+        if not self.cleared:
+            # replace=True without a single row: the table and its state stay as they were
+            print("🔄 Synced: nothing to write, table left as it was")
+            return 0
+        deleted_ids = [profile_id for profile_id in self.state if profile_id not in self.seen]
+        unchanged = len(self.seen) - self.inserted - self.changed
+        print(f"🔄 Synced: {self.inserted} new, {self.changed} changed, "
+              f"{len(deleted_ids)} removed, {unchanged} unchanged")
+        if self.inserted or self.changed:
+            self.writer.report()
+        self.sync.delete_ids(deleted_ids, self.state)
+        self.sync.save_state(self.state)
+        return self.writer.saved_count
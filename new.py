@@ -1,97 +1,173 @@
 import os, random, sys, time
 from selenium import webdriver
-from bs4 import BeautifulSoup
-import pandas as pd
 import numpy as np
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By  
-import re
-
-options = Options()
-options.add_argument("--start-maximized")
+from profile_worker_pool import ProfileWorkerPool, make_headless_chrome
+from page_waits import default_waiter, login_challenged
+from crawl_frontier import CrawlFrontier
+from page_cache import PageCache
+from csv_sink import ReorderBuffer, StreamingCSVWriter
+from parquet_export import EXPERIENCE_SCHEMA, ParquetSink, parquet_available
+from alumni_index import AlumniIndex
+from profile_prefilter import ProfilePreFilter, load_search_cards
+from fetch_scheduler import FetchScheduler, default_scorers
+from browser_sessions import BrowserSessionPool
+
+WORKERS = 3  # Parallel browser sessions
+REQUESTS_PER_MINUTE = 12  # Page budget shared by all workers
+PARSE_ONLY = False  # Re-run extraction from the page cache without opening a browser
+EXPORT_PARQUET = parquet_available()  # Also write boisexperience.parquet (int grad_year, list experiences)
+MAX_GRAD_YEAR = 2025  # Only CIT graduates before this year are eligible
+SEARCH_CARDS_CSV = 'cit_alumni_with_real_profile_urls.csv'  # Search cards saved by direct_profile_extractor.py, used to score profilesID
+PREFILTER = 'skip'  # 'skip' or 'deprioritize' profiles whose search card shows they cannot be eligible, None to visit all
+PAGE_BUDGET = None  # Profile pages this run may load (cache hits are free), None for no limit
+SCHEDULER_SEED = 0  # Same seed and inputs give the same visiting order
+SCHEDULER_JITTER = 0.0  # > 0 lets near-equal candidates trade places, reproducibly per seed
+SESSION_DIR = 'browser_sessions'  # Browser profiles and cookies kept between runs, so warm runs skip the login
 
 service = Service(r"C:\Windows\System32\chromedriver-win32\chromedriver.exe")  # Windows path to chromedriver
-browser = webdriver.Chrome(service=service, options=options)
-
-# LinkedIn login page
-browser.get("https://www.linkedin.com/login/")
 
 """Create a txt file and sign in to your account (better if it's a premium account)"""
 
+page_cache = PageCache('page_cache', ttl=7 * 24 * 3600, offline=PARSE_ONLY)
+
 with open(r"C:\Users\Sylesh Pavendan\OneDrive\Desktop\LI\config.txt") as file:
     line = file.readlines()
     username = line[0].strip()
     password = line[1].strip()
 
-# ✅ Updated to Selenium 4 style
-elementID = browser.find_element(By.ID, 'username')
-elementID.send_keys(username)
-time.sleep(10)
-elementID = browser.find_element(By.ID, 'password')
-elementID.send_keys(password)
-elementID.submit()
-time.sleep(20)
-
-"""Go to your school page, alumni section"""
-browser.get('https://www.linkedin.com/search/results/people/?heroEntityKey=urn%3Ali%3Aorganization%3A15103020&keywords=chennai%20institute%20of%20technology&origin=CLUSTER_EXPANSION&position=2&searchId=47649dc7-d26e-4570-a9c6-681a428032c7&sid=y4q')
+def login(browser):
+    """Sign one worker's browser in to LinkedIn"""
+    # LinkedIn login page
+    browser.get("https://www.linkedin.com/login/")
+    default_waiter.wait_for(browser, 'login_form')
+
+    # ✅ Updated to Selenium 4 style
+    elementID = browser.find_element(By.ID, 'username')
+    elementID.send_keys(username)
+    elementID = browser.find_element(By.ID, 'password')
+    elementID.send_keys(password)
+    elementID.submit()
+    default_waiter.wait_for(browser, 'login_done')
+    if login_challenged(browser):
+        raise RuntimeError("LinkedIn stopped the login at a security checkpoint")
 
 profilesID = []
 profilesID=["https://www.linkedin.com/in/sk-naveen/","https://www.linkedin.com/in/saravanan18302/","https://www.linkedin.com/in/sachithra-nesamani-77a35a1ba/","https://www.linkedin.com/in/rio-m-6665672b6/","https://www.linkedin.com/in/arsmavethk-m-072876256/","https://www.linkedin.com/in/dileepanraje7b4c99/","https://www.linkedin.com/in/madhushree-t-211389200/","https://www.linkedin.com/in/dheeksha-gopika/","https://www.linkedin.com/in/yamini-anbu-158562199/","https://www.linkedin.com/in/madhusudhanan-m-06a7201b9/","https://www.linkedin.com/in/lakshmipooja-e-3055141bb/","https://www.linkedin.com/in/subash-chandra-bose-vengatesan-b45b42150/","https://www.linkedin.com/in/arjun-s-s-189840279/","https://www.linkedin.com/in/vishnu-ram-m-23395218b/",""]
 
-import re
-
-results = []
-
-for profile_url in profilesID:
-    browser.get(profile_url)
-    time.sleep(6)  # Give more time for dynamic content to load
-    name = "N/A"
-    grad_year = None
-    experiences = []
-    eligible = False
-
-    # Extract name using Selenium
-    try:
-        name_elem = browser.find_element(By.TAG_NAME, 'h1')
-        name = name_elem.text.strip()
-    except Exception:
-        pass
-
-    # Extract education using Selenium
-    try:
-        edu_elements = browser.find_elements(By.XPATH, "//li[contains(., 'Chennai Institute of Technology')]")
-        for edu in edu_elements:
-            text = edu.text
-            years = re.findall(r'\d{4}', text)
-            if years:
-                grad_year = int(years[-1])
-                if grad_year < 2025:
-                    eligible = True
-                    break
-    except Exception:
-        pass
-    if not eligible:
-        continue
-
-    # Extract experience using BeautifulSoup with broader search
-    soup = BeautifulSoup(browser.page_source, "lxml")
-    try:
-        exp_sections = soup.find_all('section', class_='artdeco-card pv-profile-card break-words mt2')
-        for exp_section in exp_sections:
-            if exp_section.find('div', id='experience'):
-                all_text = exp_section.get_text(separator='\n', strip=True)
-                lines = [line for line in all_text.split('\n') if line.strip()]
-                if lines and 'Experience' in lines[0]:
-                    lines = lines[1:]
-                experiences = lines
-    except Exception as e:
-        print("Experience extraction error:", e)
-
+# Search cards tell us who cannot be eligible before we pay for their profile page. They only
+# score the profiles listed above (matched by canonical URL), they never add profiles to visit
+prefilter = ProfilePreFilter(max_grad_year=MAX_GRAD_YEAR, mode=PREFILTER)
+candidates = prefilter.plan(
+    [{'profile_url': profile_url} for profile_url in profilesID if profile_url],
+    cards=load_search_cards(SEARCH_CARDS_CSV)
+)
+
+# Finished profiles survive a crash, a re-run only visits what is left
+frontier = CrawlFrontier('boisexperience_frontier.db')
+frontier.recover()
+frontier.add_many('profile', [(candidate['profile_url'], None) for candidate in candidates])
+frontier.report()
+pending = set(frontier.pending('profile'))
+
+# Rows stream into boisexperience.csv.part as profiles are extracted and replace the CSV
+# once the run is over. Same format and row order as the DataFrame.to_csv export it replaces
+# (profilesID order, pandas ends lines with os.linesep)
+results = StreamingCSVWriter('boisexperience.csv', ['name', 'grad_year', 'experiences'], lineterminator=os.linesep)
+parquet_results = ParquetSink('boisexperience.parquet', EXPERIENCE_SCHEMA) if EXPORT_PARQUET else None
+alumni_index = AlumniIndex('alumni_index.db')  # Query with: python alumni_index.py search --role Engineer
+
+def save_profile(profile):
+    """Write one extracted profile to every sink if the person is eligible"""
+    if not profile or not profile['eligible']:
+        return
+    name = profile['name']
+    grad_year = profile['grad_year']
+    experiences = profile['experiences']
     print(f"Name: {name}\nGrad Year: {grad_year}\nExperiences: {experiences}\n")
-    results.append({'name': name, 'grad_year': grad_year, 'experiences': "; ".join(experiences)})
-
-print(results)
-
-df = pd.DataFrame(results)
-df.to_csv('boisexperience.csv', index=False)
\ No newline at end of file
+    results.write({'name': name, 'grad_year': grad_year, 'experiences': "; ".join(experiences)})
+    if parquet_results:
+        parquet_results.write({'name': name, 'grad_year': grad_year, 'experiences': experiences})
+    alumni_index.upsert([profile])
+
+# Workers finish in the scheduler's order; the buffer holds each row until every profile
+# listed before it is saved or known to be missing, so rows still go out in profilesID order
+first_listed = {profile_url: index for index, profile_url in reversed(list(enumerate(profilesID)))}
+position = {
+    profile_url: index for index, profile_url in enumerate(sorted(
+        (candidate['profile_url'] for candidate in candidates),
+        key=lambda profile_url: first_listed.get(profile_url, len(profilesID))
+    ))
+}
+output = ReorderBuffer(save_profile)
+
+# Profiles an interrupted earlier run already finished go in at their place, this run only visits the rest
+restored = set()
+for profile_url, profile in frontier.iter_results('profile', keys=True):
+    restored.add(profile_url)
+    output.put(position.setdefault(profile_url, len(position)), profile)
+for profile_url, index in list(position.items()):
+    if profile_url not in pending and profile_url not in restored:
+        output.skip(index)
+
+# Logged-in browsers from the previous run are reused, login only runs for expired sessions
+sessions = BrowserSessionPool(
+    lambda profile_dir: make_headless_chrome(service, profile_dir),
+    login=login,
+    size=WORKERS,
+    directory=SESSION_DIR
+)
+if not PARSE_ONLY:
+    sessions.start()
+
+pool = ProfileWorkerPool(
+    workers=WORKERS,
+    requests_per_minute=REQUESTS_PER_MINUTE,
+    session_pool=sessions,
+    frontier=frontier,
+    page_cache=page_cache,
+    scheduler=FetchScheduler(
+        default_scorers(page_cache, MAX_GRAD_YEAR),
+        budget=PAGE_BUDGET,
+        seed=SCHEDULER_SEED,
+        jitter=SCHEDULER_JITTER
+    ),
+    on_result=lambda profile_url, profile: output.put(position[profile_url], profile),
+    max_grad_year=MAX_GRAD_YEAR
+)
+visited = pool.run(
+    [candidate['profile_url'] for candidate in candidates if candidate['profile_url'] in pending],
+    candidates={candidate['profile_url']: candidate for candidate in candidates}
+)
+sessions.report()
+sessions.close()
+output.drain()
+
+# A run stopped by the page budget, or with profiles still to retry, keeps its frontier so the
+# next run resumes it; its rows stay in the .part files and the previous exports are kept
+unfinished = frontier.unfinished('profile')
+finished = not pool.scheduler.exhausted and not unfinished
+if finished:
+    results.close()
+    if parquet_results:
+        parquet_results.close()
+else:
+    results.close_partial()
+    if parquet_results:
+        parquet_results.close_partial()
+
+print(f"⚡ {pool.pages_fetched} pages in {pool.elapsed:.0f}s ({pool.pages_per_minute:.1f} pages/minute)")
+prefilter.report(visited)
+pool.scheduler.report()
+default_waiter.report()
+page_cache.report()
+alumni_index.report()
+alumni_index.close()
+if finished:
+    print(f"💾 Saved {results.rows_written} profiles to boisexperience.csv")
+    frontier.reset()
+else:
+    print(f"⏸️ {unfinished} profiles left for the next run, frontier kept; "
+          f"{results.rows_written} profiles so far in boisexperience.csv.part")
@@ -0,0 +1,175 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+import zlib
+from incremental_sync import canonical_profile_url
+
+TRACKING_PARAMS = {'trk', 'trackingId', 'lipi', 'miniProfileUrn', 'sid', 'searchId', 'origin', 'position'}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed_at);
+"""
+
+
+def canonical_url(url):
+    """Cache key for a URL: canonical profile URL, or the URL with sorted, tracking-free query"""
+    profile_url = canonical_profile_url(url)
+    if profile_url:
+        return profile_url
+    parsed = urllib.parse.urlsplit(url)
+    query = sorted(
+        (key, value) for key, value in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+        if key not in TRACKING_PARAMS
+    )
+    return urllib.parse.urlunsplit((
+        parsed.scheme.lower(),
+        parsed.netloc.lower(),
+        parsed.path or '/',
+        urllib.parse.urlencode(query),
+        ''
+    ))
+
+
+class PageCache:
+    """On-disk cache of compressed page_source snapshots keyed by canonical URL
+
+    Snapshots are stored content-addressed (identical pages share one blob)
+    next to a small SQLite index holding the fetch time and last access of
+    every URL. Entries older than ttl seconds are treated as misses, and the
+    least recently used entries are evicted once the blobs exceed max_bytes.
+    In offline (parse-only) mode the TTL is ignored and nothing is ever
+    fetched, so extraction can be re-run from the cache alone.
+    """
+
+    def __init__(self, directory='page_cache', ttl=7 * 24 * 3600, max_bytes=512 * 1024 * 1024, offline=False):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        os.makedirs(os.path.join(directory, 'objects'), exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(directory, 'index.db'), check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def _blob_path(self, digest):
+        return os.path.join(self.directory, 'objects', digest[:2], f"{digest}.zlib")
+
+    def _fresh(self, fetched_at):
+        return self.offline or not self.ttl or time.time() - fetched_at <= self.ttl
+
+    def state(self, url):
+        """'fresh', 'stale' (cached but past its TTL) or None, without touching the hit counters"""
+        with self.lock:
+            row = self.db.execute("SELECT fetched_at FROM pages WHERE url = ?", (canonical_url(url),)).fetchone()
+        if not row:
+            return None
+        return 'fresh' if self._fresh(row[0]) else 'stale'
+
+    def has(self, url):
+        """Whether get(url) would be a hit, without touching the hit counters"""
+        return self.state(url) == 'fresh'
+
+    def get(self, url):
+        """Cached page_source for url, or None on a miss or an expired entry"""
+        key = canonical_url(url)
+        with self.lock:
+            row = self.db.execute("SELECT digest, fetched_at FROM pages WHERE url = ?", (key,)).fetchone()
+            if not row or not self._fresh(row[1]):
+                self.misses += 1
+                return None
+            self.db.execute("UPDATE pages SET accessed_at = ? WHERE url = ?", (time.time(), key))
+
+        try:
+            with open(self._blob_path(row[0]), 'rb') as f:
+                page_source = zlib.decompress(f.read()).decode('utf-8')
+        except (OSError, zlib.error):
+            with self.lock:
+                self.db.execute("DELETE FROM pages WHERE url = ?", (key,))
+                self.misses += 1
+            return None
+
+        with self.lock:
+            self.hits += 1
+        return page_source
+
+    def put(self, url, page_source):
+        """Store a snapshot and evict old entries if the cache is over its size cap"""
+        data = page_source.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(zlib.compress(data, 6))
+            os.replace(temp_path, path)
+
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO pages (url, digest, size, fetched_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (canonical_url(url), digest, os.path.getsize(path), now, now)
+            )
+        self.evict()
+
+    def fetch(self, url, loader):
+        """Return the cached page, or call loader() for a fresh one unless offline"""
+        page_source = self.get(url)
+        if page_source is not None or self.offline:
+            return page_source
+        page_source = loader()
+        if page_source:
+            self.put(url, page_source)
+        return page_source
+
+    def total_bytes(self):
+        with self.lock:
+            return self.db.execute("SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT digest, size FROM pages)").fetchone()[0]
+
+    def evict(self):
+        """Drop least recently used entries until the blobs fit in max_bytes"""
+        if not self.max_bytes:
+            return 0
+
+        removed = 0
+        with self.lock:
+            total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT digest, size FROM pages)").fetchone()[0]
+            if total <= self.max_bytes:
+                return 0
+
+            for url, digest, size in self.db.execute(
+                "SELECT url, digest, size FROM pages ORDER BY accessed_at"
+            ).fetchall():
+                if total <= self.max_bytes:
+                    break
+                self.db.execute("DELETE FROM pages WHERE url = ?", (url,))
+                removed += 1
+                still_used = self.db.execute("SELECT 1 FROM pages WHERE digest = ? LIMIT 1", (digest,)).fetchone()
+                if not still_used:
+                    total -= size
+                    try:
+                        os.remove(self._blob_path(digest))
+                    except OSError:
+                        pass
+        return removed
+
+    def report(self):
+        mode = " (parse-only)" if self.offline else ""
+        print(f"🗃️ Page cache{mode}: {self.hits} hits, {self.misses} misses, {self.total_bytes() / 1024:.0f} KB on disk")
@@ -0,0 +1,122 @@
+import bisect
+import threading
+import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from search_result_parser import RESULT_CONTAINER_SELECTOR
+
+
+def _present(by, selector):
+    return lambda driver: len(driver.find_elements(by, selector)) > 0
+
+
+def logged_in(driver):
+    url = driver.current_url
+    return "feed" in url or "mynetwork" in url or "/in/" in url
+
+
+def login_challenged(driver):
+    """LinkedIn stopped the login at a security challenge (/checkpoint/), which is not a session"""
+    return "/checkpoint/" in driver.current_url
+
+
+# Named readiness conditions: each returns truthy once the page is usable
+CONDITIONS = {
+    'login_form': _present(By.ID, 'username'),
+    'logged_in': logged_in,
+    # The login went through or was stopped at a challenge, so a challenge does not wait for the timeout
+    'login_done': lambda driver: logged_in(driver) or login_challenged(driver),
+    'search_results': lambda driver: (
+        len(driver.find_elements(By.CSS_SELECTOR, RESULT_CONTAINER_SELECTOR)) > 0 or
+        len(driver.find_elements(By.CSS_SELECTOR, '.search-reusable-search-no-results, .artdeco-empty-state')) > 0
+    ),
+    'profile_page': lambda driver: '/in/' in driver.current_url,
+    'profile_h1': _present(By.TAG_NAME, 'h1'),
+    'education_section': _present(By.ID, 'education'),
+    'experience_section': _present(By.ID, 'experience'),
+    'document_ready': lambda driver: driver.execute_script("return document.readyState") == 'complete'
+}
+
+DEFAULT_TIMEOUTS = {
+    'login_form': 15,
+    'logged_in': 30,
+    'login_done': 30,
+    'search_results': 15,
+    'profile_page': 10,
+    'profile_h1': 10,
+    'education_section': 5,
+    'experience_section': 5,
+    'document_ready': 15
+}
+
+HISTOGRAM_BUCKETS = [0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 32]
+
+
+class WaitHistogram:
+    """Distribution of how long each named wait actually took"""
+
+    def __init__(self, buckets=HISTOGRAM_BUCKETS):
+        self.buckets = list(buckets)
+        self.stats = {}
+        self.lock = threading.Lock()
+
+    def record(self, condition, seconds, satisfied):
+        with self.lock:
+            stats = self.stats.setdefault(condition, {
+                'count': 0,
+                'timeouts': 0,
+                'total': 0.0,
+                'max': 0.0,
+                'counts': [0] * (len(self.buckets) + 1)
+            })
+            stats['count'] += 1
+            stats['total'] += seconds
+            stats['max'] = max(stats['max'], seconds)
+            stats['counts'][bisect.bisect_left(self.buckets, seconds)] += 1
+            if not satisfied:
+                stats['timeouts'] += 1
+
+    def report(self):
+        """Print count, mean, max and bucket counts per condition"""
+        if not self.stats:
+            return
+        labels = [f"≤{bucket}s" for bucket in self.buckets] + [f">{self.buckets[-1]}s"]
+        print("\n⏱️ Wait times per condition:")
+        print(f"   {'condition':<20}{'count':>6}{'mean':>8}{'max':>8}{'timeouts':>9}  " +
+              ' '.join(f"{label:>6}" for label in labels))
+        with self.lock:
+            for condition, stats in sorted(self.stats.items()):
+                mean = stats['total'] / stats['count']
+                print(f"   {condition:<20}{stats['count']:>6}{mean:>7.2f}s{stats['max']:>7.2f}s{stats['timeouts']:>9}  " +
+                      ' '.join(f"{count:>6}" for count in stats['counts']))
+
+
+class PageWaiter:
+    """Wait for named readiness conditions instead of sleeping a fixed time"""
+
+    def __init__(self, timeouts=None, poll_frequency=0.1):
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.poll_frequency = poll_frequency
+        self.histogram = WaitHistogram()
+
+    def wait_for(self, driver, condition, timeout=None):
+        """Return True as soon as the condition holds, False if it timed out"""
+        if timeout is None:
+            timeout = self.timeouts.get(condition, 10)
+
+        started = time.monotonic()
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=self.poll_frequency).until(CONDITIONS[condition])
+            satisfied = True
+        except TimeoutException:
+            satisfied = False
+
+        self.histogram.record(condition, time.monotonic() - started, satisfied)
+        return satisfied
+
+    def report(self):
+        self.histogram.report()
+
+
+default_waiter = PageWaiter()
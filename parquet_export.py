@@ -0,0 +1,170 @@
+import csv
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Joined string columns in the CSV exports and the separator each one uses. Only for
+# converting CSVs that already exist (csv_to_parquet): splitting is lossy when an item
+# contains its separator, so the exporters pass these columns as lists instead
+LIST_SEPARATORS = {
+    'experiences': '; ',
+    'search_descriptions': ' | '
+}
+
+
+if pa is not None:
+    # boisexperience.csv from new.py
+    EXPERIENCE_SCHEMA = pa.schema([
+        pa.field('name', pa.string()),
+        pa.field('grad_year', pa.int32()),
+        pa.field('experiences', pa.list_(pa.string()))
+    ])
+
+    # cit_alumni_with_real_profile_urls.csv from save_enhanced_results
+    SEARCH_RESULT_SCHEMA = pa.schema([
+        pa.field('name', pa.string()),
+        pa.field('headline', pa.string()),
+        pa.field('profile_url', pa.string()),
+        pa.field('location', pa.string())
+    ])
+
+    # cit_alumni_enhanced_with_search_urls.csv from create_enhanced_csv
+    ENHANCED_SCHEMA = pa.schema([
+        pa.field('name', pa.string()),
+        pa.field('headline', pa.string()),
+        pa.field('location', pa.string()),
+        pa.field('profile_url', pa.string()),
+        pa.field('name_search_url', pa.string()),
+        pa.field('role_search_url', pa.string()),
+        pa.field('location_search_url', pa.string()),
+        pa.field('google_search_url', pa.string()),
+        pa.field('search_descriptions', pa.list_(pa.string()))
+    ])
+else:
+    EXPERIENCE_SCHEMA = SEARCH_RESULT_SCHEMA = ENHANCED_SCHEMA = None
+
+
+def parquet_available():
+    return pa is not None
+
+
+def coerce_value(value, field_type, name):
+    """Convert a CSV-style value to the column type: ints from strings, lists from joined strings"""
+    if value is None:
+        return None
+    if pa.types.is_integer(field_type):
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                return None
+            return int(float(value))
+        return int(value)
+    if pa.types.is_list(field_type):
+        if isinstance(value, str):
+            separator = LIST_SEPARATORS.get(name, '; ')
+            return [item for item in value.split(separator) if item] if value else []
+        return [str(item) for item in value]
+    return str(value)
+
+
+class ParquetSink:
+    """Typed, compressed Parquet output written one row group at a time
+
+    Rows are buffered and written as a row group every row_group_size rows,
+    so memory stays bounded however long the run is. Like StreamingCSVWriter
+    the file is built as <path>.part and renamed into place by close().
+    row(item) maps each written item to a row dict (default: the item as is).
+    """
+
+    def __init__(self, path, schema, row=None, row_group_size=10000, compression='zstd'):
+        if pa is None:
+            raise ImportError("pyarrow is required for Parquet export (pip install pyarrow)")
+        self.path = path
+        self.part_path = f"{path}.part"
+        self.schema = schema
+        self.row = row
+        self.row_group_size = row_group_size
+        self.columns = {field.name: [] for field in schema}
+        self.buffered = 0
+        self.rows_written = 0
+        self.row_groups = 0
+        self.writer = pq.ParquetWriter(self.part_path, schema, compression=compression)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def write(self, item):
+        row = self.row(item) if self.row else item
+        for field in self.schema:
+            self.columns[field.name].append(coerce_value(row.get(field.name), field.type, field.name))
+        self.buffered += 1
+        self.rows_written += 1
+        if self.buffered >= self.row_group_size:
+            self.flush()
+        return True
+
+    def write_many(self, items):
+        return sum(1 for item in items if self.write(item))
+
+    def flush(self):
+        """Write the buffered rows as one row group"""
+        if not self.buffered:
+            return
+        table = pa.table(
+            [pa.array(self.columns[field.name], type=field.type) for field in self.schema],
+            schema=self.schema
+        )
+        self.writer.write_table(table, row_group_size=self.buffered)
+        self.row_groups += 1
+        for values in self.columns.values():
+            values.clear()
+        self.buffered = 0
+
+    def close(self):
+        if self.writer is None:
+            return
+        self.flush()
+        self.writer.close()
+        self.writer = None
+        os.replace(self.part_path, self.path)
+
+    def close_partial(self):
+        """Finish the .part file as a readable Parquet file but leave the previous file at path"""
+        if self.writer is None:
+            return
+        self.flush()
+        self.writer.close()
+        self.writer = None
+
+    def abort(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        try:
+            os.remove(self.part_path)
+        except OSError:
+            pass
+
+
+def csv_to_parquet(csv_path, parquet_path, schema, row_group_size=10000, compression='zstd'):
+    """Convert one of the CSV exports, returns the number of rows written"""
+    with open(csv_path, newline='', encoding='utf-8') as csvfile, \
+            ParquetSink(parquet_path, schema, row_group_size=row_group_size, compression=compression) as sink:
+        return sink.write_many(csv.DictReader(csvfile))
+
+
+def read_parquet(path):
+    """Load an export back as a list of row dicts"""
+    return pq.read_table(path).to_pylist()
@@ -0,0 +1,318 @@
+import hashlib
+import json
+import re
+import unicodedata
+from incremental_sync import canonical_profile_url
+
+NAME_TITLES = frozenset(['dr', 'mr', 'mrs', 'ms', 'prof', 'er'])
+
+HEADLINE_STOP_WORDS = frozenset(['at', 'of', 'the', 'in', 'and', 'a', 'an', 'for', 'to', 'with'])
+
+PLACEHOLDER_NAMES = frozenset(['linkedin member', 'unknown', 'n/a'])
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def normalize_text(text):
+    """Lowercase ASCII-folded text, so 'Sélvi' and 'selvi' compare equal"""
+    text = str(text or '')
+    if text.isascii():
+        return text.lower()
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in text if not unicodedata.combining(char)).lower()
+
+
+def name_tokens(name):
+    """Name words without titles, empty for placeholder names like 'LinkedIn Member'"""
+    normalized = normalize_text(name).strip()
+    if normalized in PLACEHOLDER_NAMES:
+        return ()
+    return tuple(token for token in TOKEN_PATTERN.findall(normalized) if token not in NAME_TITLES)
+
+
+def name_block_key(tokens):
+    """Blocking key: the full name words in sorted order, ignoring initials"""
+    words = sorted(token for token in tokens if len(token) > 1)
+    return ' '.join(words) if words else ' '.join(sorted(tokens))
+
+
+def names_compatible(a, b):
+    """Every word of the shorter name matches a word of the other, or its initial"""
+    if not a or not b:
+        return False
+    shorter, longer = (a, b) if len(a) <= len(b) else (b, a)
+    for token in shorter:
+        if len(token) == 1:
+            if not any(other.startswith(token) for other in longer):
+                return False
+        elif token not in longer and not any(len(other) == 1 and token.startswith(other) for other in longer):
+            return False
+    return True
+
+
+def headline_tokens(headline):
+    return frozenset(
+        token for token in TOKEN_PATTERN.findall(normalize_text(headline)) if token not in HEADLINE_STOP_WORDS
+    )
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """One-permutation MinHash signatures with rotation densification
+
+    Each token is hashed once; the hash picks one of num_bins bins and the
+    rest of it is the value kept if it is the bin's minimum. Empty bins
+    borrow the next filled bin's value, so two sets agree on a bin with
+    probability close to their Jaccard similarity. Token hashes are
+    memoized because headline vocabularies are small.
+    """
+
+    def __init__(self, num_bins=16):
+        self.num_bins = num_bins
+        self.token_hashes = {}
+
+    def token_hash(self, token):
+        value = self.token_hashes.get(token)
+        if value is None:
+            value = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+            self.token_hashes[token] = value
+        return value
+
+    def signature(self, tokens):
+        if not tokens:
+            return None
+        num_bins = self.num_bins
+        bins = [None] * num_bins
+        for token in tokens:
+            value = self.token_hash(token)
+            index = value % num_bins
+            value //= num_bins
+            if bins[index] is None or value < bins[index]:
+                bins[index] = value
+
+        signature = []
+        for index in range(num_bins):
+            offset = 0
+            while bins[(index + offset) % num_bins] is None:
+                offset += 1
+            signature.append(bins[(index + offset) % num_bins] ^ offset)
+        return tuple(signature)
+
+
+class ProfileDeduplicator:
+    """Cluster profiles that describe the same person and merge each cluster
+
+    Profiles with the same canonical URL form the anchor clusters, and two
+    different real URLs are never merged. Only profiles without a URL need
+    fuzzy matching; their candidates come from blocking keys instead of a
+    pairwise scan: the sorted name words, alone and combined with each band
+    of the headline's MinHash signature (LSH). Names with initials are
+    blocked on a full word plus an initial and a band, single-word names on
+    the word and a band. A candidate is
+    accepted when the names are compatible (initials and word order allowed)
+    and the headlines overlap by at least headline_threshold. A URL-less
+    profile joins the best-scoring anchor it matches, unless two anchors tie.
+    """
+
+    def __init__(self, headline_threshold=0.5, num_bins=16, band_size=4, max_block=50):
+        self.headline_threshold = headline_threshold
+        self.band_size = band_size
+        self.max_block = max_block
+        self.minhasher = MinHasher(num_bins)
+        self.candidate_pairs = 0
+        self.merged_count = 0
+
+    def _features(self, profile):
+        tokens = name_tokens(profile.get('name'))
+        headline = headline_tokens(profile.get('headline'))
+        signature = self.minhasher.signature(headline)
+        bands = []
+        if signature:
+            bands = [(band, signature[band:band + self.band_size]) for band in range(0, len(signature), self.band_size)]
+        return {
+            'url': canonical_profile_url(profile.get('profile_url', '')),
+            'name': tokens,
+            'words': frozenset(tokens),
+            'initials': any(len(token) == 1 for token in tokens),
+            'name_key': name_block_key(tokens),
+            'headline': headline,
+            'bands': bands,
+            'location': normalize_text(profile.get('location')).strip()
+        }
+
+    def _same_person(self, a, b):
+        if a['url'] and b['url']:
+            return a['url'] == b['url']
+        if a['initials'] or b['initials']:
+            if not names_compatible(a['name'], b['name']):
+                return False
+        elif not a['words'] or not b['words'] or not (a['words'] <= b['words'] or b['words'] <= a['words']):
+            # Without initials, compatible names are one word set inside the other
+            return False
+        if not a['headline'] or not b['headline']:
+            return True
+        return jaccard(a['headline'], b['headline']) >= self.headline_threshold
+
+    @staticmethod
+    def _score(a, b):
+        """How strongly two verified candidates agree, used to pick between anchors"""
+        score = jaccard(a['headline'], b['headline']) if a['headline'] and b['headline'] else 0.5
+        score += 1.0 if a['words'] == b['words'] else 0.5
+        if a['location'] and a['location'] == b['location']:
+            score += 0.25
+        return score
+
+    def _blocks(self, features):
+        blocks = {}
+        for index, feature in enumerate(features):
+            if not feature['name_key']:
+                continue
+            blocks.setdefault(('name', feature['name_key']), []).append(index)
+            for band in feature['bands']:
+                blocks.setdefault(('lsh', feature['name_key'], band), []).append(index)
+                for token in feature['words']:
+                    if len(token) > 1:
+                        blocks.setdefault(('lsh_word', token, band), []).append(index)
+                        for other in feature['words']:
+                            if other != token:
+                                blocks.setdefault(('lsh_initial', token, other[0], band), []).append(index)
+        return blocks
+
+    def _candidates(self, index, feature, blocks):
+        candidates = set()
+        name_block = blocks.get(('name', feature['name_key']), ())
+        if len(name_block) <= self.max_block or not feature['headline']:
+            candidates.update(name_block[:self.max_block * 4])
+        if feature['initials']:
+            # 'Priya K' can match any Priya K... with a similar headline
+            initials = [token for token in feature['words'] if len(token) == 1]
+            for token in feature['words']:
+                if len(token) > 1:
+                    for initial in initials:
+                        for band in feature['bands']:
+                            candidates.update(blocks.get(('lsh_initial', token, initial, band), ()))
+        elif len(feature['words']) < 2:
+            # A single name word can match anyone with that word and a similar headline
+            for token in feature['words']:
+                for band in feature['bands']:
+                    candidates.update(blocks.get(('lsh_word', token, band), ()))
+        else:
+            for band in feature['bands']:
+                candidates.update(blocks.get(('lsh', feature['name_key'], band), ()))
+        candidates.discard(index)
+        return sorted(candidates)
+
+    def clusters(self, profiles):
+        """Lists of profile indices that describe the same person, in input order"""
+        features = [self._features(profile) for profile in profiles]
+
+        # Anchors: one cluster per canonical URL
+        anchor_of_url = {}
+        anchor = [None] * len(profiles)
+        for index, feature in enumerate(features):
+            if feature['url']:
+                anchor[index] = anchor_of_url.setdefault(feature['url'], index)
+
+        parent = {}
+
+        def find(index):
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        loose = [index for index, feature in enumerate(features) if not feature['url']]
+        for index in loose:
+            parent[index] = index
+
+        # Fuzzy pass, only for profiles without a URL
+        blocks = self._blocks(features)
+        attached = {}
+        for index in loose:
+            feature = features[index]
+            best_score, best_anchors = 0.0, set()
+            for other in self._candidates(index, feature, blocks):
+                self.candidate_pairs += 1
+                if not self._same_person(feature, features[other]):
+                    continue
+                if anchor[other] is None:
+                    root_a, root_b = find(index), find(other)
+                    if root_a != root_b:
+                        parent[max(root_a, root_b)] = min(root_a, root_b)
+                    continue
+                score = self._score(feature, features[other])
+                if score > best_score:
+                    best_score, best_anchors = score, {anchor[other]}
+                elif score == best_score:
+                    best_anchors.add(anchor[other])
+            if len(best_anchors) == 1:
+                attached[index] = best_anchors.pop()
+
+        # A group of URL-less profiles joins an anchor when its members agree on one
+        groups = {}
+        for index in loose:
+            groups.setdefault(find(index), []).append(index)
+        for members in groups.values():
+            anchors = {attached[index] for index in members if index in attached}
+            if len(anchors) == 1:
+                target = anchors.pop()
+                for index in members:
+                    anchor[index] = target
+            elif anchors:
+                for index in members:
+                    if index in attached:
+                        anchor[index] = attached[index]
+
+        clusters = {}
+        for index in range(len(profiles)):
+            key = anchor[index] if anchor[index] is not None else ('loose', find(index))
+            clusters.setdefault(key, []).append(index)
+        return sorted(clusters.values())
+
+    @staticmethod
+    def _rank(profile):
+        """Most complete profile first; content tie-break keeps the merge independent of input order"""
+        filled = sum(1 for value in profile.values() if value not in (None, '', [], ()))
+        return (
+            not canonical_profile_url(profile.get('profile_url', '')),
+            -filled,
+            -len(str(profile.get('headline') or '')),
+            json.dumps(profile, sort_keys=True, ensure_ascii=False, default=str)
+        )
+
+    def merge(self, profiles):
+        """One profile from a cluster: the best member, gaps filled from the others
+
+        The best member's profile_url is kept as it was found; the canonical
+        form is only used to compare profiles.
+        """
+        ordered = sorted(profiles, key=self._rank)
+        merged = dict(ordered[0])
+        for profile in ordered[1:]:
+            for key, value in profile.items():
+                current = merged.get(key)
+                if isinstance(current, list) and isinstance(value, list):
+                    merged[key] = current + [item for item in value if item not in current]
+                elif current in (None, '', [], ()) and value not in (None, '', [], ()):
+                    merged[key] = value
+        if normalize_text(merged.get('name')).strip() in PLACEHOLDER_NAMES:
+            for profile in ordered:
+                if name_tokens(profile.get('name')):
+                    merged['name'] = profile['name']
+                    break
+        return merged
+
+    def dedupe(self, profiles):
+        """Merged profiles, one per person, in order of first appearance"""
+        profiles = [profile for profile in profiles if profile]
+        merged = [self.merge([profiles[index] for index in members]) for members in self.clusters(profiles)]
+        self.merged_count = len(profiles) - len(merged)
+        return merged
+
+    def report(self):
+        print(f"🧬 Dedup: merged {self.merged_count} duplicates after checking {self.candidate_pairs} candidate pairs")
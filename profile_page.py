@@ -0,0 +1,212 @@
+import json
+from lxml import etree, html
+from page_waits import default_waiter
+from profile_records import education_records, experience_records
+
+CIT_SCHOOL = 'Chennai Institute of Technology'
+
+EXPERIENCE_SECTION_CLASS = 'artdeco-card pv-profile-card break-words mt2'
+
+# Text nodes as BeautifulSoup's get_text() sees them: script and style contents are skipped
+TEXT_XPATH = etree.XPath('.//text()[not(parent::script or parent::style or parent::template)]')
+# Text of one list entry that is not inside an entry nested in it
+ENTRY_TEXT_XPATH = etree.XPath(
+    './/text()[count(ancestor::li) = $depth][not(parent::script or parent::style or parent::template)]'
+)
+H1_XPATH = etree.XPath('(//h1)[1]')
+ANCHORED_SECTION_XPATH = etree.XPath("//section[.//div[@id = $anchor]]")
+TOP_ENTRY_XPATH = etree.XPath('.//li[not(ancestor::li)]')
+NESTED_ENTRY_XPATH = etree.XPath('.//li[count(ancestor::li) = $depth]')
+EXPERIENCE_SECTION_XPATH = etree.XPath(
+    "//section[normalize-space(@class) = $section_class][.//div[@id = 'experience']]"
+)
+
+# Runs in the browser and returns only what extract_profile needs, as one
+# compact JSON string: the h1, the entries of the education and experience
+# sections (each entry's own lines plus the lines of entries nested in it)
+# and the experience section lines (null while the section has not rendered).
+PROFILE_SCRIPT = """
+const sectionClass = arguments[0];
+function textLines(root, owner) {
+    const lines = [];
+    const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT);
+    while (walker.nextNode()) {
+        const node = walker.currentNode;
+        const parent = node.parentNode.nodeName;
+        const text = node.nodeValue.trim();
+        if (text && parent !== 'SCRIPT' && parent !== 'STYLE' && (!owner || node.parentNode.closest('li') === owner)) {
+            lines.push(text);
+        }
+    }
+    return lines;
+}
+function entries(anchor) {
+    const sections = Array.from(document.getElementsByTagName('section')).filter(
+        section => section.querySelector('div#' + anchor));
+    if (!sections.length) {
+        return null;
+    }
+    return Array.from(sections[sections.length - 1].querySelectorAll('li'))
+        .filter(li => !li.parentNode.closest('li'))
+        .map(li => ({
+            lines: textLines(li, li),
+            nested: Array.from(li.querySelectorAll('li'))
+                .filter(nested => nested.parentNode.closest('li') === li)
+                .map(nested => textLines(nested, null))
+        }));
+}
+const h1 = document.querySelector('h1');
+let experiences = null;
+for (const section of document.getElementsByTagName('section')) {
+    if ((section.getAttribute('class') || '').trim().split(/\\s+/).join(' ') !== sectionClass ||
+        !section.querySelector('div#experience')) {
+        continue;
+    }
+    let lines = textLines(section, null).join('\\n').split('\\n').filter(line => line.trim());
+    if (lines.length && lines[0].includes('Experience')) {
+        lines = lines.slice(1);
+    }
+    experiences = lines;
+}
+return JSON.stringify({
+    name: h1 ? h1.innerText.trim() : null,
+    education: entries('education'),
+    positions: entries('experience'),
+    experiences: experiences
+});
+"""
+
+
+def new_profile(profile_url):
+    return {
+        'profile_url': profile_url,
+        'name': "N/A",
+        'grad_year': None,
+        'experiences': [],
+        'education': [],
+        'positions': [],
+        'eligible': False
+    }
+
+
+def apply_education(profile, education, max_grad_year=2025):
+    """Take the graduation year from the CIT education records and decide eligibility"""
+    for record in education:
+        if CIT_SCHOOL in record.school and record.grad_year is not None:
+            profile['grad_year'] = record.grad_year
+            if profile['grad_year'] < max_grad_year:
+                profile['eligible'] = True
+                break
+    return profile
+
+
+def text_parts(element):
+    return [part for part in (text.strip() for text in TEXT_XPATH(element)) if part]
+
+
+def section_entries(document, anchor):
+    """The entries of the section holding div#anchor, shaped like PROFILE_SCRIPT's"""
+    sections = ANCHORED_SECTION_XPATH(document, anchor=anchor)
+    if not sections:
+        return None
+    entries = []
+    for li in TOP_ENTRY_XPATH(sections[-1]):
+        own = [text.strip() for text in ENTRY_TEXT_XPATH(li, depth=1)]
+        entries.append({
+            'lines': [line for line in own if line],
+            'nested': [text_parts(nested) for nested in NESTED_ENTRY_XPATH(li, depth=1)]
+        })
+    return entries
+
+
+def experience_lines(section):
+    """Experience section lines, without the section title"""
+    lines = [line for line in '\n'.join(text_parts(section)).split('\n') if line.strip()]
+    if lines and 'Experience' in lines[0]:
+        lines = lines[1:]
+    return lines
+
+
+def profile_data_from_html(page_source):
+    """The PROFILE_SCRIPT result, computed with lxml from a stored page_source snapshot"""
+    document = html.fromstring(page_source)
+
+    name_elem = H1_XPATH(document)
+    experiences = None
+    try:
+        for section in EXPERIENCE_SECTION_XPATH(document, section_class=EXPERIENCE_SECTION_CLASS):
+            experiences = experience_lines(section)
+    except Exception as e:
+        print("Experience extraction error:", e)
+
+    return {
+        'name': ''.join(text_parts(name_elem[0])) if name_elem else None,
+        'education': section_entries(document, 'education'),
+        'positions': section_entries(document, 'experience'),
+        'experiences': experiences
+    }
+
+
+def profile_from_data(profile_url, data, max_grad_year=2025):
+    profile = new_profile(profile_url)
+    if data['name'] is not None:
+        profile['name'] = data['name']
+    profile['education'] = education_records(data['education'] or [])
+    apply_education(profile, profile['education'], max_grad_year)
+    if profile['eligible']:
+        profile['experiences'] = data['experiences'] or []
+        profile['positions'] = experience_records(data['positions'] or [])
+    return profile
+
+
+def extract_profile_from_html(page_source, profile_url, max_grad_year=2025):
+    """Same extraction as extract_profile, from a stored page_source snapshot"""
+    return profile_from_data(profile_url, profile_data_from_html(page_source), max_grad_year)
+
+
+def read_profile_data(browser):
+    """Name, education and experience entries of the open profile in one execute_script call"""
+    return json.loads(browser.execute_script(PROFILE_SCRIPT, EXPERIENCE_SECTION_CLASS))
+
+
+def extract_profile(browser, profile_url, waiter=default_waiter, max_grad_year=2025, page_cache=None):
+    """Visit one profile page and pull name, CIT graduation year and experience lines
+
+    Everything is read in one execute_script call that returns a few hundred
+    bytes of JSON, instead of element lookups plus a full page_source
+    transfer and parse. The experience section is only waited for (and read
+    a second time) when an eligible profile has not rendered it yet.
+
+    With a page_cache, a cached page_source snapshot is parsed instead of
+    visiting the page, so parse-only runs re-run the whole extraction on
+    it, and every visited page is stored as a snapshot once it has been
+    read. Only caching runs pay for the page_source transfer. Entries that
+    hold the JSON read from a page (older runs) are still accepted. In
+    parse-only mode a cache miss returns None without touching the browser.
+    """
+    if page_cache:
+        cached = page_cache.get(profile_url)
+        if cached is not None:
+            if cached.startswith('{'):
+                return profile_from_data(profile_url, json.loads(cached), max_grad_year)
+            return extract_profile_from_html(cached, profile_url, max_grad_year)
+        if page_cache.offline:
+            return None
+
+    browser.get(profile_url)
+    # Wait for the dynamic content we read instead of a fixed delay
+    waiter.wait_for(browser, 'profile_h1')
+    waiter.wait_for(browser, 'education_section')
+
+    data = read_profile_data(browser)
+    profile = profile_from_data(profile_url, data, max_grad_year)
+    if profile['eligible'] and data['experiences'] is None:
+        if waiter.wait_for(browser, 'experience_section'):
+            data = read_profile_data(browser)
+            profile['experiences'] = data['experiences'] or []
+            profile['positions'] = experience_records(data['positions'] or [])
+
+    # The rendered page, so a parse-only run can re-extract it with changed extraction logic
+    if page_cache:
+        page_cache.put(profile_url, browser.page_source)
+    return profile
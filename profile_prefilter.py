@@ -0,0 +1,218 @@
+import csv
+import os
+import re
+from incremental_sync import canonical_profile_url
+from result_classifier import CIT_KEYWORDS, ROLE_PATTERNS
+
+# '2021 - 2025', '2019-23', '2020 to 2024': the end of a course, but just as often a job tenure
+YEAR_RANGE_PATTERN = re.compile(r"\b((?:19|20)\d{2})\s*(?:-|–|—|to)\s*((?:19|20)?\d{2})\b", re.IGNORECASE)
+# "CIT '23": usually the batch, but nothing on the card says so
+SHORT_YEAR_PATTERN = re.compile(r"(?:^|\s)[’']((?:[0-3])\d)\b")
+# 'Batch of 2026', 'Class of 2023', 'graduating 2025', '2024 passout': the graduation year in so many words
+STATED_YEAR_PATTERNS = [
+    re.compile(r"\b(?:batch|class|graduat\w*|pass\s*out|passed\s+out)\W+(?:of\s+|in\s+)?((?:19|20)\d{2})\b", re.IGNORECASE),
+    re.compile(r"\b((?:19|20)\d{2})\s+(?:batch|graduate|pass\s*out|passout)\b", re.IGNORECASE)
+]
+STUDENT_PATTERN = re.compile(
+    r"\b(student|studying|pursuing|undergraduate|final\s+year|pre-final\s+year|\d(?:st|nd|rd|th)\s+year|aspiring)\b",
+    re.IGNORECASE
+)
+ALUMNI_PATTERN = re.compile(r"\b(alumn\w*|graduated|graduate\s+of|former|ex-)\b", re.IGNORECASE)
+FACULTY_ROLES = frozenset(['professor', 'academic_staff'])
+
+REJECT = float('-inf')
+
+
+def stated_grad_year(text):
+    """Graduation year the card states with batch, class or graduation wording, or None"""
+    for pattern in STATED_YEAR_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def likely_grad_year(text):
+    """Year a short year range or "'23" on the card probably ends a course in, or None
+
+    Only a hint: 'Intern 2019 - 2021' matches just as well.
+    """
+    match = SHORT_YEAR_PATTERN.search(text)
+    if match:
+        return 2000 + int(match.group(1))
+    match = YEAR_RANGE_PATTERN.search(text)
+    if match:
+        start, end = match.groups()
+        end = int(end) if len(end) == 4 else int(start[:2] + end)
+        if 0 < end - int(start) <= 6:
+            return end
+    return None
+
+
+def role_category(text):
+    for category, pattern in ROLE_PATTERNS:
+        if pattern.search(text):
+            return category
+    return None
+
+
+def card_text(candidate):
+    return ' '.join(str(candidate.get(field) or '') for field in ('headline', 'about', 'summary'))
+
+
+# Predicates get the card text and the filter, and return (points, reason),
+# REJECT when the card shows the profile cannot pass, or None to abstain.
+# Only explicit graduation wording rejects; hints alone stay above skip_at
+
+def grad_year_predicate(text, prefilter):
+    year = stated_grad_year(text)
+    if year is not None:
+        if year >= prefilter.max_grad_year:
+            return REJECT, f"graduates {year}"
+        return 3, f"graduated {year}"
+    year = likely_grad_year(text)
+    if year is None:
+        return None
+    if year >= prefilter.max_grad_year:
+        return -1, f"likely graduates {year}"
+    return 1, f"likely graduated {year}"
+
+
+def student_predicate(text, prefilter):
+    if not STUDENT_PATTERN.search(text) or ALUMNI_PATTERN.search(text):
+        return None
+    if not any(keyword in text.lower() for keyword in CIT_KEYWORDS):
+        # A student somewhere else may still hold an earlier CIT degree
+        return -1, "student elsewhere"
+    # A PG student at CIT may hold an earlier CIT degree too, so this only deprioritizes
+    return -1, "current CIT student"
+
+
+def alumni_predicate(text, prefilter):
+    if ALUMNI_PATTERN.search(text):
+        return 2, "alumni"
+    return None
+
+
+def role_predicate(text, prefilter):
+    if STUDENT_PATTERN.search(text):
+        return None
+    category = role_category(text)
+    if category == 'professional':
+        return 1, "working professional"
+    if category in FACULTY_ROLES:
+        return -1, "faculty"
+    return None
+
+
+DEFAULT_PREDICATES = [grad_year_predicate, student_predicate, alumni_predicate, role_predicate]
+
+
+class ProfilePreFilter:
+    """Score profile candidates from their search-card data before any profile page is loaded
+
+    Every predicate looks at the card (headline and whatever else the search
+    collected) and adds points, abstains, or rejects the candidate outright
+    when the card states a graduation year (batch, class or graduation
+    wording) that cannot pass the grad_year < max_grad_year check. Hints
+    such as a year range or a current CIT student only lower the score,
+    since such cards can still pass. In 'skip' mode rejected candidates and those scoring at or below skip_at are not
+    visited; in 'deprioritize' mode they are visited last. Candidates without
+    card data score 0 and are always visited. Each skipped candidate is one
+    profile page load avoided.
+    """
+
+    def __init__(self, max_grad_year=2025, mode='skip', skip_at=-3, predicates=None):
+        self.max_grad_year = max_grad_year
+        self.mode = mode
+        self.skip_at = skip_at
+        self.predicates = list(DEFAULT_PREDICATES if predicates is None else predicates)
+        self.candidates = 0
+        self.skipped = []
+        self.deferred = []
+
+    def score(self, candidate):
+        """(score, reasons), with score REJECT when a predicate rejected the candidate"""
+        text = card_text(candidate)
+        if not text.strip():
+            return 0, []
+        score, reasons = 0, []
+        for predicate in self.predicates:
+            verdict = predicate(text, self)
+            if verdict is None:
+                continue
+            points, reason = verdict
+            reasons.append(reason)
+            if points == REJECT:
+                return REJECT, reasons
+            score += points
+        return score, reasons
+
+    def cannot_pass(self, score):
+        return score <= self.skip_at
+
+    def plan(self, candidates, cards=()):
+        """Candidates worth a page load, most promising first (input order among equals)
+
+        Candidates are merged by canonical profile URL, so a bare URL and the
+        search card of the same person are scored together. cards only add
+        what they know to candidates with the same canonical URL; a card
+        matching no candidate is ignored, so cards never widen the visit list.
+        """
+        merged = {}
+        for candidate in candidates:
+            key = canonical_profile_url(candidate.get('profile_url', ''))
+            if not key:
+                continue
+            if key in merged:
+                for field, value in candidate.items():
+                    if value and not merged[key].get(field):
+                        merged[key][field] = value
+            else:
+                merged[key] = dict(candidate)
+        for card in cards:
+            candidate = merged.get(canonical_profile_url(card.get('profile_url', '')))
+            if candidate is None:
+                continue
+            for field, value in card.items():
+                if value and not candidate.get(field):
+                    candidate[field] = value
+
+        self.candidates = len(merged)
+        self.skipped, self.deferred = [], []
+        scored = []
+        for position, candidate in enumerate(merged.values()):
+            score, reasons = self.score(candidate)
+            if self.mode and self.cannot_pass(score):
+                if self.mode == 'skip':
+                    self.skipped.append((candidate, reasons))
+                    continue
+                self.deferred.append((candidate, reasons))
+                candidate['deferred'] = True
+                score = REJECT
+            scored.append((-score if self.mode else 0, position, candidate))
+        return [candidate for _, _, candidate in sorted(scored, key=lambda item: item[:2])]
+
+    @property
+    def page_loads_avoided(self):
+        return len(self.skipped)
+
+    def report(self, results=None):
+        """Print what was skipped or deferred and, given the extraction results, how many visits paid off"""
+        print(f"🚦 Pre-filter ({self.mode or 'off'}): {self.candidates} candidates, "
+              f"{len(self.skipped)} skipped, {len(self.deferred)} visited last")
+        for candidate, reasons in self.skipped[:5]:
+            print(f"   ⏭️ {candidate.get('name') or candidate.get('profile_url')}: {', '.join(reasons)}")
+        if results is not None:
+            visited = [result for result in results if result]
+            eligible = sum(1 for result in visited if result.get('eligible'))
+            print(f"   {eligible} of {len(visited)} visited profiles were eligible")
+        print(f"   ⚡ {self.page_loads_avoided} profile page loads avoided")
+
+
+def load_search_cards(path):
+    """Search-card rows saved by direct_profile_extractor.py (name, headline, profile_url, location)"""
+    if not path or not os.path.exists(path):
+        return []
+    with open(path, newline='', encoding='utf-8') as file:
+        return [row for row in csv.DictReader(file) if row.get('profile_url')]
@@ -0,0 +1,199 @@
+import re
+from dataclasses import dataclass
+from result_classifier import LOCATION_KEYWORDS
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+EMPLOYMENT_TYPES = frozenset([
+    'full-time', 'part-time', 'self-employed', 'freelance', 'contract', 'internship',
+    'apprenticeship', 'seasonal', 'trainee'
+])
+
+WORKPLACE_TYPES = frozenset(['on-site', 'hybrid', 'remote'])
+
+_MONTH = r'(?:(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+)?'
+
+# 'Jul 2023 - Present · 1 yr 4 mos', '2019 - 2023', 'Jan 2023 - Jun 2023 · 6 mos', 'May 2024'
+DATE_RANGE_PATTERN = re.compile(
+    rf'^{_MONTH}(\d{{4}})(?:\s*[-–—]\s*(?:{_MONTH}(\d{{4}})|(present)))?\s*(?:·\s*(.*))?$',
+    re.IGNORECASE
+)
+
+DURATION_PATTERN = re.compile(r'(\d+)\s*(yr|mo)', re.IGNORECASE)
+
+DURATION_ONLY_PATTERN = re.compile(r'^(?:\d+\s*(?:yrs?|mos?)\s*)+$', re.IGNORECASE)
+
+
+@dataclass(slots=True)
+class ExperienceRecord:
+    """One position from the experience section"""
+    title: str
+    company: str = None
+    employment_type: str = None
+    start_year: int = None
+    start_month: int = None
+    end_year: int = None
+    end_month: int = None
+    current: bool = False
+    duration_months: int = None
+    location: str = None
+    workplace: str = None
+
+
+@dataclass(slots=True)
+class EducationRecord:
+    """One entry from the education section"""
+    school: str
+    degree: str = None
+    field: str = None
+    start_year: int = None
+    end_year: int = None
+
+    @property
+    def grad_year(self):
+        return self.end_year if self.end_year is not None else self.start_year
+
+
+def parse_duration(text):
+    """'1 yr 4 mos' -> 16, None when there is no duration"""
+    months = None
+    for amount, unit in DURATION_PATTERN.findall(text or ''):
+        months = (months or 0) + int(amount) * (12 if unit.lower() == 'yr' else 1)
+    return months
+
+
+def parse_date_range(line):
+    """(start_year, start_month, end_year, end_month, current, duration_months), or None if line is not a date range"""
+    match = DATE_RANGE_PATTERN.match(line.strip())
+    if not match:
+        return None
+    start_month, start_year, end_month, end_year, present, duration = match.groups()
+    return (
+        int(start_year),
+        MONTHS[start_month.lower()] if start_month else None,
+        int(end_year) if end_year else None,
+        MONTHS[end_month.lower()] if end_month else None,
+        bool(present),
+        parse_duration(duration)
+    )
+
+
+def distinct_lines(lines):
+    """Drop the consecutive repeats LinkedIn renders for screen readers"""
+    result = []
+    for line in lines:
+        if not result or line != result[-1]:
+            result.append(line)
+    return result
+
+
+def split_dot(line):
+    return [part.strip() for part in line.split('·') if part.strip()]
+
+
+def looks_like_location(line):
+    parts = split_dot(line)
+    if not parts or len(line) > 80:
+        return False
+    lower = parts[0].lower()
+    return ',' in lower or lower in WORKPLACE_TYPES or any(keyword in lower for keyword in LOCATION_KEYWORDS)
+
+
+def date_line_index(lines):
+    for index, line in enumerate(lines):
+        if parse_date_range(line):
+            return index
+    return None
+
+
+def experience_record(lines, company=None, employment_type=None):
+    """Record for one position: title, then company and type, date range, location"""
+    lines = distinct_lines(lines)
+    if not lines:
+        return None
+    record = ExperienceRecord(title=lines[0], company=company, employment_type=employment_type)
+
+    dates = date_line_index(lines)
+    details = lines[1:dates] if dates is not None else lines[1:2]
+    for line in details:
+        for part in split_dot(line):
+            if part.lower() in EMPLOYMENT_TYPES:
+                record.employment_type = part
+            elif record.company is None and not DURATION_ONLY_PATTERN.match(part):
+                record.company = part
+
+    if dates is not None:
+        (record.start_year, record.start_month, record.end_year, record.end_month,
+         record.current, record.duration_months) = parse_date_range(lines[dates])
+        if dates + 1 < len(lines) and looks_like_location(lines[dates + 1]):
+            parts = split_dot(lines[dates + 1])
+            if parts[0].lower() in WORKPLACE_TYPES:
+                record.workplace = parts[0]
+            else:
+                record.location = parts[0]
+                record.workplace = parts[1] if len(parts) > 1 and parts[1].lower() in WORKPLACE_TYPES else None
+    return record
+
+
+def experience_records(entries):
+    """Records for every experience entry; an entry with nested positions is one company with several roles
+
+    Each entry is {'lines': [...], 'nested': [[...], ...]}: the entry's own
+    lines and the lines of every position nested inside it.
+    """
+    records = []
+    for entry in entries:
+        nested = [lines for lines in entry.get('nested') or [] if lines]
+        if not nested:
+            record = experience_record(entry['lines'])
+            if record:
+                records.append(record)
+            continue
+
+        # Grouped positions: the entry holds the company, its first detail line the shared type
+        header = distinct_lines(entry['lines'])
+        company = header[0] if header else None
+        employment_type = None
+        for line in header[1:2]:
+            for part in split_dot(line):
+                if part.lower() in EMPLOYMENT_TYPES:
+                    employment_type = part
+        location = next((split_dot(line)[0] for line in header[1:] if looks_like_location(line)), None)
+        for lines in nested:
+            record = experience_record(lines, company, employment_type)
+            if record:
+                if record.location is None:
+                    record.location = location
+                records.append(record)
+    return records
+
+
+def education_record(lines):
+    """Record for one education entry: school, then 'Degree, Field', then the years"""
+    lines = distinct_lines(lines)
+    if not lines:
+        return None
+    record = EducationRecord(school=lines[0])
+
+    dates = date_line_index(lines[1:])
+    if dates is not None:
+        dates += 1
+        record.start_year, _, record.end_year = parse_date_range(lines[dates])[:3]
+    degree_lines = lines[1:dates] if dates is not None else lines[1:2]
+    if degree_lines:
+        degree, _, field = degree_lines[0].partition(',')
+        record.degree = degree.strip() or None
+        record.field = field.strip() or None
+    return record
+
+
+def education_records(entries):
+    records = []
+    for entry in entries:
+        record = education_record(entry['lines'])
+        if record:
+            records.append(record)
+    return records
@@ -0,0 +1,410 @@
+import collections
+import csv
+import difflib
+import os
+import re
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from lxml import html
+import parameters
+from bulk_writer import SupabaseBulkWriter
+from csv_sink import StreamingCSVWriter
+from fetch_scheduler import FetchScheduler, PageBudgetExhausted
+from incremental_sync import canonical_profile_url, stable_profile_id
+from rate_limiter import RateLimiter
+from search_result_parser import clean_profile_url, is_cit_related, parse_search_results
+
+# Most specific first: a confident match on the name search saves the rest
+SEARCH_SOURCES = ['name_search_url', 'google_search_url', 'role_search_url', 'location_search_url']
+
+RESOLVED_CSV = 'resolved_profile_urls.csv'
+REVIEW_CSV = 'profile_review_queue.csv'
+RESOLVED_FIELDNAMES = ['name', 'headline', 'location', 'profile_url', 'score', 'source']
+REVIEW_FIELDNAMES = ['name', 'headline', 'location', 'best_url', 'best_score', 'candidates']
+
+WORD_PATTERN = re.compile(r"[a-z]+")
+HEADLINE_STOP_WORDS = frozenset(['at', 'of', 'the', 'in', 'and', 'a', 'an', 'for', 'to', 'from'])
+# 'Arjun S S - Student - Chennai Institute of Technology | LinkedIn'
+GOOGLE_TITLE_SUFFIX = re.compile(r"\s*[|\-–]\s*LinkedIn\b.*$", re.IGNORECASE)
+
+
+def words(text):
+    return WORD_PATTERN.findall((text or '').lower())
+
+
+def card_name(name):
+    """'Arjun S S · 2nd' -> 'Arjun S S'"""
+    return (name or '').split('·')[0].strip()
+
+
+def name_similarity(known, candidate):
+    """0..1, the share of the known name's words in the candidate's name or their spelling similarity if higher"""
+    known_words, candidate_words = words(known), words(candidate)
+    if not known_words or not candidate_words:
+        return 0.0
+    overlap = len(set(known_words) & set(candidate_words)) / len(set(known_words))
+    spelling = difflib.SequenceMatcher(None, ' '.join(known_words), ' '.join(candidate_words)).ratio()
+    return max(overlap, spelling)
+
+
+def name_in_headline(headline, candidate):
+    """0..1, the share of the candidate's name words written in the known headline
+
+    Titles like 'Arjun S S - Student at CIT' give no name to the enhancer
+    (initials are not name words) but still name the person.
+    """
+    candidate_words = words(candidate)
+    if not candidate_words:
+        return 0.0
+    headline_words = set(words(headline))
+    return sum(1 for word in candidate_words if word in headline_words) / len(candidate_words)
+
+
+def headline_similarity(known, candidate):
+    """Jaccard similarity of the two headlines' words, stop words left out"""
+    known_words = set(words(known)) - HEADLINE_STOP_WORDS
+    candidate_words = set(words(candidate)) - HEADLINE_STOP_WORDS
+    if not known_words or not candidate_words:
+        return 0.0
+    return len(known_words & candidate_words) / len(known_words | candidate_words)
+
+
+def match_score(profile, candidate):
+    """0..1 confidence that a search candidate is the enhanced profile: name 0.6, headline 0.3, CIT 0.1"""
+    # The enhancer's names can carry role words ('Vishnu Ram Data Analyst'), the headline still has the real one
+    name = name_in_headline(profile.get('headline', ''), candidate['name'])
+    if profile.get('name'):
+        name = max(name, name_similarity(profile['name'], candidate['name']))
+    headline = headline_similarity(profile.get('headline', ''), candidate.get('headline', ''))
+    return round(0.6 * name + 0.3 * headline + 0.1 * bool(candidate.get('cit_related')), 3)
+
+
+def search_candidates(page_source):
+    """Candidates from a LinkedIn people-search page: every result card with a profile link"""
+    candidates = []
+    for result in parse_search_results(page_source):
+        if not result['profile_url']:
+            continue
+        candidates.append({
+            'name': card_name(result['profile'].get('name')),
+            'headline': result['profile'].get('headline', ''),
+            'location': result['profile'].get('location', ''),
+            'profile_url': result['profile_url'],
+            'cit_related': result['cit_related']
+        })
+    return candidates
+
+
+def google_candidates(page_source):
+    """Candidates from a Google results page: every LinkedIn /in/ link, named by its result title"""
+    if not page_source:
+        return []
+    candidates = []
+    seen = set()
+    for link in html.fromstring(page_source).iterfind('.//a[@href]'):
+        href = link.get('href')
+        if href.startswith('/url?'):
+            # Google's redirect links carry the target in q
+            href = urllib.parse.parse_qs(urllib.parse.urlsplit(href).query).get('q', [''])[0]
+        profile_url = clean_profile_url(href) if 'linkedin.com/in/' in href else None
+        if not profile_url or canonical_profile_url(profile_url) in seen:
+            continue
+        seen.add(canonical_profile_url(profile_url))
+        title = GOOGLE_TITLE_SUFFIX.sub('', ' '.join(link.text_content().split()))
+        name, _, headline = title.partition(' - ')
+        candidates.append({
+            'name': name.strip(),
+            'headline': headline.strip(),
+            'location': '',
+            'profile_url': profile_url,
+            'cit_related': is_cit_related(title)
+        })
+    return candidates
+
+
+def page_candidates(url, page_source):
+    if 'google.' in urllib.parse.urlsplit(url).netloc:
+        return google_candidates(page_source)
+    return search_candidates(page_source)
+
+
+class ProfileResolver:
+    """Turn the enhancer's search URLs into real profile URLs without a human clicking through them
+
+    For each enhanced profile the search URLs are fetched in SEARCH_SOURCES
+    order with fetch_page(url), every result is scored against the known
+    name and headline (match_score), and candidates are merged by canonical
+    URL keeping their best score. A best candidate scoring at least
+    accept_at and at least margin above the runner-up is a confident match
+    and the remaining searches are skipped. Otherwise every search is tried,
+    and a best score of at least review_at queues the profile for review
+    with its top candidates; lower ones stay unresolved.
+
+    Profiles are resolved on concurrency threads. Every page load waits for
+    the shared RateLimiter and is charged to the scheduler's page budget;
+    page_cache hits cost neither. Once the budget is spent the remaining
+    profiles come back with status 'budget' and can be resolved next run.
+    """
+
+    def __init__(self, fetch_page, concurrency=2, requests_per_minute=None, scheduler=None, page_cache=None,
+                 accept_at=0.8, margin=0.15, review_at=0.5, sources=SEARCH_SOURCES):
+        self.fetch_page = fetch_page
+        self.concurrency = max(1, int(concurrency))
+        self.rate_limiter = RateLimiter(requests_per_minute)
+        self.scheduler = scheduler if scheduler is not None else FetchScheduler()
+        self.page_cache = page_cache
+        self.accept_at = accept_at
+        self.margin = margin
+        self.review_at = review_at
+        self.sources = list(sources)
+        self.lock = threading.Lock()
+        self.counts = collections.Counter()
+        self.pages_fetched = 0
+        self.elapsed = 0.0
+
+    def load_page(self, url):
+        """page_source of one search URL, from the page cache or a rate-limited, budgeted fetch"""
+        if self.page_cache is not None:
+            page_source = self.page_cache.get(url)
+            if page_source is not None or self.page_cache.offline:
+                return page_source
+        if not self.scheduler.charge():
+            raise PageBudgetExhausted(f"page budget of {self.scheduler.budget} spent")
+        self.rate_limiter.acquire()
+        page_source = self.fetch_page(url)
+        with self.lock:
+            self.pages_fetched += 1
+        if page_source and self.page_cache is not None:
+            self.page_cache.put(url, page_source)
+        return page_source
+
+    def ranked(self, candidates):
+        return sorted(candidates.values(), key=lambda candidate: -candidate['score'])
+
+    def confident(self, ranked):
+        if not ranked or ranked[0]['score'] < self.accept_at:
+            return False
+        return len(ranked) < 2 or ranked[0]['score'] - ranked[1]['score'] >= self.margin
+
+    def resolve_one(self, profile):
+        """{'profile', 'status': matched/review/unresolved/budget/error, 'match', 'candidates', 'pages'}"""
+        outcome = {'profile': profile, 'status': 'unresolved', 'match': None, 'candidates': [], 'pages': 0}
+        candidates = {}
+        try:
+            for source in self.sources:
+                url = profile.get(source)
+                if not url:
+                    continue
+                page_source = self.load_page(url)
+                outcome['pages'] += 1
+                for candidate in page_candidates(url, page_source):
+                    candidate['score'] = match_score(profile, candidate)
+                    candidate['source'] = source.replace('_url', '')
+                    key = canonical_profile_url(candidate['profile_url'])
+                    if key not in candidates or candidate['score'] > candidates[key]['score']:
+                        candidates[key] = candidate
+                if self.confident(self.ranked(candidates)):
+                    break
+        except PageBudgetExhausted:
+            outcome['status'] = 'budget'
+        except Exception as e:
+            print(f"   ❌ Error resolving {profile.get('name') or profile.get('headline')}: {e}")
+            outcome['status'] = 'error'
+
+        ranked = self.ranked(candidates)
+        outcome['candidates'] = ranked[:3]
+        if outcome['status'] in ('unresolved', 'budget') and self.confident(ranked):
+            outcome['status'] = 'matched'
+            outcome['match'] = ranked[0]
+        elif outcome['status'] == 'unresolved' and ranked and ranked[0]['score'] >= self.review_at:
+            # Only once every search was tried, a profile cut short by the budget is retried next run
+            outcome['status'] = 'review'
+        with self.lock:
+            self.counts[outcome['status']] += 1
+        return outcome
+
+    def resolve(self, profiles):
+        """Outcomes in input order, resolving at most two profiles per thread ahead of the consumer"""
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            in_flight = collections.deque()
+            for profile in profiles:
+                in_flight.append(executor.submit(self.resolve_one, profile))
+                if len(in_flight) >= self.concurrency * 2:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+        self.elapsed = time.monotonic() - started
+
+    def report(self):
+        resolved = sum(self.counts.values())
+        print(f"🔎 Resolver: {resolved} profiles, {self.counts['matched']} matched, {self.counts['review']} for review, "
+              f"{self.counts['unresolved']} unresolved, {self.counts['budget']} left for the next run, "
+              f"{self.counts['error']} errors")
+        print(f"   {self.pages_fetched} search pages fetched in {self.elapsed:.1f}s "
+              f"({self.pages_fetched / resolved if resolved else 0:.1f} per profile)")
+
+
+class ResolutionWriter:
+    """Write resolver outcomes back as they arrive
+
+    Confident matches go to RESOLVED_CSV and, with a Supabase client, onto
+    the profile's placeholder row (same stable profile_id the enhancer
+    wrote) in batched upserts of profile_url; ambiguous ones go to
+    REVIEW_CSV with their top candidates. Rows of an earlier run's CSVs are
+    carried over, and those profiles are not resolved again.
+    """
+
+    def __init__(self, client=None, table=None, resolved_path=RESOLVED_CSV, review_path=REVIEW_CSV, batch_size=500):
+        self.done = set()
+        carried_resolved = self.previous_rows(resolved_path)
+        carried_review = self.previous_rows(review_path)
+        self.resolved = StreamingCSVWriter(resolved_path, RESOLVED_FIELDNAMES)
+        self.review = StreamingCSVWriter(review_path, REVIEW_FIELDNAMES)
+        self.resolved.write_many(carried_resolved)
+        self.review.write_many(carried_review)
+        self.writer = SupabaseBulkWriter(client, table, batch_size=batch_size, on_conflict='profile_id') if client else None
+        self.pending = []
+        self.batch_size = batch_size
+
+    def previous_rows(self, path):
+        if not os.path.exists(path):
+            return []
+        with open(path, newline='', encoding='utf-8') as file:
+            rows = list(csv.DictReader(file))
+        for row in rows:
+            self.done.add(self.key(row))
+        return rows
+
+    @staticmethod
+    def key(profile):
+        # By name and headline only: resolved rows carry the real URL, enhanced rows do not
+        return stable_profile_id({'name': profile.get('name'), 'headline': profile.get('headline')})
+
+    def is_done(self, profile):
+        return self.key(profile) in self.done
+
+    def write(self, outcome):
+        profile = outcome['profile']
+        base = {'name': profile.get('name', ''), 'headline': profile.get('headline', ''), 'location': profile.get('location', '')}
+        if outcome['status'] == 'matched':
+            match = outcome['match']
+            self.resolved.write(dict(base, profile_url=match['profile_url'], score=match['score'], source=match['source']))
+            if self.writer:
+                self.pending.append({
+                    'profile_id': stable_profile_id(profile),
+                    'name': profile.get('name', profile.get('headline', 'Unknown'))[:100],
+                    'profile_url': match['profile_url']
+                })
+                if len(self.pending) >= self.batch_size:
+                    self.flush()
+        elif outcome['status'] == 'review':
+            best = outcome['candidates'][0]
+            self.review.write(dict(
+                base,
+                best_url=best['profile_url'],
+                best_score=best['score'],
+                candidates=' | '.join(f"{candidate['profile_url']} ({candidate['score']})" for candidate in outcome['candidates'])
+            ))
+
+    def flush(self):
+        if self.pending:
+            self.writer.upsert_rows(self.pending)
+            self.pending = []
+
+    def close(self):
+        if self.writer:
+            self.flush()
+            self.writer.report()
+        self.resolved.close()
+        self.review.close()
+
+    def abort(self):
+        self.resolved.abort()
+        self.review.abort()
+
+
+def linkedin_login(driver):
+    """Session pool login hook with the credentials from parameters"""
+    from selenium.webdriver.common.by import By
+    from page_waits import default_waiter, login_challenged
+
+    driver.get("https://www.linkedin.com/login")
+    default_waiter.wait_for(driver, 'login_form')
+    driver.find_element(By.ID, 'username').send_keys(parameters.username)
+    driver.find_element(By.ID, 'password').send_keys(parameters.password)
+    driver.find_element(By.XPATH, "//button[@type='submit']").click()
+    default_waiter.wait_for(driver, 'login_done')
+    if login_challenged(driver):
+        raise RuntimeError("LinkedIn stopped the login at a security checkpoint")
+
+
+def main():
+    from browser_sessions import BrowserSessionPool, chrome_service
+    from fetch_layer import default_fetcher
+    from page_cache import PageCache
+    from profile_url_enhancer import ENHANCED_CSV
+    from profile_worker_pool import make_headless_chrome
+
+    print("🔎 CIT Alumni Profile URL Resolver")
+    print("=" * 50)
+
+    concurrency = getattr(parameters, 'RESOLVER_CONCURRENCY', 2)
+    session_dir = getattr(parameters, 'SESSION_DIR', 'browser_sessions')
+    sessions = BrowserSessionPool(
+        lambda profile_dir: make_headless_chrome(chrome_service(session_dir), profile_dir),
+        login=linkedin_login,
+        size=concurrency,
+        directory=session_dir
+    )
+    client = None
+    try:
+        from supabase import create_client
+        client = create_client(parameters.SUPABASE_URL, parameters.SUPABASE_KEY)
+    except Exception as e:
+        print(f"⚠️ Supabase not connected, writing CSVs only: {e}")
+
+    writer = ResolutionWriter(
+        client, getattr(parameters, 'SUPABASE_TABLE', None), batch_size=getattr(parameters, 'SUPABASE_BATCH_SIZE', 500)
+    )
+    fetcher = None
+    try:
+        sessions.start()
+        fetcher = default_fetcher(sessions, http=getattr(parameters, 'FETCH_HTTP', True))
+        resolver = ProfileResolver(
+            fetcher,
+            concurrency=concurrency,
+            requests_per_minute=getattr(parameters, 'RESOLVER_REQUESTS_PER_MINUTE', 12),
+            scheduler=FetchScheduler(budget=getattr(parameters, 'RESOLVER_PAGE_BUDGET', None)),
+            page_cache=PageCache('page_cache'),
+            accept_at=getattr(parameters, 'RESOLVER_ACCEPT_AT', 0.8),
+            review_at=getattr(parameters, 'RESOLVER_REVIEW_AT', 0.5)
+        )
+        with open(ENHANCED_CSV, 'r', encoding='utf-8') as csvfile:
+            profiles = (profile for profile in csv.DictReader(csvfile) if not writer.is_done(profile))
+            for outcome in resolver.resolve(profiles):
+                writer.write(outcome)
+                if outcome['status'] == 'matched':
+                    print(f"✅ {outcome['profile'].get('name') or outcome['profile'].get('headline')}: "
+                          f"{outcome['match']['profile_url']} ({outcome['match']['score']})")
+        writer.close()
+        resolver.report()
+        print(f"📄 Matches: {RESOLVED_CSV}, review queue: {REVIEW_CSV}")
+    except KeyboardInterrupt:
+        writer.abort()
+        print("\n🛑 Resolver stopped by user")
+    except Exception as e:
+        writer.abort()
+        print(f"❌ Resolver error: {e}")
+    finally:
+        if fetcher is not None:
+            fetcher.report()
+            fetcher.close()
+        sessions.report()
+        sessions.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,225 +1,32 @@
+import collections
 import csv
-import re
+import os
 import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
 from supabase import create_client, Client
 import parameters
-import uuid
+from csv_sink import StreamingCSVWriter
+from incremental_sync import IncrementalSync, stable_profile_id
+from result_classifier import (
+    extract_name_from_title, extract_role_keywords, load_title_caches, resize_title_caches, save_title_caches,
+    title_cache_report
+)
+from parquet_export import ENHANCED_SCHEMA, ParquetSink, parquet_available
 
-class ProfileURLEnhancer:
-    def __init__(self):
-        self.supabase = None
-        
-    def setup_supabase(self):
-        """Setup Supabase connection"""
-        try:
-            print("🗄️ Connecting to Supabase...")
-            self.supabase: Client = create_client(parameters.SUPABASE_URL, parameters.SUPABASE_KEY)
-            print("✅ Supabase connected")
-            return True
-        except Exception as e:
-            print(f"❌ Supabase error: {e}")
-            return False
-    
-    def generate_targeted_search_urls(self, profile_data):
-        """Generate targeted LinkedIn search URLs for each profile"""
-        enhanced_profiles = []
-        
-        for i, profile in enumerate(profile_data):
-            try:
-                title = profile.get('title', '').strip()
-                location = profile.get('location', '').strip()
-                
-                # Skip if no meaningful data
-                if not title:
-                    continue
-                
-                # Handle case where location equals title (common in our data)
-                if location == title:
-                    location = ''
-                
-                print(f"\n👤 Profile {i+1}: {title}")
-                
-                enhanced_profile = {
-                    'original_title': title,
-                    'original_location': location,
-                    'name': '',
-                    'headline': title,
-                    'location': location if location != title else '',
-                    'profile_url': '',
-                    'search_urls': []
-                }
-                
-                # Extract potential name and role
-                name_match = self.extract_name_from_title(title)
-                if name_match:
-                    enhanced_profile['name'] = name_match
-                    print(f"   👤 Extracted name: {name_match}")
-                
-                # Generate multiple targeted search URLs
-                search_urls = []
-                
-                # 1. Direct name + CIT search
-                if enhanced_profile['name']:
-                    name_search = f"{enhanced_profile['name']} Chennai Institute of Technology"
-                    search_urls.append({
-                        'type': 'name_search',
-                        'url': f"https://www.linkedin.com/search/results/people/?keywords={urllib.parse.quote(name_search)}",
-                        'description': f"Search for {enhanced_profile['name']} at CIT"
-                    })
-                
-                # 2. Role + CIT search
-                role_keywords = self.extract_role_keywords(title)
-                if role_keywords:
-                    role_search = f"{role_keywords} Chennai Institute of Technology"
-                    search_urls.append({
-                        'type': 'role_search',
-                        'url': f"https://www.linkedin.com/search/results/people/?keywords={urllib.parse.quote(role_search)}",
-                        'description': f"Search for {role_keywords} at CIT"
-                    })
-                
-                # 3. Location-specific search
-                if location and location != title:
-                    location_search = f"Chennai Institute of Technology {location}"
-                    search_urls.append({
-                        'type': 'location_search',
-                        'url': f"https://www.linkedin.com/search/results/people/?keywords={urllib.parse.quote(location_search)}",
-                        'description': f"Search for CIT profiles in {location}"
-                    })
-                
-                # 4. Google search for LinkedIn profile
-                if enhanced_profile['name']:
-                    google_search = f"site:linkedin.com/in \"{enhanced_profile['name']}\" \"Chennai Institute of Technology\""
-                    search_urls.append({
-                        'type': 'google_search',
-                        'url': f"https://www.google.com/search?q={urllib.parse.quote(google_search)}",
-                        'description': f"Google search for {enhanced_profile['name']}'s LinkedIn profile"
-                    })
-                
-                enhanced_profile['search_urls'] = search_urls
-                enhanced_profiles.append(enhanced_profile)
-                
-                print(f"   🔍 Generated {len(search_urls)} targeted search URLs")
-                
-            except Exception as e:
-                print(f"   ❌ Error processing profile: {e}")
-                continue
-        
-        return enhanced_profiles
-    
-    def extract_name_from_title(self, title):
-        """Extract potential name from title"""
-        try:
-            # Remove common institutional terms
-            cleaned = re.sub(r'\b(at|of|the|in|and|&)\b', ' ', title, flags=re.IGNORECASE)
-            cleaned = re.sub(r'\b(Chennai Institute of Technology|CIT|Chennai|Technology|Institute)\b', ' ', cleaned, flags=re.IGNORECASE)
-            cleaned = re.sub(r'\b(Professor|Assistant|Associate|Student|Principal|Faculty|Director|Dean)\b', ' ', cleaned, flags=re.IGNORECASE)
-            cleaned = re.sub(r'\b(Attended|Studying|Graduated|Alumni)\b', ' ', cleaned, flags=re.IGNORECASE)
-            
-            # Clean up whitespace
-            cleaned = ' '.join(cleaned.split())
-            
-            # Look for potential names (2-4 words, mostly alphabetic)
-            words = cleaned.split()
-            name_words = []
-            
-            for word in words:
-                if (len(word) > 1 and 
-                    word.isalpha() and 
-                    word[0].isupper() and
-                    word.lower() not in ['the', 'and', 'or', 'at', 'in', 'of']):
-                    name_words.append(word)
-            
-            if 2 <= len(name_words) <= 4:
-                return ' '.join(name_words)
-            
-            return None
-            
-        except:
-            return None
-    
-    def extract_role_keywords(self, title):
-        """Extract role keywords from title"""
-        try:
-            role_patterns = [
-                r'\b(Assistant Professor|Associate Professor|Professor)\b',
-                r'\b(Principal|Director|Dean|Faculty|Lecturer)\b',
-                r'\b(Student|Graduate|Alumni|Scholar)\b',
-                r'\b(Engineer|Developer|Analyst|Manager)\b'
-            ]
-            
-            for pattern in role_patterns:
-                match = re.search(pattern, title, re.IGNORECASE)
-                if match:
-                    return match.group(1)
-            
-            return None
-            
-        except:
-            return None
-    
-    def create_enhanced_csv(self, enhanced_profiles):
-        """Create enhanced CSV with targeted search URLs"""
-        filename = "cit_alumni_enhanced_with_search_urls.csv"
-        
-        try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = [
-                    'name', 'headline', 'location', 'profile_url', 
-                    'name_search_url', 'role_search_url', 'location_search_url', 
-                    'google_search_url', 'search_descriptions'
-                ]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                
-                for profile in enhanced_profiles:
-                    search_urls = profile.get('search_urls', [])
-                    
-                    # Extract specific search URLs
-                    name_search_url = ''
-                    role_search_url = ''
-                    location_search_url = ''
-                    google_search_url = ''
-                    descriptions = []
-                    
-                    for search in search_urls:
-                        if search['type'] == 'name_search':
-                            name_search_url = search['url']
-                        elif search['type'] == 'role_search':
-                            role_search_url = search['url']
-                        elif search['type'] == 'location_search':
-                            location_search_url = search['url']
-                        elif search['type'] == 'google_search':
-                            google_search_url = search['url']
-                        
-                        descriptions.append(f"{search['type']}: {search['description']}")
-                    
-                    writer.writerow({
-                        'name': profile.get('name', ''),
-                        'headline': profile.get('headline', ''),
-                        'location': profile.get('location', ''),
-                        'profile_url': '',  # To be filled when real URLs are found
-                        'name_search_url': name_search_url,
-                        'role_search_url': role_search_url,
-                        'location_search_url': location_search_url,
-                        'google_search_url': google_search_url,
-                        'search_descriptions': ' | '.join(descriptions)
-                    })
-            
-            print(f"💾 Enhanced CSV saved as {filename}")
-            print(f"📄 Contains targeted search URLs for finding real LinkedIn profiles")
-            return filename
-            
-        except Exception as e:
-            print(f"❌ Error creating enhanced CSV: {e}")
-            return None
-    
-    def create_manual_search_guide(self, enhanced_profiles):
-        """Create a manual search guide"""
-        filename = "manual_linkedin_search_guide.html"
-        
-        try:
-            html_content = """
+INPUT_CSV = 'cit_alumni_manual.csv'
+ENHANCED_CSV = 'cit_alumni_enhanced_with_search_urls.csv'
+ENHANCED_PARQUET = 'cit_alumni_enhanced_with_search_urls.parquet'
+SEARCH_GUIDE = 'manual_linkedin_search_guide.html'
+
+ENHANCED_FIELDNAMES = [
+    'name', 'headline', 'location', 'profile_url',
+    'name_search_url', 'role_search_url', 'location_search_url',
+    'google_search_url', 'search_descriptions'
+]
+
+PLACEHOLDER_COLUMNS = ['profile_id', 'name', 'profile_url', 'location', 'about', 'skills']
+
+GUIDE_HEADER = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -248,26 +55,20 @@ class ProfileURLEnhancer:
     </div>
     
 """
-            
-            for i, profile in enumerate(enhanced_profiles):
-                name = profile.get('name', 'Unknown')
-                headline = profile.get('headline', 'No headline')
-                location = profile.get('location', 'No location')
-                
-                html_content += f"""
+
+GUIDE_PROFILE = """
     <div class="profile">
-        <h3>👤 Profile {i+1}: {name if name else headline}</h3>
+        <h3>👤 Profile {number}: {title}</h3>
         <p><strong>Headline:</strong> {headline}</p>
         <p><strong>Location:</strong> {location}</p>
         
         <div>
             <strong>🔍 Search Links:</strong><br>
 """
-                
-                for search in profile.get('search_urls', []):
-                    html_content += f'            <a href="{search["url"]}" target="_blank" class="search-link">{search["description"]}</a><br>\n'
-                
-                html_content += """        </div>
+
+GUIDE_LINK = '            <a href="{url}" target="_blank" class="search-link">{description}</a><br>\n'
+
+GUIDE_PROFILE_END = """        </div>
         
         <div style="margin-top: 10px;">
             <label><strong>✏️ Real LinkedIn URL:</strong></label>
@@ -275,14 +76,350 @@ class ProfileURLEnhancer:
         </div>
     </div>
 """
-            
-            html_content += """
+
+GUIDE_FOOTER = """
 </body>
 </html>
 """
+
+
+class SearchGuideWriter:
+    """Write the manual search guide one profile at a time
+
+    The page goes to <path>.part through a large write buffer, with each
+    profile's block joined once and written, and close() adds the footer
+    and moves the file over path like StreamingCSVWriter does. Memory stays
+    the same however many profiles there are.
+    """
+
+    def __init__(self, path, buffer_size=1 << 20):
+        self.path = path
+        self.part_path = f"{path}.part"
+        self.profiles_written = 0
+        self.file = open(self.part_path, 'w', encoding='utf-8', buffering=buffer_size)
+        self.file.write(GUIDE_HEADER)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def write(self, profile):
+        self.profiles_written += 1
+        name = profile.get('name', 'Unknown')
+        headline = profile.get('headline', 'No headline')
+        parts = [GUIDE_PROFILE.format(
+            number=self.profiles_written,
+            title=name if name else headline,
+            headline=headline,
+            location=profile.get('location', 'No location')
+        )]
+        for search in profile.get('search_urls', []):
+            parts.append(GUIDE_LINK.format(url=search['url'], description=search['description']))
+        parts.append(GUIDE_PROFILE_END)
+        self.file.write(''.join(parts))
+
+    def write_many(self, profiles):
+        for profile in profiles:
+            self.write(profile)
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.file.write(GUIDE_FOOTER)
+        self.file.close()
+        os.replace(self.part_path, self.path)
+
+    def abort(self):
+        if not self.file.closed:
+            self.file.close()
+        try:
+            os.remove(self.part_path)
+        except OSError:
+            pass
+
+
+def safe_name_from_title(title):
+    try:
+        return extract_name_from_title(title)
+    except:
+        return None
+
+
+def safe_role_keywords(title):
+    try:
+        return extract_role_keywords(title)
+    except:
+        return None
+
+
+def enhance_profile(profile):
+    """Enhanced profile with targeted LinkedIn search URLs for one input row, None for rows without a title
+
+    Pure CPU work on the row alone, so rows can be enhanced in any process.
+    """
+    title = profile.get('title', '').strip()
+    location = profile.get('location', '').strip()
+    
+    # Skip if no meaningful data
+    if not title:
+        return None
+    
+    # Handle case where location equals title (common in our data)
+    if location == title:
+        location = ''
+    
+    enhanced_profile = {
+        'original_title': title,
+        'original_location': location,
+        'name': '',
+        'headline': title,
+        'location': location if location != title else '',
+        'profile_url': '',
+        'search_urls': []
+    }
+    
+    # Extract potential name and role
+    name_match = safe_name_from_title(title)
+    if name_match:
+        enhanced_profile['name'] = name_match
+    
+    # Generate multiple targeted search URLs
+    search_urls = []
+    
+    # 1. Direct name + CIT search
+    if enhanced_profile['name']:
+        name_search = f"{enhanced_profile['name']} Chennai Institute of Technology"
+        search_urls.append({
+            'type': 'name_search',
+            'url': f"https://www.linkedin.com/search/results/people/?keywords={urllib.parse.quote(name_search)}",
+            'description': f"Search for {enhanced_profile['name']} at CIT"
+        })
+    
+    # 2. Role + CIT search
+    role_keywords = safe_role_keywords(title)
+    if role_keywords:
+        role_search = f"{role_keywords} Chennai Institute of Technology"
+        search_urls.append({
+            'type': 'role_search',
+            'url': f"https://www.linkedin.com/search/results/people/?keywords={urllib.parse.quote(role_search)}",
+            'description': f"Search for {role_keywords} at CIT"
+        })
+    
+    # 3. Location-specific search
+    if location and location != title:
+        location_search = f"Chennai Institute of Technology {location}"
+        search_urls.append({
+            'type': 'location_search',
+            'url': f"https://www.linkedin.com/search/results/people/?keywords={urllib.parse.quote(location_search)}",
+            'description': f"Search for CIT profiles in {location}"
+        })
+    
+    # 4. Google search for LinkedIn profile
+    if enhanced_profile['name']:
+        google_search = f"site:linkedin.com/in \"{enhanced_profile['name']}\" \"Chennai Institute of Technology\""
+        search_urls.append({
+            'type': 'google_search',
+            'url': f"https://www.google.com/search?q={urllib.parse.quote(google_search)}",
+            'description': f"Google search for {enhanced_profile['name']}'s LinkedIn profile"
+        })
+    
+    enhanced_profile['search_urls'] = search_urls
+    return enhanced_profile
+
+
+def enhance_chunk(profiles):
+    """(enhanced profile or None, error or None) for every row of a chunk, run in the worker processes"""
+    results = []
+    for profile in profiles:
+        try:
+            results.append((enhance_profile(profile), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+
+def chunked(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def init_title_caches(size, path=None):
+    """Size the title caches and warm them from path, in the parent or a worker process"""
+    resize_title_caches(size)
+    return load_title_caches(path) if path else 0
+
+
+def parallel_enhance(profiles, workers, chunk_size=2000, title_cache_path=None, title_cache_size=100000):
+    """enhance_chunk results for every row in input order, the chunks shared across worker processes
+
+    Only two chunks per worker are in flight at a time, so a large input is
+    never read ahead much further than the output is consumed. Each worker
+    has its own title caches, sized to title_cache_size and warmed from
+    title_cache_path if given (spawned workers do not inherit the parent's).
+    """
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_title_caches,
+                             initargs=(title_cache_size, title_cache_path)) as executor:
+        in_flight = collections.deque()
+        for chunk in chunked(profiles, chunk_size):
+            in_flight.append(executor.submit(enhance_chunk, chunk))
+            if len(in_flight) >= workers * 2:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+class ProfileURLEnhancer:
+    def __init__(self):
+        self.supabase = None
+        self.verbose = getattr(parameters, 'ENHANCER_VERBOSE', True)
+        self.workers = getattr(parameters, 'ENHANCER_WORKERS', 1)
+        self.chunk_size = getattr(parameters, 'ENHANCER_CHUNK_SIZE', 2000)
+        self.title_cache_path = getattr(parameters, 'TITLE_CACHE_PATH', None)
+        self.title_cache_size = getattr(parameters, 'TITLE_CACHE_SIZE', 100000)
+        self.rows_read = 0
+        
+    def setup_supabase(self):
+        """Setup Supabase connection"""
+        try:
+            print("🗄️ Connecting to Supabase...")
+            self.supabase: Client = create_client(parameters.SUPABASE_URL, parameters.SUPABASE_KEY)
+            print("✅ Supabase connected")
+            return True
+        except Exception as e:
+            print(f"❌ Supabase error: {e}")
+            return False
+    
+    def generate_targeted_search_urls(self, profile_data):
+        """Generate targeted LinkedIn search URLs for each profile"""
+        return list(self.iter_targeted_search_urls(profile_data))
+    
+    def iter_targeted_search_urls(self, profile_data):
+        """Enhanced profiles one at a time in input order, reading profile_data (any iterable, e.g. a csv.DictReader) lazily
+        
+        With more than one worker the rows are enhanced in chunks of
+        chunk_size in a process pool.
+        """
+        if self.workers > 1:
+            results = parallel_enhance(profile_data, self.workers, self.chunk_size, self.title_cache_path,
+                                       self.title_cache_size)
+        else:
+            results = (enhance_chunk([profile])[0] for profile in profile_data)
+        
+        self.rows_read = 0
+        for i, (enhanced_profile, error) in enumerate(results):
+            self.rows_read = i + 1
+            if error:
+                print(f"   ❌ Error processing profile: {error}")
+                continue
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # Skip if no meaningful data
+            if not enhanced_profile:
+                continue
+            
+            if self.verbose:
+                print(f"\n👤 Profile {i+1}: {enhanced_profile['headline']}")
+                if enhanced_profile['name']:
+                    print(f"   👤 Extracted name: {enhanced_profile['name']}")
+                print(f"   🔍 Generated {len(enhanced_profile['search_urls'])} targeted search URLs")
+            yield enhanced_profile
+    
+    def extract_name_from_title(self, title):
+        """Extract potential name from title"""
+        return safe_name_from_title(title)
+    
+    def extract_role_keywords(self, title):
+        """Extract role keywords from title"""
+        return safe_role_keywords(title)
+    
+    @staticmethod
+    def search_descriptions(profile):
+        return [f"{search['type']}: {search['description']}" for search in profile.get('search_urls', [])]
+    
+    def enhanced_row(self, profile):
+        """One output row with the search URLs split into their own columns"""
+        search_urls = profile.get('search_urls', [])
+        
+        # Extract specific search URLs
+        name_search_url = ''
+        role_search_url = ''
+        location_search_url = ''
+        google_search_url = ''
+        
+        for search in search_urls:
+            if search['type'] == 'name_search':
+                name_search_url = search['url']
+            elif search['type'] == 'role_search':
+                role_search_url = search['url']
+            elif search['type'] == 'location_search':
+                location_search_url = search['url']
+            elif search['type'] == 'google_search':
+                google_search_url = search['url']
+        
+        return {
+            'name': profile.get('name', ''),
+            'headline': profile.get('headline', ''),
+            'location': profile.get('location', ''),
+            'profile_url': '',  # To be filled when real URLs are found
+            'name_search_url': name_search_url,
+            'role_search_url': role_search_url,
+            'location_search_url': location_search_url,
+            'google_search_url': google_search_url,
+            'search_descriptions': ' | '.join(self.search_descriptions(profile))
+        }
+    
+    def enhanced_parquet_row(self, profile):
+        """enhanced_row with the search descriptions as a list, built from search_urls rather than split back out of the joined text"""
+        return {**self.enhanced_row(profile), 'search_descriptions': self.search_descriptions(profile)}
+    
+    def create_enhanced_csv(self, enhanced_profiles):
+        """Create enhanced CSV with targeted search URLs"""
+        filename = ENHANCED_CSV
+        
+        try:
+            with StreamingCSVWriter(filename, ENHANCED_FIELDNAMES, row=self.enhanced_row) as sink:
+                sink.write_many(enhanced_profiles)
+            
+            print(f"💾 Enhanced CSV saved as {filename}")
+            print(f"📄 Contains targeted search URLs for finding real LinkedIn profiles")
+            return filename
+            
+        except Exception as e:
+            print(f"❌ Error creating enhanced CSV: {e}")
+            return None
+    
+    def create_enhanced_parquet(self, enhanced_profiles):
+        """Typed Parquet copy of the enhanced CSV, search descriptions as a list column"""
+        filename = ENHANCED_PARQUET
+        
+        try:
+            with ParquetSink(filename, ENHANCED_SCHEMA, row=self.enhanced_parquet_row) as sink:
+                sink.write_many(enhanced_profiles)
+            print(f"💾 Enhanced Parquet saved as {filename}")
+            return filename
+            
+        except Exception as e:
+            print(f"❌ Error creating enhanced Parquet: {e}")
+            return None
+    
+    def create_manual_search_guide(self, enhanced_profiles):
+        """Create a manual search guide"""
+        filename = SEARCH_GUIDE
+        
+        try:
+            with SearchGuideWriter(filename) as guide:
+                guide.write_many(enhanced_profiles)
             
             print(f"📄 Manual search guide created: {filename}")
             print(f"🌐 Open this HTML file in your browser to start finding real LinkedIn URLs")
@@ -292,51 +429,54 @@ class ProfileURLEnhancer:
             print(f"❌ Error creating search guide: {e}")
             return None
     
+    def placeholder_row(self, profile):
+        """Database row for one enhanced profile, the real profile URL still to be found"""
+        supabase_data = {
+            'profile_id': stable_profile_id(profile),
+            'name': profile.get('name', profile.get('headline', 'Unknown'))[:100],
+            'profile_url': '[TO_BE_UPDATED]'  # Placeholder for real URL
+        }
+        
+        if profile.get('location'):
+            supabase_data['location'] = profile['location'][:100]
+        
+        if profile.get('headline'):
+            supabase_data['about'] = profile['headline'][:200]
+        
+        # Add search URLs as notes
+        search_notes = []
+        for search in profile.get('search_urls', [])[:2]:  # First 2 search URLs
+            search_notes.append(f"{search['type']}: {search['url']}")
+        
+        if search_notes:
+            supabase_data['skills'] = ' | '.join(search_notes)[:300]
+        
+        return supabase_data
+    
+    def database_sink(self):
+        """SyncStream taking the placeholder rows as they are produced, None without a connection"""
+        if not self.supabase:
+            print("⚠️ Supabase not connected")
+            return None
+        
+        sync = IncrementalSync(
+            self.supabase,
+            parameters.SUPABASE_TABLE,
+            batch_size=getattr(parameters, 'SUPABASE_BATCH_SIZE', 500)
+        )
+        replace = getattr(parameters, 'SUPABASE_SYNC_MODE', 'incremental') == 'replace'
+        return sync.stream(replace=replace, columns=PLACEHOLDER_COLUMNS)
+    
     def update_database_with_placeholders(self, enhanced_profiles):
         """Update database with enhanced profile data"""
         try:
-            if not self.supabase:
-                print("⚠️ Supabase not connected")
+            database = self.database_sink()
+            if not database:
                 return 0
             
-            # Clear existing data
-            print("🧹 Clearing existing data...")
-            try:
-                self.supabase.table(parameters.SUPABASE_TABLE).delete().neq('id', '00000000-0000-0000-0000-000000000000').execute()
-            except:
-                pass
-            
-            saved_count = 0
-            for profile in enhanced_profiles:
-                try:
-                    supabase_data = {
-                        'profile_id': str(uuid.uuid4()),
-                        'name': profile.get('name', profile.get('headline', 'Unknown'))[:100],
-                        'profile_url': '[TO_BE_UPDATED]'  # Placeholder for real URL
-                    }
-                    
-                    if profile.get('location'):
-                        supabase_data['location'] = profile['location'][:100]
-                    
-                    if profile.get('headline'):
-                        supabase_data['about'] = profile['headline'][:200]
-                    
-                    # Add search URLs as notes
-                    search_notes = []
-                    for search in profile.get('search_urls', [])[:2]:  # First 2 search URLs
-                        search_notes.append(f"{search['type']}: {search['url']}")
-                    
-                    if search_notes:
-                        supabase_data['skills'] = ' | '.join(search_notes)[:300]
-                    
-                    result = self.supabase.table(parameters.SUPABASE_TABLE).insert(supabase_data).execute()
-                    if result.data:
-                        saved_count += 1
-                        
-                except Exception as e:
-                    print(f"⚠️ Error saving profile: {e}")
-                    continue
-            
+            database.write_many(self.placeholder_row(profile) for profile in enhanced_profiles)
+            saved_count = database.close()
+
             print(f"🗄️ Updated database with {saved_count} enhanced profiles")
             return saved_count
             
@@ -345,57 +485,109 @@ class ProfileURLEnhancer:
             return 0
     
     def run_enhancement(self):
-        """Run the profile URL enhancement"""
+        """Run the profile URL enhancement, streaming each input row through to every output
+        
+        Returns the number of profiles enhanced.
+        """
         try:
             print("🎯 CIT Alumni Profile URL Enhancer")
             print("=" * 50)
             
             self.setup_supabase()
             
-            # Read existing CSV data
-            existing_data = []
+            loaded = init_title_caches(self.title_cache_size, self.title_cache_path)
+            if self.title_cache_path:
+                print(f"🧠 Loaded {loaded} parsed titles from {self.title_cache_path}")
+            
             try:
-                with open('cit_alumni_manual.csv', 'r', encoding='utf-8') as csvfile:
-                    reader = csv.DictReader(csvfile)
-                    existing_data = list(reader)
-                print(f"📄 Loaded {len(existing_data)} profiles from existing CSV")
+                csvfile = open(INPUT_CSV, 'r', encoding='utf-8')
             except Exception as e:
                 print(f"❌ Error reading existing CSV: {e}")
-                return
+                return 0
+            
+            sinks = []
+            database = None
+            enhanced_count = 0
+            with csvfile:
+                try:
+                    sinks.append(StreamingCSVWriter(ENHANCED_CSV, ENHANCED_FIELDNAMES, row=self.enhanced_row))
+                    sinks.append(SearchGuideWriter(SEARCH_GUIDE))
+                    if getattr(parameters, 'EXPORT_PARQUET', False):
+                        if parquet_available():
+                            sinks.append(ParquetSink(ENHANCED_PARQUET, ENHANCED_SCHEMA, row=self.enhanced_parquet_row))
+                        else:
+                            print("⚠️ EXPORT_PARQUET is set but pyarrow is not installed, skipping the Parquet export")
+                    try:
+                        database = self.database_sink()
+                    except Exception as e:
+                        print(f"❌ Database update error: {e}")
+                    
+                    for profile in self.iter_targeted_search_urls(csv.DictReader(csvfile)):
+                        for sink in sinks:
+                            sink.write(profile)
+                        if database:
+                            try:
+                                database.write(self.placeholder_row(profile))
+                            except Exception as e:
+                                print(f"❌ Database update error: {e}")
+                                database = None
+                        enhanced_count += 1
+                except Exception:
+                    for sink in sinks:
+                        sink.abort()
+                    raise
             
-            # Enhance profile data
-            enhanced_profiles = self.generate_targeted_search_urls(existing_data)
+            print(f"📄 Read {self.rows_read} profiles from existing CSV")
             
-            if enhanced_profiles:
+            if enhanced_count:
                 print(f"\n📊 Enhancement Results:")
-                print(f"✅ Enhanced {len(enhanced_profiles)} profiles")
+                print(f"✅ Enhanced {enhanced_count} profiles")
                 
-                # Create outputs
-                csv_filename = self.create_enhanced_csv(enhanced_profiles)
-                guide_filename = self.create_manual_search_guide(enhanced_profiles)
+                # Finish outputs, each is replaced only now that it is complete
+                for sink in sinks:
+                    sink.close()
+                print(f"💾 Enhanced CSV saved as {ENHANCED_CSV}")
+                print(f"📄 Contains targeted search URLs for finding real LinkedIn profiles")
+                print(f"📄 Manual search guide created: {SEARCH_GUIDE}")
+                print(f"🌐 Open this HTML file in your browser to start finding real LinkedIn URLs")
+                
+                if self.workers <= 1:
+                    # Worker processes keep their own caches and counters, only an in-process run has them here
+                    title_cache_report()
+                    if self.title_cache_path:
+                        save_title_caches(self.title_cache_path)
                 
                 # Update database
-                saved_count = self.update_database_with_placeholders(enhanced_profiles)
+                saved_count = 0
+                if database:
+                    try:
+                        saved_count = database.close()
+                        print(f"🗄️ Updated database with {saved_count} enhanced profiles")
+                    except Exception as e:
+                        print(f"❌ Database update error: {e}")
                 
                 print(f"\n🎉 ENHANCEMENT COMPLETED!")
-                print(f"📄 Enhanced CSV: {csv_filename}")
-                print(f"🌐 Search Guide: {guide_filename}")
+                print(f"📄 Enhanced CSV: {ENHANCED_CSV}")
+                print(f"🌐 Search Guide: {SEARCH_GUIDE}")
                 print(f"🗄️ Database entries: {saved_count}")
                 print(f"\n📋 Next Steps:")
-                print(f"1. Open {guide_filename} in your browser")
+                print(f"1. Open {SEARCH_GUIDE} in your browser")
                 print(f"2. Use the search links to find real LinkedIn profiles")
                 print(f"3. Copy the real profile URLs and update your database")
                 print(f"4. Each profile now has multiple targeted search strategies!")
                 
-                return enhanced_profiles
+                return enhanced_count
                 
             else:
+                # Keep the previous outputs and leave the table alone
+                for sink in sinks:
+                    sink.abort()
                 print("😞 No profiles could be enhanced")
-                return []
+                return 0
                 
         except Exception as e:
             print(f"❌ Enhancement error: {e}")
-            return []
+            return 0
 
 def main():
     print("🚀 CIT Alumni Profile URL Enhancer")
@@ -405,11 +597,11 @@ def main():
     enhancer = ProfileURLEnhancer()
     
     try:
-        profiles = enhancer.run_enhancement()
+        enhanced_count = enhancer.run_enhancement()
         
-        if profiles:
+        if enhanced_count:
             print(f"\n🎊 SUCCESS!")
-            print(f"✅ Enhanced {len(profiles)} profiles with targeted search URLs")
+            print(f"✅ Enhanced {enhanced_count} profiles with targeted search URLs")
             print(f"🔍 Each profile now has multiple search strategies")
             print(f"📋 Use the HTML guide to find real LinkedIn profile URLs")
             print(f"💡 This approach will help you get the actual profile URLs you need!")
@@ -0,0 +1,162 @@
+import threading
+import time
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from fetch_scheduler import FetchScheduler
+from profile_page import extract_profile
+from rate_limiter import RateLimiter
+
+
+def make_headless_chrome(service=None, profile_dir=None):
+    """Start an isolated headless Chrome session, in a persistent profile directory if given"""
+    options = Options()
+    options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--window-size=1920,1080')
+    if profile_dir:
+        options.add_argument(f'--user-data-dir={profile_dir}')
+    if service:
+        return webdriver.Chrome(service=service, options=options)
+    return webdriver.Chrome(options=options)
+
+
+class ProfileWorkerPool:
+    """Extract profile pages with N browser sessions fed from one shared scheduler
+
+    With a frontier, every URL is claimed before it is fetched and its
+    result committed as soon as it is extracted, so an interrupted run can
+    be resumed without refetching finished profiles. With a page_cache,
+    cached profiles skip the rate budget, and in parse-only mode no browser
+    is started at all. The scheduler decides the visiting order (input
+    order by default) and its page budget stops the run early; once it is
+    spent only cached profiles are still extracted, and the rest stay
+    pending, unclaimed, for the next run. With a session_pool, workers
+    borrow its warm, logged-in browsers instead of starting and logging in
+    their own, and hand them back when done; a worker that gets none within
+    session_timeout seconds gives up. on_result(profile_url, result) is
+    called under the pool's lock as soon as each profile is extracted (with
+    None when extraction failed), so sinks receive rows during the run and
+    not only when run() returns.
+    """
+
+    def __init__(self, workers=2, requests_per_minute=None, driver_factory=make_headless_chrome,
+                 session_setup=None, extract=extract_profile, frontier=None, page_cache=None,
+                 scheduler=None, session_pool=None, session_timeout=120, on_result=None,
+                 **extract_options):
+        self.workers = max(1, int(workers))
+        self.rate_limiter = RateLimiter(requests_per_minute)
+        self.driver_factory = driver_factory
+        self.session_setup = session_setup
+        self.extract = extract
+        self.frontier = frontier
+        self.page_cache = page_cache
+        self.scheduler = scheduler if scheduler is not None else FetchScheduler()
+        self.session_pool = session_pool
+        self.session_timeout = session_timeout
+        self.on_result = on_result
+        if page_cache:
+            extract_options['page_cache'] = page_cache
+        self.extract_options = extract_options
+        self.pages_fetched = 0
+        self.elapsed = 0.0
+        self.lock = threading.Lock()
+
+    def run(self, profile_urls, candidates=None):
+        """Extract every URL and return the results in input order (None where extraction failed or was not reached)
+
+        candidates maps a URL to the card data known about it, for the scheduler's scorers.
+        """
+        candidates = candidates or {}
+        self.scheduler.push_many(
+            ((index, profile_url), candidates.get(profile_url) or {'profile_url': profile_url})
+            for index, profile_url in enumerate(profile_urls) if profile_url
+        )
+
+        results = [None] * len(profile_urls)
+        started = time.monotonic()
+        threads = [
+            threading.Thread(target=self._worker, args=(worker_id, results), daemon=True)
+            for worker_id in range(min(self.workers, max(1, len(self.scheduler))))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.elapsed = time.monotonic() - started
+        return results
+
+    def _worker(self, worker_id, results):
+        """Own one browser for the whole run and keep pulling URLs until the scheduler is empty"""
+        offline = self.page_cache is not None and self.page_cache.offline
+        try:
+            if offline:
+                browser = None
+            elif self.session_pool:
+                browser = self.session_pool.acquire(self.session_timeout)
+            else:
+                browser = self.driver_factory()
+        except Exception as e:
+            print(f"❌ Worker {worker_id}: browser setup failed: {e}")
+            return
+
+        try:
+            if self.session_setup and not offline and not self.session_pool:
+                self.session_setup(browser)
+
+            while True:
+                entry = self.scheduler.pop()
+                if entry is None:
+                    return
+                (index, profile_url), _ = entry
+
+                # The budget is checked before the claim, so profiles it turns away stay pending
+                # untouched; once it is spent only cached profiles still go through
+                cached = self.page_cache is not None and self.page_cache.has(profile_url)
+                if not cached:
+                    if self.scheduler.exhausted:
+                        continue
+                    if not self.scheduler.charge():
+                        if self.scheduler.refused == 1:
+                            print("🛑 Page budget spent, profiles not in the cache are left for the next run")
+                        continue
+
+                if self.frontier and not self.frontier.claim('profile', profile_url):
+                    if not cached:
+                        self.scheduler.refund()
+                    continue
+
+                if not cached:
+                    self.rate_limiter.acquire()
+                try:
+                    results[index] = self.extract(browser, profile_url, **self.extract_options)
+                    if self.frontier:
+                        self.frontier.complete('profile', profile_url, results[index])
+                except Exception as e:
+                    print(f"⚠️ Worker {worker_id}: error extracting {profile_url}: {e}")
+                    results[index] = None
+                    if self.frontier:
+                        self.frontier.fail('profile', profile_url, e)
+                with self.lock:
+                    self.pages_fetched += 1
+                    if self.on_result:
+                        try:
+                            self.on_result(profile_url, results[index])
+                        except Exception as e:
+                            print(f"⚠️ Worker {worker_id}: could not save {profile_url}: {e}")
+
+        except Exception as e:
+            print(f"❌ Worker {worker_id} stopped: {e}")
+        finally:
+            if self.session_pool and browser is not None:
+                self.session_pool.release(browser)
+            else:
+                try:
+                    browser.quit()
+                except:
+                    pass
+
+    @property
+    def pages_per_minute(self):
+        return self.pages_fetched / self.elapsed * 60 if self.elapsed else 0.0
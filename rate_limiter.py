@@ -0,0 +1,27 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """Request budget shared by every thread that holds a reference to it"""
+
+    def __init__(self, requests_per_minute=None):
+        self.requests_per_minute = requests_per_minute
+        self.interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the caller may send its next request"""
+        if not self.interval:
+            return 0.0
+
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
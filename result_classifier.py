@@ -0,0 +1,170 @@
+import re
+from title_cache import TitleCache, load_caches, save_caches
+
+CIT_KEYWORDS = [
+    'chennai institute of technology',
+    'chennai institute technology',
+    'cit chennai'
+]
+
+HEADLINE_KEYWORDS = [
+    'chennai institute of technology',
+    'chennai institute technology'
+]
+
+NAME_SKIP_KEYWORDS = ['connections', 'mutual', 'message', 'connect', 'view']
+
+LOCATION_KEYWORDS = ['coimbatore', 'chennai', 'tamil nadu', 'india']
+
+# Role categories in priority order: the first category with a match wins,
+# wherever in the title the match is
+ROLE_PATTERNS = [
+    ('professor', re.compile(r'\b(Assistant Professor|Associate Professor|Professor)\b', re.IGNORECASE)),
+    ('academic_staff', re.compile(r'\b(Principal|Director|Dean|Faculty|Lecturer)\b', re.IGNORECASE)),
+    ('student', re.compile(r'\b(Student|Graduate|Alumni|Scholar)\b', re.IGNORECASE)),
+    ('professional', re.compile(r'\b(Engineer|Developer|Analyst|Manager)\b', re.IGNORECASE))
+]
+
+ROLE_CATEGORIES = [category for category, pattern in ROLE_PATTERNS]
+
+# Institutional, role and filler words removed before looking for a name.
+# One pass over the title gives the same words as removing each group in turn.
+NAME_NOISE_PATTERN = re.compile(
+    r'\b(Chennai Institute of Technology|at|of|the|in|and|&|CIT|Chennai|Technology|Institute|'
+    r'Professor|Assistant|Associate|Student|Principal|Faculty|Director|Dean|'
+    r'Attended|Studying|Graduated|Alumni)\b',
+    re.IGNORECASE
+)
+
+NAME_STOP_WORDS = frozenset(['the', 'and', 'or', 'at', 'in', 'of'])
+
+
+def _keyword_pattern(keywords):
+    """Substring alternation matching the same lines as any(k in line for k in keywords)"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)))
+
+
+class ResultClassifier:
+    """Classify search result lines with keyword patterns compiled once
+
+    Each line is lowercased once and tested against one compiled alternation
+    per keyword list, stopping at the first line that settles a field. Fields
+    follow the same rules as the original line scans: the first CIT line is
+    the headline, the first other line that is not UI text is the name, the
+    first remaining line naming a place is the location.
+    """
+
+    def __init__(self, cit_keywords=CIT_KEYWORDS, headline_keywords=HEADLINE_KEYWORDS,
+                 name_skip_keywords=NAME_SKIP_KEYWORDS, location_keywords=LOCATION_KEYWORDS):
+        self.cit_pattern = _keyword_pattern(cit_keywords)
+        self.headline_pattern = _keyword_pattern(headline_keywords)
+        self.name_skip_pattern = _keyword_pattern(name_skip_keywords)
+        self.location_pattern = _keyword_pattern(location_keywords)
+
+    def is_cit_related(self, text):
+        return self.cit_pattern.search(text.lower()) is not None
+
+    def classify(self, lines):
+        """Structured fields for one result, from its text or its list of lines"""
+        if isinstance(lines, str):
+            lines = [line.strip() for line in lines.split('\n') if line.strip()]
+
+        lowered = [line.lower() for line in lines]
+        fields = {'cit_related': self.cit_pattern.search('\n'.join(lowered)) is not None}
+
+        headline = None
+        headline_search = self.headline_pattern.search
+        for line, lowered_line in zip(lines, lowered):
+            if headline_search(lowered_line):
+                headline = fields['headline'] = line
+                break
+
+        name = None
+        skip_search = self.name_skip_pattern.search
+        for line, lowered_line in zip(lines, lowered):
+            if line != "LinkedIn Member" and line != headline and not skip_search(lowered_line):
+                name = fields['name'] = line
+                break
+
+        location_search = self.location_pattern.search
+        for line, lowered_line in zip(lines, lowered):
+            if line != headline and line != name and location_search(lowered_line):
+                fields['location'] = line
+                break
+
+        return fields
+
+    def classify_batch(self, results):
+        """Classify many results (texts or line lists) in one call"""
+        classify = self.classify
+        return [classify(lines) for lines in results]
+
+
+default_classifier = ResultClassifier()
+
+
+def parse_name_from_title(title):
+    """Extract potential name from title (uncached)"""
+    cleaned = NAME_NOISE_PATTERN.sub(' ', title)
+
+    # Look for potential names (2-4 words, mostly alphabetic)
+    name_words = [
+        word for word in cleaned.split()
+        if len(word) > 1 and word.isalpha() and word[0].isupper() and word.lower() not in NAME_STOP_WORDS
+    ]
+
+    if 2 <= len(name_words) <= 4:
+        return ' '.join(name_words)
+    return None
+
+
+def parse_role(title):
+    """(category, keyword) of the highest-priority role in the title, or (None, None) (uncached)"""
+    for category, pattern in ROLE_PATTERNS:
+        match = pattern.search(title)
+        if match:
+            return category, match.group(1)
+    return None, None
+
+
+# Titles repeat a lot ("Student at Chennai Institute of Technology"), so the
+# parsers sit behind bounded LRU caches shared by the whole process
+TITLE_CACHES = {
+    'name': TitleCache(parse_name_from_title, name='title names'),
+    'role': TitleCache(parse_role, name='title roles')
+}
+
+
+def extract_name_from_title(title):
+    """Extract potential name from title"""
+    return TITLE_CACHES['name'](title)
+
+
+def classify_role(title):
+    """(category, keyword) of the highest-priority role in the title, or (None, None)"""
+    return TITLE_CACHES['role'](title)
+
+
+def extract_role_keywords(title):
+    """Extract role keywords from title"""
+    return classify_role(title)[1]
+
+
+def resize_title_caches(maxsize):
+    for cache in TITLE_CACHES.values():
+        cache.maxsize = max(1, int(maxsize))
+        cache.update([])
+
+
+def load_title_caches(path):
+    """Warm the title caches from an earlier run, returns the entries loaded"""
+    return load_caches(path, TITLE_CACHES)
+
+
+def save_title_caches(path):
+    save_caches(path, TITLE_CACHES)
+
+
+def title_cache_report():
+    for cache in TITLE_CACHES.values():
+        cache.report()
@@ -0,0 +1,67 @@
+import time
+from page_waits import default_waiter
+
+MEASURE_SCRIPT = """
+const items = arguments[0] ? document.querySelectorAll(arguments[0]).length : 0;
+return [items, document.body.scrollHeight];
+"""
+
+SCROLL_SCRIPT = "window.scrollTo(0, document.body.scrollHeight);"
+
+
+class InfiniteScrollLoader:
+    """Scroll an infinite-scroll page until it stops growing or enough items are loaded"""
+
+    def __init__(self, item_selector=None, max_steps=50, target_count=None,
+                 step_timeout=4.0, poll_frequency=0.2, waiter=default_waiter):
+        self.item_selector = item_selector
+        self.max_steps = max_steps
+        self.target_count = target_count
+        self.step_timeout = step_timeout
+        self.poll_frequency = poll_frequency
+        self.waiter = waiter
+        self.added_per_step = []
+        self.item_count = 0
+        self.stop_reason = None
+
+    def measure(self, driver):
+        """Item count and document height in a single round trip"""
+        count, height = driver.execute_script(MEASURE_SCRIPT, self.item_selector)
+        return int(count or 0), int(height or 0)
+
+    def load(self, driver):
+        """Scroll step by step and return how many items each step added"""
+        self.added_per_step = []
+        count, height = self.measure(driver)
+        self.stop_reason = 'max_steps'
+
+        for step in range(self.max_steps):
+            if self.target_count and count >= self.target_count:
+                self.stop_reason = 'target_count'
+                break
+
+            driver.execute_script(SCROLL_SCRIPT)
+            started = time.monotonic()
+            new_count, new_height = count, height
+
+            # Poll until the page grows or the step times out
+            while time.monotonic() - started < self.step_timeout:
+                time.sleep(self.poll_frequency)
+                new_count, new_height = self.measure(driver)
+                if new_count > count or new_height > height:
+                    break
+
+            grew = new_count > count or new_height > height
+            if self.waiter:
+                self.waiter.histogram.record('scroll_step', time.monotonic() - started, grew)
+
+            self.added_per_step.append(new_count - count)
+            count, height = new_count, new_height
+            if not grew:
+                self.stop_reason = 'exhausted'
+                break
+
+        if self.target_count and count >= self.target_count:
+            self.stop_reason = 'target_count'
+        self.item_count = count
+        return self.added_per_step
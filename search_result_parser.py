@@ -0,0 +1,149 @@
+import re
+import urllib.parse
+from lxml import html
+from result_classifier import default_classifier
+
+PROFILE_SLUG_PATTERN = re.compile(r'linkedin\.com/in/([^/?]+)')
+
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+RESULT_CONTAINER_SELECTOR = '.entity-result, .search-result, [data-view-name="search-entity-result-universal-template"]'
+
+# XPath equivalent of RESULT_CONTAINER_SELECTOR, so lxml does not need cssselect
+RESULT_CONTAINER_XPATH = (
+    f"//*[{_has_class('entity-result')} or {_has_class('search-result')} "
+    f"or @data-view-name='search-entity-result-universal-template']"
+)
+
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'footer',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol',
+    'p', 'section', 'table', 'tr', 'ul'
+}
+
+HIDDEN_TAGS = {'script', 'style', 'noscript', 'template', 'svg'}
+
+
+def clean_profile_url(href, base_url='https://www.linkedin.com'):
+    """Turn any /in/ link into https://www.linkedin.com/in/<username>/"""
+    if not href:
+        return None
+    match = PROFILE_SLUG_PATTERN.search(urllib.parse.urljoin(base_url + '/', href))
+    if match:
+        return f"https://www.linkedin.com/in/{match.group(1)}/"
+    return None
+
+
+def element_lines(element):
+    """Visible text of an element split into lines, approximating WebElement.text"""
+    lines = []
+    current = []
+
+    def flush():
+        line = ' '.join(''.join(current).split())
+        if line:
+            lines.append(line)
+        current.clear()
+
+    def walk(node):
+        if not isinstance(node.tag, str) or node.tag in HIDDEN_TAGS:
+            return
+        classes = (node.get('class') or '').split()
+        if 'visually-hidden' in classes or node.get('hidden') is not None:
+            return
+
+        block = node.tag in BLOCK_TAGS
+        if block:
+            flush()
+        if node.tag == 'br':
+            flush()
+        if node.text:
+            current.append(node.text)
+        for child in node:
+            walk(child)
+            if child.tail:
+                current.append(child.tail)
+        if block:
+            flush()
+
+    walk(element)
+    flush()
+    return lines
+
+
+def is_cit_related(text):
+    """Check whether result text mentions Chennai Institute of Technology"""
+    return default_classifier.is_cit_related(text)
+
+
+def profile_from_lines(lines):
+    """Pick headline, name and location out of the lines of one search result"""
+    profile = default_classifier.classify(lines)
+    del profile['cit_related']
+    return profile
+
+
+def search_profile(result):
+    """Profile dict of a parsed result card, or None unless it is CIT-related and has a headline"""
+    if not result['cit_related']:
+        return None
+    profile = dict(result['profile'])
+    if 'headline' not in profile:
+        return None
+    profile['profile_url'] = result['profile_url'] or ""
+    return profile
+
+
+def page_card_keys(search_results):
+    """What identifies a result page: each card's URL, name, headline and location, in page order
+
+    LinkedIn serves the last page again when asked for one past the end, so
+    equal keys on consecutive pages mean the results are exhausted. Card
+    text is part of the key because cards without a URL all look alike.
+    """
+    return [
+        (result['profile_url'], *(result['profile'].get(field) for field in ('name', 'headline', 'location')))
+        for result in search_results
+    ]
+
+
+def profile_url_from_element(element):
+    """First /in/ link inside a parsed result element"""
+    for link in element.iterfind('.//a[@href]'):
+        href = link.get('href')
+        if href and '/in/' in href:
+            clean_url = clean_profile_url(href)
+            if clean_url:
+                return clean_url
+    return None
+
+
+def parse_search_results(page_source):
+    """Parse every search result card out of one page_source snapshot
+
+    Returns one dict per card, in page order, with the card's visible
+    lines, its text, the parsed profile fields and the clean profile URL
+    (or None when the card has no /in/ link).
+    """
+    if not page_source:
+        return []
+
+    document = html.fromstring(page_source)
+    results = []
+
+    for element in document.xpath(RESULT_CONTAINER_XPATH):
+        lines = element_lines(element)
+        # One classifier pass gives both the CIT flag and the profile fields
+        profile = default_classifier.classify(lines)
+        results.append({
+            'lines': lines,
+            'text': '\n'.join(lines),
+            'cit_related': profile.pop('cit_related'),
+            'profile': profile,
+            'profile_url': profile_url_from_element(element)
+        })
+
+    return results
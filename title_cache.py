@@ -0,0 +1,116 @@
+import collections
+import json
+import os
+import threading
+import time
+
+
+class TitleCache:
+    """Bounded LRU memoization of a pure function of one title string
+
+    The maxsize most recently used titles keep their result; the least
+    recently used one is dropped when a new title would go over. Misses are
+    timed, so report() can estimate the parsing time skipped as hits times
+    the mean cost of a miss (before the cache's own overhead). items()
+    and update() give the entries in LRU order (oldest first) for
+    save_caches() / load_caches(). Thread-safe.
+    """
+
+    def __init__(self, function, maxsize=100000, name=None):
+        self.function = function
+        self.maxsize = max(1, int(maxsize))
+        self.name = name or function.__name__
+        self.entries = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.miss_seconds = 0.0
+
+    def __call__(self, title):
+        with self.lock:
+            if title in self.entries:
+                self.entries.move_to_end(title)
+                self.hits += 1
+                return self.entries[title]
+
+        started = time.perf_counter()
+        value = self.function(title)
+        elapsed = time.perf_counter() - started
+
+        with self.lock:
+            self.misses += 1
+            self.miss_seconds += elapsed
+            self.entries[title] = value
+            self.entries.move_to_end(title)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return value
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.miss_seconds = 0.0
+
+    def items(self):
+        with self.lock:
+            return list(self.entries.items())
+
+    def update(self, items):
+        """Add (title, value) entries, oldest first, as items() returned them"""
+        with self.lock:
+            for title, value in items:
+                self.entries[title] = value
+                self.entries.move_to_end(title)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    @property
+    def hit_rate(self):
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    @property
+    def seconds_saved(self):
+        return self.hits * self.miss_seconds / self.misses if self.misses else 0.0
+
+    def report(self):
+        print(f"🧠 {self.name}: {self.hits} hits, {self.misses} misses ({self.hit_rate:.1%}), "
+              f"{len(self.entries)}/{self.maxsize} cached, ~{self.seconds_saved * 1000:.0f}ms of parsing skipped")
+
+
+def save_caches(path, caches):
+    """Write every cache of {key: TitleCache} to one JSON file, atomically"""
+    data = {'version': 1, 'caches': {key: cache.items() for key, cache in caches.items()}}
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+def load_caches(path, caches):
+    """Fill {key: TitleCache} from a file save_caches() wrote, returns the entries loaded
+
+    JSON turns tuples into lists, so list values come back as tuples.
+    A missing or unreadable file loads nothing.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return 0
+    if data.get('version') != 1:
+        return 0
+
+    loaded = 0
+    for key, items in data.get('caches', {}).items():
+        if key in caches:
+            caches[key].update(
+                (title, tuple(value) if isinstance(value, list) else value) for title, value in items
+            )
+            loaded += len(items)
+    return loaded